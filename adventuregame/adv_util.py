@@ -2,20 +2,40 @@
 Utility functions for adventuregame.
 """
 
+import json
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+
+from adventuregame import constants
+
 
 def fact_str_to_tuple(fact_string: str, value_delimiter_l: str = "(", value_separator: str = ","):
     """
     Split a string fact and return its values as a tuple.
+    Values are interned, so predicates and IDs shared by many facts are stored only once.
     """
-    first_split = fact_string.split(value_delimiter_l, 1)
-    fact_type = first_split[0]
-    if value_separator in first_split[1]:
-        values_split = first_split[1][:-1].split(value_separator, 1)
-        return fact_type, values_split[0], values_split[1]
+    fact_type, delimiter, values = fact_string.partition(value_delimiter_l)
+    if not delimiter:
+        raise ValueError(f"Malformed fact string: {fact_string}")
+    values = values[:-1]
+    intern = sys.intern
+    if value_separator in values:
+        first_value, _, second_value = values.partition(value_separator)
+        return intern(fact_type), intern(first_value), intern(second_value)
     else:
-        return fact_type, first_split[1][:-1]
+        return intern(fact_type), intern(values)
+
 
+def fact_strs_to_tuples(fact_strings: Iterable[str]) -> List[tuple]:
+    """
+    Split a batch of string facts with the default delimiters, e.g. a list of initial state facts.
+    """
+    return [fact_str_to_tuple(fact_string) for fact_string in fact_strings]
 
+
+@lru_cache(maxsize=4096)
 def fact_tuple_to_str(
     fact_tuple: tuple,
     value_delimiter_l: str = "(",
@@ -24,8 +44,87 @@ def fact_tuple_to_str(
 ):
     """
     Convert fact tuple to string version.
+    Memoized, as the same facts, e.g. achieved goals, are converted on every turn.
     """
     values = fact_tuple[1:]
     values_str = value_separator.join(values)
     fact_str = f"{fact_tuple[0]}{value_delimiter_l}{values_str}{value_delimiter_r}"
     return fact_str
+
+
+@lru_cache(maxsize=4096)
+def floor_id(room_id: str) -> str:
+    """
+    Get the ID of a room's floor entity, e.g. 'kitchen1' -> 'kitchen1floor1'.
+    Hash-consed: every call for the same room returns the same interned string.
+    """
+    return sys.intern(f"{room_id}{constants.FLOOR_ID_SUFFIX}")
+
+
+@lru_cache(maxsize=4096)
+def default_instance_id(type_name: str) -> str:
+    """
+    Get the ID of the default instance of an entity type, e.g. 'apple' -> 'apple1'.
+    Hash-consed: every call for the same type returns the same interned string.
+    """
+    return sys.intern(f"{type_name}{constants.DEFAULT_INSTANCE_SUFFIX}")
+
+
+@lru_cache(maxsize=None)
+def load_definition_file(definition_path: str) -> Dict[str, Any]:
+    """
+    Load a JSON definition file once per process, e.g. the adventure type or clingo template definitions.
+    The returned dict is shared between callers and must not be modified.
+    """
+    with open(definition_path, "r", encoding="utf-8") as definition_file:
+        return json.load(definition_file)
+
+
+# Prebuilt chat message templates; copying a small dict skips re-hashing the keys
+_USER_MESSAGE: Dict[str, str] = {
+    constants.KEY_MESSAGE_ROLE: constants.KEY_MESSAGE_ROLE_USER,
+    constants.KEY_MESSAGE_CONTENT: "",
+}
+_ASSISTANT_MESSAGE: Dict[str, str] = {
+    constants.KEY_MESSAGE_ROLE: constants.KEY_MESSAGE_ROLE_ASSISTANT,
+    constants.KEY_MESSAGE_CONTENT: "",
+}
+
+
+def user_message(content: str) -> Dict[str, str]:
+    """
+    Build a chat message dict with the user role.
+    """
+    message = _USER_MESSAGE.copy()
+    message[constants.KEY_MESSAGE_CONTENT] = content
+    return message
+
+
+def assistant_message(content: str) -> Dict[str, str]:
+    """
+    Build a chat message dict with the assistant role.
+    """
+    message = _ASSISTANT_MESSAGE.copy()
+    message[constants.KEY_MESSAGE_CONTENT] = content
+    return message
+
+
+# All prompt template placeholders as one alternation, for single-pass substitution
+_PLACEHOLDER_PATTERN = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (constants.TEMPLATE_PLACEHOLDER_GOAL, constants.TEMPLATE_PLACEHOLDER_NEW_WORDS),
+        )
+    )
+)
+
+
+def render_prompt(template: str, placeholder_values: Dict[str, str]) -> str:
+    """
+    Fill prompt template placeholders in one pass over the template.
+    Placeholders without a value in placeholder_values are left as they are.
+    """
+    return _PLACEHOLDER_PATTERN.sub(
+        lambda match: placeholder_values.get(match.group(0), match.group(0)), template
+    )
@@ -10,17 +10,48 @@ separation of concerns principles:
 
 Domain knowledge (actions, entities, rooms, adventure types) remains in
 resources/definitions/ where it belongs.
+
+Submodules are imported lazily (PEP 562): importing the package only loads
+the submodule that provides the name actually accessed.
 """
 
-from adventuregame.config.experiments import ExperimentConfig, get_experiment_config
-from adventuregame.config.messages import MessageTemplates, get_message_templates
-from adventuregame.config.runtime import RuntimeConfig, get_runtime_config
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from adventuregame.config.experiments import ExperimentConfig, get_experiment_config
+    from adventuregame.config.messages import MESSAGES, MessageTemplates, get_message_templates
+    from adventuregame.config.runtime import RUNTIME, RuntimeConfig, get_runtime_config
+
+# Re-exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "RuntimeConfig": "runtime",
+    "get_runtime_config": "runtime",
+    "RUNTIME": "runtime",
+    "ExperimentConfig": "experiments",
+    "get_experiment_config": "experiments",
+    "MessageTemplates": "messages",
+    "get_message_templates": "messages",
+    "MESSAGES": "messages",
+}
 
 __all__ = [
     "RuntimeConfig",
     "get_runtime_config",
+    "RUNTIME",
     "ExperimentConfig",
     "get_experiment_config",
     "MessageTemplates",
     "get_message_templates",
+    "MESSAGES",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache the name globally."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
@@ -7,9 +7,11 @@ code to gradually migrate from the old interface to the new type-safe interface.
 
 Usage:
     Old way (still works):
-        from config_loader import get_config
+        from config_loader import get_config, cfg
         config = get_config()
         value = config.messages["unknown_command"]
+        value = config.messages_ns.unknown_command  # attribute access, for hot paths
+        value = cfg("messages", "unknown_command")
 
     New way (recommended):
         from adventuregame.config import get_message_templates
@@ -18,13 +20,264 @@ Usage:
         value = templates.errors.unknown_command
 """
 
-from typing import Any, Dict, List, Optional
+import sys
+from pathlib import Path
+from typing import Any, Dict, Final, FrozenSet, NamedTuple, Pattern, Tuple
 
 from adventuregame import constants
 from adventuregame.config.experiments import ExperimentConfig, get_experiment_config
 from adventuregame.config.messages import MessageTemplates, get_message_templates
 from adventuregame.config.runtime import RuntimeConfig, get_runtime_config
 
+__all__ = [
+    "MessagesView",
+    "CompatConfigLoader",
+    "CONFIG",
+    "get_config",
+    "cfg",
+]
+
+
+def _intern_strings(mapping: Dict[str, str]) -> Dict[str, str]:
+    """Return a copy of a flat str-to-str dict with interned keys and values."""
+    return {sys.intern(key): sys.intern(value) for key, value in mapping.items()}
+
+
+class MessagesView(NamedTuple):
+    """Attribute-access view of the ``messages`` compat dict for hot call sites."""
+
+    default_custom_response: str
+    initial_response: str
+    room_description_template: str
+    multi_item_description: str
+    two_item_description: str
+    single_item_description: str
+    empty_inventory: str
+    inventory_description: str
+    exit_description_template: str
+    unknown_command: str
+    undefined_action: str
+    unknown_entity: str
+    cannot_take: str
+    cannot_put: str
+    no_need_open: str
+    cannot_close: str
+    unknown_item_type: str
+    already_in_inventory: str
+    cannot_take_from_inventory: str
+    not_in_room: str
+    cannot_do_that: str
+
+
+# Compat dicts derived purely from constants: built once at import and shared by
+# every loader instance as class attributes
+
+# Prompt template paths
+_PROMPT_TEMPLATES: Final[Dict[str, str]] = {
+    "basic": constants.PROMPT_TEMPLATE_BASIC,
+    "new_words": constants.PROMPT_TEMPLATE_NEW_WORDS,
+    "potion_brewing": constants.PROMPT_TEMPLATE_POTION_BREWING,
+    "plan": constants.PROMPT_TEMPLATE_PLAN,
+    "basic_invlimit": constants.PROMPT_TEMPLATE_BASIC_INVLIMIT,
+    "plan_invlimit": constants.PROMPT_TEMPLATE_PLAN_INVLIMIT,
+}
+
+# Definition file names
+_DEFINITION_FILES: Final[Dict[str, str]] = {
+    "adventure_types": constants.DEFINITION_FILE_ADVENTURE_TYPES,
+    "clingo_templates": constants.DEFINITION_FILE_CLINGO_TEMPLATES,
+    "invlimit_actions": constants.DEFINITION_FILE_INVLIMIT_ACTIONS,
+    "invlimit_domain": constants.DEFINITION_FILE_INVLIMIT_DOMAIN,
+}
+
+# Variant configurations
+_VARIANTS: Final[Dict[str, Any]] = {
+    "basic": constants.VARIANT_BASIC,
+    "plan": constants.VARIANT_PLAN,
+    "basic_preexplore": constants.VARIANT_BASIC_PREEXPLORE,
+    "plan_preexplore": constants.VARIANT_PLAN_PREEXPLORE,
+    "basic_invlimit": constants.VARIANT_BASIC_INVLIMIT,
+    "planning": constants.VARIANT_PLANNING,
+    "planning_invlimit": constants.VARIANT_PLANNING_INVLIMIT,
+    "default_variants": [constants.VARIANT_BASIC],
+}
+
+# Adventure type identifiers
+_ADVENTURE_TYPES: Final[Dict[str, str]] = _intern_strings(
+    {
+        "home_delivery": constants.ADVENTURE_HOME_DELIVERY,
+        "home_deliver_three": constants.ADVENTURE_HOME_DELIVER_THREE,
+        "home_deliver_two": constants.ADVENTURE_HOME_DELIVER_TWO,
+        "new_words": constants.ADVENTURE_NEW_WORDS,
+        "new_words_created": constants.ADVENTURE_NEW_WORDS_CREATED,
+        "new_words_replace_explanation": (constants.ADVENTURE_NEW_WORDS_REPLACE_EXPLANATION),
+        "new_words_replace_no_explanation": (constants.ADVENTURE_NEW_WORDS_REPLACE_NO_EXPLANATION),
+        "new_words_deliver": constants.ADVENTURE_NEW_WORDS_DELIVER,
+        "new_word_states": constants.ADVENTURE_NEW_WORD_STATES,
+        "potion": constants.ADVENTURE_POTION,
+        "potion_brewing": constants.ADVENTURE_POTION_BREWING,
+    }
+)
+
+# Action configurations
+_ACTIONS: Final[Dict[str, Any]] = {
+    "done": constants.ACTION_DONE,
+    "done_command": constants.ACTION_DONE_COMMAND,
+    "unknown": constants.ACTION_UNKNOWN,
+    "excluded_from_shuffle": constants.ACTIONS_EXCLUDED_FROM_SHUFFLE,
+    "object_manipulation_types": constants.OBJECT_MANIPULATION_ACTIONS,
+}
+
+# Entity configurations
+_ENTITIES: Final[Dict[str, Any]] = {
+    "player_id": constants.PLAYER_ID,
+    "inventory_id": constants.INVENTORY_ID,
+    "floor_id_suffix": constants.FLOOR_ID_SUFFIX,
+    "ceiling_id_suffix": constants.CEILING_ID_SUFFIX,
+    "default_instance_suffix": constants.DEFAULT_INSTANCE_SUFFIX,
+    "exempt_from_support": constants.ENTITIES_EXEMPT_FROM_SUPPORT,
+    "floor_type": constants.FLOOR_TYPE,
+}
+
+# Predicate definitions
+_PREDICATES: Final[Dict[str, Any]] = {
+    "mutable_states": constants.MUTABLE_STATE_PREDICATES,
+    "inventory_predicates": constants.INVENTORY_PREDICATES,
+    "text": constants.PREDICATE_TEXT,
+    "openable": constants.PREDICATE_OPENABLE,
+    "takeable": constants.PREDICATE_TAKEABLE,
+    "needs_support": constants.PREDICATE_NEEDS_SUPPORT,
+    "container": constants.PREDICATE_CONTAINER,
+    "support": constants.PREDICATE_SUPPORT,
+    "predicate_in": constants.PREDICATE_IN,
+    "predicate_on": constants.PREDICATE_ON,
+}
+
+# Dictionary key constants
+_KEYS: Final[Dict[str, str]] = _intern_strings(
+    {
+        "message_role": constants.KEY_MESSAGE_ROLE,
+        "message_content": constants.KEY_MESSAGE_CONTENT,
+        "message_role_user": constants.KEY_MESSAGE_ROLE_USER,
+        "message_role_assistant": constants.KEY_MESSAGE_ROLE_ASSISTANT,
+        "type_name": constants.KEY_TYPE_NAME,
+        "repr_str": constants.KEY_REPR_STR,
+        "pddl": constants.KEY_PDDL,
+        "pddl_param_mapping": constants.KEY_PDDL_PARAM_MAPPING,
+        "event_definitions": constants.KEY_EVENT_DEFINITIONS,
+        "entity_definitions": constants.KEY_ENTITY_DEFINITIONS,
+        "room_definitions": constants.KEY_ROOM_DEFINITIONS,
+        "action_definitions": constants.KEY_ACTION_DEFINITIONS,
+        "domain_definitions": constants.KEY_DOMAIN_DEFINITIONS,
+        "goal_state": constants.KEY_GOAL_STATE,
+        "optimal_commands": constants.KEY_OPTIMAL_COMMANDS,
+        "fail_type": constants.KEY_FAIL_TYPE,
+        "done_action": constants.KEY_DONE_ACTION,
+        "metadata": constants.KEY_METADATA,
+        "goal_states_achieved": constants.KEY_GOAL_STATES_ACHIEVED,
+        "turn_goal_score": constants.KEY_TURN_GOAL_SCORE,
+        "game_successfully_finished": constants.KEY_GAME_SUCCESSFULLY_FINISHED,
+    }
+)
+
+# Template placeholder strings
+_TEMPLATE_PLACEHOLDERS: Final[Dict[str, str]] = _intern_strings(
+    {
+        "goal": constants.TEMPLATE_PLACEHOLDER_GOAL,
+        "new_words_explanations": constants.TEMPLATE_PLACEHOLDER_NEW_WORDS,
+    }
+)
+
+# Event type identifiers
+_EVENT_TYPES: Final[Dict[str, str]] = _intern_strings(
+    {
+        "action_fail": constants.EVENT_ACTION_FAIL,
+        "action_info": constants.EVENT_ACTION_INFO,
+        "goal_status": constants.EVENT_GOAL_STATUS,
+        "hallucinated_finish": constants.EVENT_HALLUCINATED_FINISH,
+        "invalid_format": constants.EVENT_INVALID_FORMAT,
+        "adventure_finished": constants.EVENT_ADVENTURE_FINISHED,
+        "loop_detected": constants.EVENT_LOOP_DETECTED,
+        "turn_plan": constants.EVENT_TURN_PLAN,
+        "current_plan": constants.EVENT_CURRENT_PLAN,
+        "turn_limit_reached": constants.EVENT_TURN_LIMIT_REACHED,
+        "model_done": constants.EVENT_MODEL_DONE,
+        "game_result": constants.EVENT_GAME_RESULT,
+        "plan_followed": constants.EVENT_PLAN_FOLLOWED,
+    }
+)
+
+# Log key constants
+_LOG_KEYS: Final[Dict[str, str]] = _intern_strings(
+    {
+        "plan_length": constants.LOG_PLAN_LENGTH,
+        "plan_results": constants.LOG_PLAN_RESULTS,
+        "plan_command_success_ratio": constants.LOG_PLAN_COMMAND_SUCCESS_RATIO,
+        "turn_limit_loss": constants.LOG_TURN_LIMIT_LOSS,
+        "adventure_info": constants.LOG_ADVENTURE_INFO,
+    }
+)
+
+# Parse error type identifiers
+_PARSE_ERRORS: Final[Dict[str, str]] = _intern_strings(
+    {
+        "command_tag_missing": constants.PARSE_ERROR_COMMAND_TAG_MISSING,
+        "next_actions_missing": constants.PARSE_ERROR_NEXT_ACTIONS_MISSING,
+    }
+)
+
+# All action failure types, in scoring order
+_FAIL_TYPES: Final[Tuple[str, ...]] = constants.FAIL_TYPES
+_FAIL_TYPES_SET: Final[FrozenSet[str]] = constants.FAIL_TYPES_SET
+
+# Plan metrics to track
+_PLAN_METRICS: Final[Tuple[str, ...]] = constants.PLAN_METRICS
+
+# Hallucination indicator keywords
+_HALLUCINATION_KEYWORDS: Final[Tuple[str, ...]] = constants.HALLUCINATION_KEYWORDS
+_HALLUCINATION_PATTERN: Final[Pattern[str]] = constants.HALLUCINATION_PATTERN
+
+# Array index constants
+_ARRAY_INDICES: Final[Dict[str, int]] = {
+    "primary_model": constants.INDEX_PRIMARY_MODEL,
+    "split_result_check": constants.INDEX_SPLIT_RESULT_CHECK,
+    "plan_result_action_info": constants.INDEX_PLAN_RESULT_ACTION_INFO,
+    "plan_analysis_start_turn": constants.INDEX_PLAN_ANALYSIS_START_TURN,
+    "zero_index": constants.INDEX_ZERO,
+    "action_string_prefix_len": constants.INDEX_ACTION_STRING_PREFIX_LEN,
+    "action_string_suffix_len": constants.INDEX_ACTION_STRING_SUFFIX_LEN,
+}
+
+# Goal-related settings
+_GOAL_SETTINGS: Final[Dict[str, str]] = _intern_strings(
+    {
+        "potion_goal": constants.GOAL_POTION,
+        "potion_goal_description": constants.GOAL_POTION_DESCRIPTION,
+        "goal_delivery_prefix": constants.GOAL_DELIVERY_PREFIX,
+        "goal_state_prefix": constants.GOAL_STATE_PREFIX,
+        "goal_article": constants.GOAL_ARTICLE,
+    }
+)
+
+# Output formatting settings
+_OUTPUT_SETTINGS: Final[Dict[str, Any]] = {
+    "timestamp_format": constants.TIMESTAMP_FORMAT,
+    "output_filename_template": constants.OUTPUT_FILENAME_TEMPLATE,
+    "experiment_suffixes": {
+        "invlimit": constants.EXPERIMENT_SUFFIX_INVLIMIT,
+    },
+}
+
+# Initial count values
+_INITIAL_COUNTS: Final[Dict[str, int]] = {
+    "inventory_items": constants.COUNT_INITIAL_INVENTORY_ITEMS,
+    "iterator_value": constants.COUNT_INITIAL_ITERATOR_VALUE,
+}
+
+
+# Sentinel distinguishing "missing" from stored None values in get()
+_MISSING = object()
+
 
 class CompatConfigLoader:
     """
@@ -32,405 +285,252 @@ class CompatConfigLoader:
 
     This class provides the same property-based access as the old monolithic
     config system, but delegates to the new focused configuration modules.
+
+    All old-style accessors are plain attributes computed once, so reading e.g.
+    ``config.messages`` is a single attribute load. The attribute set is closed,
+    so it is declared in ``__slots__``. Constant-derived dicts are module-level
+    constants exposed as class attributes; dicts that need a JSON-backed config
+    are built on first access, one backing config at a time.
     """
 
+    __slots__ = (
+        "runtime",
+        "experiments",
+        "message_templates",
+        "paths",
+        "game_constants",
+        "delimiters",
+        "thresholds",
+        "scores",
+        "messages",
+        "messages_ns",
+        "parser_settings",
+        "clingo_settings",
+        "generation_settings",
+        "random_seeds",
+        "_grammar_files",
+        "_path_objects",
+        "_flat",
+    )
+
+    # Constant-derived compat dicts are shared class attributes
+    variants = _VARIANTS
+    adventure_types = _ADVENTURE_TYPES
+    actions = _ACTIONS
+    entities = _ENTITIES
+    predicates = _PREDICATES
+    keys = _KEYS
+    template_placeholders = _TEMPLATE_PLACEHOLDERS
+    event_types = _EVENT_TYPES
+    log_keys = _LOG_KEYS
+    parse_errors = _PARSE_ERRORS
+    fail_types = _FAIL_TYPES
+    fail_types_set = _FAIL_TYPES_SET
+    plan_metrics = _PLAN_METRICS
+    hallucination_keywords = _HALLUCINATION_KEYWORDS
+    hallucination_pattern = _HALLUCINATION_PATTERN
+    array_indices = _ARRAY_INDICES
+    goal_settings = _GOAL_SETTINGS
+    output_settings = _OUTPUT_SETTINGS
+    initial_counts = _INITIAL_COUNTS
+
     def __init__(self) -> None:
         """Initialize the compatibility config loader."""
-        # Lazy-load the new configs
-        self._runtime: Optional[RuntimeConfig] = None
-        self._experiments: Optional[ExperimentConfig] = None
-        self._messages: Optional[MessageTemplates] = None
-
-    @property
-    def runtime(self) -> RuntimeConfig:
-        """Get runtime config (lazy loaded)."""
-        if self._runtime is None:
-            self._runtime = get_runtime_config()
-        return self._runtime
-
-    @property
-    def experiments(self) -> ExperimentConfig:
-        """Get experiment config (lazy loaded)."""
-        if self._experiments is None:
-            self._experiments = get_experiment_config()
-        return self._experiments
-
-    @property
-    def message_templates(self) -> MessageTemplates:
-        """Get message templates (lazy loaded)."""
-        if self._messages is None:
-            self._messages = get_message_templates()
-        return self._messages
-
-    # Old property accessors that delegate to new system
-
-    @property
-    def paths(self) -> Dict[str, Any]:
-        """Get path configurations (compatibility)."""
+        # Resolved get() paths, keyed by the full key tuple
+        self._flat: Dict[Tuple[str, ...], Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Build a deferred compat attribute on first access (unset slots land here)."""
+        builder = self._DEFERRED_BUILDERS.get(name)
+        if builder is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        builder(self)
+        return getattr(self, name)
+
+    def _build_runtime(self) -> None:
+        """Load the runtime config and materialize the compat dicts read from it."""
+        self.runtime: RuntimeConfig = get_runtime_config()
         rt = self.runtime
-        return {
-            "game_module_path": str(rt.paths.game_module_path),
-            "resources_dir": str(rt.paths.resources_dir),
-            "definitions_dir": str(rt.paths.definitions_dir),
-            "instances_dir": str(rt.paths.instances_dir),
-            "grammar_files": {
-                "pddl_actions": rt.paths.grammar_files.pddl_actions,
-                "pddl_domain": rt.paths.grammar_files.pddl_domain,
-                "pddl_events": rt.paths.grammar_files.pddl_events,
-                "grammar_core": rt.paths.grammar_files.grammar_core,
-            },
-            "prompt_templates": {
-                "basic": constants.PROMPT_TEMPLATE_BASIC,
-                "new_words": constants.PROMPT_TEMPLATE_NEW_WORDS,
-                "potion_brewing": constants.PROMPT_TEMPLATE_POTION_BREWING,
-                "plan": constants.PROMPT_TEMPLATE_PLAN,
-                "basic_invlimit": constants.PROMPT_TEMPLATE_BASIC_INVLIMIT,
-                "plan_invlimit": constants.PROMPT_TEMPLATE_PLAN_INVLIMIT,
-            },
-            "definition_files": {
-                "adventure_types": constants.DEFINITION_FILE_ADVENTURE_TYPES,
-                "clingo_templates": constants.DEFINITION_FILE_CLINGO_TEMPLATES,
-                "invlimit_actions": constants.DEFINITION_FILE_INVLIMIT_ACTIONS,
-                "invlimit_domain": constants.DEFINITION_FILE_INVLIMIT_DOMAIN,
-            },
-        }
-
-    @property
-    def game_constants(self) -> Dict[str, Any]:
-        """Get game constants (compatibility)."""
-        rt = self.runtime
-        return {
-            "game_name": rt.game.name,
-            "game_description": rt.game.description,
-            "command_prefix": rt.game.command_prefix,
-            "command_prefix_with_space": rt.game.command_prefix_with_space,
-        }
 
-    @property
-    def variants(self) -> Dict[str, Any]:
-        """Get variant configurations (compatibility)."""
-        return {
-            "basic": constants.VARIANT_BASIC,
-            "plan": constants.VARIANT_PLAN,
-            "basic_preexplore": constants.VARIANT_BASIC_PREEXPLORE,
-            "plan_preexplore": constants.VARIANT_PLAN_PREEXPLORE,
-            "basic_invlimit": constants.VARIANT_BASIC_INVLIMIT,
-            "planning": constants.VARIANT_PLANNING,
-            "planning_invlimit": constants.VARIANT_PLANNING_INVLIMIT,
-            "default_variants": [constants.VARIANT_BASIC],
+        # Grammar file names
+        self._grammar_files: Dict[str, str] = {
+            "pddl_actions": rt.paths.grammar_files.pddl_actions,
+            "pddl_domain": rt.paths.grammar_files.pddl_domain,
+            "pddl_events": rt.paths.grammar_files.pddl_events,
+            "grammar_core": rt.paths.grammar_files.grammar_core,
         }
 
-    @property
-    def adventure_types(self) -> Dict[str, str]:
-        """Get adventure type identifiers (compatibility)."""
-        return {
-            "home_delivery": constants.ADVENTURE_HOME_DELIVERY,
-            "home_deliver_three": constants.ADVENTURE_HOME_DELIVER_THREE,
-            "home_deliver_two": constants.ADVENTURE_HOME_DELIVER_TWO,
-            "new_words": constants.ADVENTURE_NEW_WORDS,
-            "new_words_created": constants.ADVENTURE_NEW_WORDS_CREATED,
-            "new_words_replace_explanation": (constants.ADVENTURE_NEW_WORDS_REPLACE_EXPLANATION),
-            "new_words_replace_no_explanation": (
-                constants.ADVENTURE_NEW_WORDS_REPLACE_NO_EXPLANATION
-            ),
-            "new_words_deliver": constants.ADVENTURE_NEW_WORDS_DELIVER,
-            "new_word_states": constants.ADVENTURE_NEW_WORD_STATES,
-            "potion": constants.ADVENTURE_POTION,
-            "potion_brewing": constants.ADVENTURE_POTION_BREWING,
+        # Path configurations; the nested dicts are shared by reference, not rebuilt
+        self.paths: Dict[str, Any] = {
+            "game_module_path": rt.paths.game_module_path_str,
+            "resources_dir": rt.paths.resources_dir_str,
+            "definitions_dir": rt.paths.definitions_dir_str,
+            "instances_dir": rt.paths.instances_dir_str,
+            "grammar_files": self._grammar_files,
+            "prompt_templates": _PROMPT_TEMPLATES,
+            "definition_files": _DEFINITION_FILES,
         }
 
-    @property
-    def actions(self) -> Dict[str, Any]:
-        """Get action configurations (compatibility)."""
-        return {
-            "done": constants.ACTION_DONE,
-            "done_command": constants.ACTION_DONE_COMMAND,
-            "unknown": constants.ACTION_UNKNOWN,
-            "excluded_from_shuffle": constants.ACTIONS_EXCLUDED_FROM_SHUFFLE,
-            "object_manipulation_types": constants.OBJECT_MANIPULATION_ACTIONS,
+        # Path objects for the same directories, shared from the runtime config
+        self._path_objects: Dict[str, Path] = {
+            "game_module_path": rt.paths.game_module_path,
+            "resources_dir": rt.paths.resources_dir,
+            "definitions_dir": rt.paths.definitions_dir,
+            "instances_dir": rt.paths.instances_dir,
         }
 
-    @property
-    def entities(self) -> Dict[str, Any]:
-        """Get entity configurations (compatibility)."""
-        return {
-            "player_id": constants.PLAYER_ID,
-            "inventory_id": constants.INVENTORY_ID,
-            "floor_id_suffix": constants.FLOOR_ID_SUFFIX,
-            "ceiling_id_suffix": constants.CEILING_ID_SUFFIX,
-            "default_instance_suffix": constants.DEFAULT_INSTANCE_SUFFIX,
-            "exempt_from_support": constants.ENTITIES_EXEMPT_FROM_SUPPORT,
-            "floor_type": constants.FLOOR_TYPE,
-        }
-
-    @property
-    def predicates(self) -> Dict[str, Any]:
-        """Get predicate definitions (compatibility)."""
-        return {
-            "mutable_states": constants.MUTABLE_STATE_PREDICATES,
-            "inventory_predicates": constants.INVENTORY_PREDICATES,
-            "text": constants.PREDICATE_TEXT,
-            "openable": constants.PREDICATE_OPENABLE,
-            "takeable": constants.PREDICATE_TAKEABLE,
-            "needs_support": constants.PREDICATE_NEEDS_SUPPORT,
-            "container": constants.PREDICATE_CONTAINER,
-            "support": constants.PREDICATE_SUPPORT,
-            "predicate_in": constants.PREDICATE_IN,
-            "predicate_on": constants.PREDICATE_ON,
-        }
-
-    @property
-    def keys(self) -> Dict[str, str]:
-        """Get dictionary key constants (compatibility)."""
-        return {
-            "message_role": constants.KEY_MESSAGE_ROLE,
-            "message_content": constants.KEY_MESSAGE_CONTENT,
-            "message_role_user": constants.KEY_MESSAGE_ROLE_USER,
-            "message_role_assistant": constants.KEY_MESSAGE_ROLE_ASSISTANT,
-            "type_name": constants.KEY_TYPE_NAME,
-            "repr_str": constants.KEY_REPR_STR,
-            "pddl": constants.KEY_PDDL,
-            "pddl_param_mapping": constants.KEY_PDDL_PARAM_MAPPING,
-            "event_definitions": constants.KEY_EVENT_DEFINITIONS,
-            "entity_definitions": constants.KEY_ENTITY_DEFINITIONS,
-            "room_definitions": constants.KEY_ROOM_DEFINITIONS,
-            "action_definitions": constants.KEY_ACTION_DEFINITIONS,
-            "domain_definitions": constants.KEY_DOMAIN_DEFINITIONS,
-            "goal_state": constants.KEY_GOAL_STATE,
-            "optimal_commands": constants.KEY_OPTIMAL_COMMANDS,
-            "fail_type": constants.KEY_FAIL_TYPE,
-            "done_action": constants.KEY_DONE_ACTION,
-            "metadata": constants.KEY_METADATA,
-            "goal_states_achieved": constants.KEY_GOAL_STATES_ACHIEVED,
-            "turn_goal_score": constants.KEY_TURN_GOAL_SCORE,
-            "game_successfully_finished": constants.KEY_GAME_SUCCESSFULLY_FINISHED,
+        # Game constants
+        self.game_constants: Dict[str, Any] = {
+            "game_name": rt.game.name,
+            "game_description": rt.game.description,
+            "command_prefix": rt.game.command_prefix,
+            "command_prefix_with_space": rt.game.command_prefix_with_space,
         }
 
-    @property
-    def delimiters(self) -> Dict[str, str]:
-        """Get delimiter strings (compatibility)."""
+        # Parser configuration
+        self.parser_settings: Dict[str, str] = _intern_strings(
+            {
+                "action_grammar_start_rule": rt.parser.action_start_rule,
+                "domain_grammar_start_rule": rt.parser.domain_start_rule,
+                "event_grammar_start_rule": rt.parser.event_start_rule,
+            }
+        )
+
+    def _build_messages(self) -> None:
+        """Load the message templates and materialize the compat dicts read from them."""
+        self.message_templates: MessageTemplates = get_message_templates()
         msg = self.message_templates
-        return {
-            "plan_delimiter": msg.delimiters.plan_delimiter,
-            "plan_separator": msg.delimiters.plan_separator,
-            "list_separator": msg.delimiters.list_separator,
-            "list_last_conjunction": msg.delimiters.list_last_conjunction,
-        }
-
-    @property
-    def template_placeholders(self) -> Dict[str, str]:
-        """Get template placeholder strings (compatibility)."""
-        return {
-            "goal": constants.TEMPLATE_PLACEHOLDER_GOAL,
-            "new_words_explanations": constants.TEMPLATE_PLACEHOLDER_NEW_WORDS,
-        }
-
-    @property
-    def event_types(self) -> Dict[str, str]:
-        """Get event type identifiers (compatibility)."""
-        return {
-            "action_fail": constants.EVENT_ACTION_FAIL,
-            "action_info": constants.EVENT_ACTION_INFO,
-            "goal_status": constants.EVENT_GOAL_STATUS,
-            "hallucinated_finish": constants.EVENT_HALLUCINATED_FINISH,
-            "invalid_format": constants.EVENT_INVALID_FORMAT,
-            "adventure_finished": constants.EVENT_ADVENTURE_FINISHED,
-            "loop_detected": constants.EVENT_LOOP_DETECTED,
-            "turn_plan": constants.EVENT_TURN_PLAN,
-            "current_plan": constants.EVENT_CURRENT_PLAN,
-            "turn_limit_reached": constants.EVENT_TURN_LIMIT_REACHED,
-            "model_done": constants.EVENT_MODEL_DONE,
-            "game_result": constants.EVENT_GAME_RESULT,
-            "plan_followed": constants.EVENT_PLAN_FOLLOWED,
-        }
-
-    @property
-    def log_keys(self) -> Dict[str, str]:
-        """Get log key constants (compatibility)."""
-        return {
-            "plan_length": constants.LOG_PLAN_LENGTH,
-            "plan_results": constants.LOG_PLAN_RESULTS,
-            "plan_command_success_ratio": constants.LOG_PLAN_COMMAND_SUCCESS_RATIO,
-            "turn_limit_loss": constants.LOG_TURN_LIMIT_LOSS,
-            "adventure_info": constants.LOG_ADVENTURE_INFO,
-        }
-
-    @property
-    def parse_errors(self) -> Dict[str, str]:
-        """Get parse error type identifiers (compatibility)."""
-        return {
-            "command_tag_missing": constants.PARSE_ERROR_COMMAND_TAG_MISSING,
-            "next_actions_missing": constants.PARSE_ERROR_NEXT_ACTIONS_MISSING,
-        }
-
-    @property
-    def fail_types(self) -> List[str]:
-        """Get list of all action failure types (compatibility)."""
-        return constants.FAIL_TYPES
-
-    @property
-    def plan_metrics(self) -> List[str]:
-        """Get list of plan metrics to track (compatibility)."""
-        return constants.PLAN_METRICS
 
-    @property
-    def hallucination_keywords(self) -> List[str]:
-        """Get list of hallucination indicator keywords (compatibility)."""
-        return constants.HALLUCINATION_KEYWORDS
-
-    @property
-    def thresholds(self) -> Dict[str, Any]:
-        """Get threshold values (compatibility)."""
+        # Delimiter strings
+        self.delimiters: Dict[str, str] = _intern_strings(
+            {
+                "plan_delimiter": msg.delimiters.plan_delimiter,
+                "plan_separator": msg.delimiters.plan_separator,
+                "list_separator": msg.delimiters.list_separator,
+                "list_last_conjunction": msg.delimiters.list_last_conjunction,
+            }
+        )
+
+        # User-facing message templates
+        self.messages: Dict[str, str] = _intern_strings(
+            {
+                "default_custom_response": msg.initial.default_custom_response,
+                "initial_response": msg.initial.initial_response,
+                "room_description_template": msg.descriptions.room_template,
+                "multi_item_description": msg.descriptions.multi_item,
+                "two_item_description": msg.descriptions.two_items,
+                "single_item_description": msg.descriptions.single_item,
+                "empty_inventory": msg.inventory.empty,
+                "inventory_description": msg.inventory.description,
+                "exit_description_template": msg.descriptions.exit_template,
+                "unknown_command": msg.errors.unknown_command,
+                "undefined_action": msg.errors.undefined_action,
+                "unknown_entity": msg.errors.unknown_entity,
+                "cannot_take": msg.errors.cannot_take,
+                "cannot_put": msg.errors.cannot_put,
+                "no_need_open": msg.errors.no_need_open,
+                "cannot_close": msg.errors.cannot_close,
+                "unknown_item_type": msg.errors.unknown_item_type,
+                "already_in_inventory": msg.errors.already_in_inventory,
+                "cannot_take_from_inventory": msg.errors.cannot_take_from_inventory,
+                "not_in_room": msg.errors.not_in_room,
+                "cannot_do_that": msg.errors.cannot_do_that,
+            }
+        )
+        self.messages_ns: MessagesView = MessagesView(**self.messages)
+
+    def _build_experiments(self) -> None:
+        """Load the experiment config and materialize the compat dicts read from it."""
+        c = constants
+        self.experiments: ExperimentConfig = get_experiment_config()
         exp = self.experiments
-        return {
+
+        # Threshold values
+        self.thresholds: Dict[str, Any] = {
             "loop_detection": exp.thresholds.loop_detection,
             "min_plan_history": exp.thresholds.min_plan_history,
             "bad_plan_viability": exp.thresholds.bad_plan_viability,
             "exploration_history": exp.thresholds.exploration_history,
             "goal_count_min": exp.thresholds.goal_count_min,
-            "predicate_arg_length": constants.PREDICATE_ARG_LENGTHS,
-            "room_exit_counts": constants.ROOM_EXIT_COUNTS,
-            "inventory_counts": constants.INVENTORY_COUNTS,
-            "container_content_counts": constants.CONTAINER_CONTENT_COUNTS,
-            "supported_entity_counts": constants.SUPPORTED_ENTITY_COUNTS,
-            "fact_tuple_length": constants.FACT_TUPLE_LENGTH,
-            "entity_replacement_threshold": constants.ENTITY_REPLACEMENT_THRESHOLD,
+            "predicate_arg_length": c.PREDICATE_ARG_LENGTHS,
+            "room_exit_counts": c.ROOM_EXIT_COUNTS,
+            "inventory_counts": c.INVENTORY_COUNTS,
+            "container_content_counts": c.CONTAINER_CONTENT_COUNTS,
+            "supported_entity_counts": c.SUPPORTED_ENTITY_COUNTS,
+            "fact_tuple_length": c.FACT_TUPLE_LENGTH,
+            "entity_replacement_threshold": c.ENTITY_REPLACEMENT_THRESHOLD,
         }
 
-    @property
-    def array_indices(self) -> Dict[str, int]:
-        """Get array index constants (compatibility)."""
-        return {
-            "primary_model": constants.INDEX_PRIMARY_MODEL,
-            "split_result_check": constants.INDEX_SPLIT_RESULT_CHECK,
-            "plan_result_action_info": constants.INDEX_PLAN_RESULT_ACTION_INFO,
-            "plan_analysis_start_turn": constants.INDEX_PLAN_ANALYSIS_START_TURN,
-            "zero_index": constants.INDEX_ZERO,
-            "action_string_prefix_len": constants.INDEX_ACTION_STRING_PREFIX_LEN,
-            "action_string_suffix_len": constants.INDEX_ACTION_STRING_SUFFIX_LEN,
-        }
-
-    @property
-    def scores(self) -> Dict[str, int]:
-        """Get scoring values (compatibility)."""
-        exp = self.experiments
-        return {
+        # Scoring values
+        self.scores: Dict[str, int] = {
             "success": exp.scoring.success,
             "failure": exp.scoring.failure,
         }
 
-    @property
-    def messages(self) -> Dict[str, str]:
-        """Get user-facing message templates (compatibility)."""
-        msg = self.message_templates
-        return {
-            "default_custom_response": msg.initial.default_custom_response,
-            "initial_response": msg.initial.initial_response,
-            "room_description_template": msg.descriptions.room_template,
-            "multi_item_description": msg.descriptions.multi_item,
-            "two_item_description": msg.descriptions.two_items,
-            "single_item_description": msg.descriptions.single_item,
-            "empty_inventory": msg.inventory.empty,
-            "inventory_description": msg.inventory.description,
-            "exit_description_template": msg.descriptions.exit_template,
-            "unknown_command": msg.errors.unknown_command,
-            "undefined_action": msg.errors.undefined_action,
-            "unknown_entity": msg.errors.unknown_entity,
-            "cannot_take": msg.errors.cannot_take,
-            "cannot_put": msg.errors.cannot_put,
-            "no_need_open": msg.errors.no_need_open,
-            "cannot_close": msg.errors.cannot_close,
-            "unknown_item_type": msg.errors.unknown_item_type,
-            "already_in_inventory": msg.errors.already_in_inventory,
-            "cannot_take_from_inventory": msg.errors.cannot_take_from_inventory,
-            "not_in_room": msg.errors.not_in_room,
-            "cannot_do_that": msg.errors.cannot_do_that,
-        }
-
-    @property
-    def parser_settings(self) -> Dict[str, str]:
-        """Get parser configuration (compatibility)."""
-        rt = self.runtime
-        return {
-            "action_grammar_start_rule": rt.parser.action_start_rule,
-            "domain_grammar_start_rule": rt.parser.domain_start_rule,
-            "event_grammar_start_rule": rt.parser.event_start_rule,
+        # Random seed configurations
+        self.random_seeds: Dict[str, int] = {
+            "default": exp.random_seed,
+            "max_seed": exp.max_random_seed,
         }
 
-    @property
-    def clingo_settings(self) -> Dict[str, Any]:
-        """Get Clingo solver settings (compatibility)."""
-        exp = self.experiments
-        return {
-            "control_all_models": exp.clingo.control_all_models,
-            "status_sat": exp.clingo.status_sat,
-            "status_unsat": exp.clingo.status_unsat,
-            "picking_strategies": exp.clingo.picking_strategies,
-            "default_layout_generation_limit": exp.clingo.default_layout_generation_limit,
-            "default_initial_states_per_layout": exp.clingo.default_initial_states_per_layout,
-            "default_initial_state_limit": exp.clingo.default_initial_state_limit,
-            "default_adventures_per_initial_state": exp.clingo.default_adventures_per_initial_state,
-            "default_target_adventure_count": exp.clingo.default_target_adventure_count,
-            "add_floors_default": exp.clingo.add_floors_default,
-            "pair_exits_default": exp.clingo.pair_exits_default,
+    def _build_clingo_settings(self) -> None:
+        """Materialize the clingo compat dict; only instance generation reads it."""
+        clingo = self.experiments.clingo
+        self.clingo_settings: Dict[str, Any] = {
+            "control_all_models": clingo.control_all_models,
+            "status_sat": clingo.status_sat,
+            "status_unsat": clingo.status_unsat,
+            "picking_strategies": clingo.picking_strategies,
+            "default_layout_generation_limit": clingo.default_layout_generation_limit,
+            "default_initial_states_per_layout": clingo.default_initial_states_per_layout,
+            "default_initial_state_limit": clingo.default_initial_state_limit,
+            "default_adventures_per_initial_state": clingo.default_adventures_per_initial_state,
+            "default_target_adventure_count": clingo.default_target_adventure_count,
+            "add_floors_default": clingo.add_floors_default,
+            "pair_exits_default": clingo.pair_exits_default,
         }
 
-    @property
-    def generation_settings(self) -> Dict[str, Any]:
-        """Get instance generation settings (compatibility)."""
-        exp = self.experiments
-        return {
-            "definition_methods": exp.generation.definition_methods,
-            "adjective_configs": exp.generation.adjective_configs,
-            "difficulty_levels": exp.generation.difficulty_levels,
+    def _build_generation_settings(self) -> None:
+        """Materialize the generation compat dict; only instance generation reads it."""
+        gen = self.experiments.generation
+        self.generation_settings: Dict[str, Any] = {
+            "definition_methods": gen.definition_methods,
+            "adjective_configs": gen.adjective_configs,
+            "difficulty_levels": gen.difficulty_levels,
             "task_types": {"deliver": "deliver"},
             "default_raw_adventures_files": ["generated_potion_brewing_adventures"],
         }
 
-    @property
-    def goal_settings(self) -> Dict[str, str]:
-        """Get goal-related settings (compatibility)."""
-        return {
-            "potion_goal": constants.GOAL_POTION,
-            "potion_goal_description": constants.GOAL_POTION_DESCRIPTION,
-            "goal_delivery_prefix": constants.GOAL_DELIVERY_PREFIX,
-            "goal_state_prefix": constants.GOAL_STATE_PREFIX,
-            "goal_article": constants.GOAL_ARTICLE,
-        }
-
-    @property
-    def output_settings(self) -> Dict[str, Any]:
-        """Get output formatting settings (compatibility)."""
-        return {
-            "timestamp_format": constants.TIMESTAMP_FORMAT,
-            "output_filename_template": constants.OUTPUT_FILENAME_TEMPLATE,
-            "experiment_suffixes": {
-                "invlimit": constants.EXPERIMENT_SUFFIX_INVLIMIT,
-            },
-        }
-
-    @property
-    def random_seeds(self) -> Dict[str, int]:
-        """Get random seed configurations (compatibility)."""
-        exp = self.experiments
-        return {
-            "default": exp.random_seed,
-            "max_seed": exp.max_random_seed,
-        }
-
-    @property
-    def initial_counts(self) -> Dict[str, int]:
-        """Get initial count values (compatibility)."""
-        return {
-            "inventory_items": constants.COUNT_INITIAL_INVENTORY_ITEMS,
-            "iterator_value": constants.COUNT_INITIAL_ITERATOR_VALUE,
-        }
+    # Attributes built on first access, mapped to the builder function that sets
+    # them. Each builder reads one backing config, so e.g. reading ``messages``
+    # never parses experiments.json. The clingo and generation sections, used only
+    # by instance generation, get their own builders so game runs never build them.
+    _DEFERRED_BUILDERS = {
+        "runtime": _build_runtime,
+        "paths": _build_runtime,
+        "_grammar_files": _build_runtime,
+        "_path_objects": _build_runtime,
+        "game_constants": _build_runtime,
+        "parser_settings": _build_runtime,
+        "message_templates": _build_messages,
+        "delimiters": _build_messages,
+        "messages": _build_messages,
+        "messages_ns": _build_messages,
+        "experiments": _build_experiments,
+        "thresholds": _build_experiments,
+        "scores": _build_experiments,
+        "clingo_settings": _build_clingo_settings,
+        "generation_settings": _build_generation_settings,
+        "random_seeds": _build_experiments,
+    }
 
     def get(self, *keys: str, default: Any = None) -> Any:
         """
         Get a configuration value by path (compatibility method).
 
         This provides the old get() interface for backward compatibility.
+        Resolved paths are recorded in a flat index, so repeating a lookup is a
+        single dict probe on the key tuple.
 
         Args:
             *keys: Nested keys to traverse
@@ -439,20 +539,53 @@ class CompatConfigLoader:
         Returns:
             The configuration value or default
         """
-        # Navigate through properties
-        current: Any = self
-        for key in keys:
-            if hasattr(current, key):
-                current = getattr(current, key)
-            elif isinstance(current, dict) and key in current:
+        value = self._flat.get(keys, _MISSING)
+        if value is not _MISSING:
+            return value
+        if not keys:
+            return self
+        # the first key names a compat attribute, the rest index into its value
+        current: Any = getattr(self, keys[0], _MISSING)
+        if current is _MISSING:
+            return default
+        for key in keys[1:]:
+            # EAFP: subscript directly, no isinstance or membership test on the hot path
+            try:
                 current = current[key]
-            else:
+            except (KeyError, IndexError):
                 return default
+            except TypeError:
+                # not a mapping: typed config objects are traversed by attribute
+                current = getattr(current, key, _MISSING)
+                if current is _MISSING:
+                    return default
+        self._flat[keys] = current
         return current
 
+    def path(self, key: str) -> Path:
+        """
+        Get a configured directory as a Path object.
+
+        ``paths`` holds plain strings for string formatting; this returns the Path
+        objects the runtime config already built, so callers needing a Path don't
+        construct one per access.
 
-# Global singleton instance
-_compat_config_instance: Optional[CompatConfigLoader] = None
+        Args:
+            key: Directory key, e.g. 'resources_dir'
+
+        Returns:
+            The directory path
+
+        Raises:
+            KeyError: If key is not a configured directory
+        """
+        return self._path_objects[key]
+
+
+# Global singleton instance; construction is free, the JSON-backed configs are
+# loaded on first access. Hot code can import CONFIG directly instead of calling
+# get_config().
+CONFIG: Final[CompatConfigLoader] = CompatConfigLoader()
 
 
 def get_config() -> CompatConfigLoader:
@@ -470,7 +603,25 @@ def get_config() -> CompatConfigLoader:
         >>> print(config.game_constants["command_prefix"])
         >
     """
-    global _compat_config_instance
-    if _compat_config_instance is None:
-        _compat_config_instance = CompatConfigLoader()
-    return _compat_config_instance
+    return CONFIG
+
+
+def cfg(*keys: str, default: Any = None) -> Any:
+    """
+    Quick access to a configuration value (old config_loader shorthand).
+
+    Repeated lookups are already memoized by the global instance's flat index,
+    so this adds no cache of its own and accepts unhashable defaults.
+
+    Args:
+        *keys: Nested keys to traverse
+        default: Default value if key not found
+
+    Returns:
+        The configuration value or default
+
+    Example:
+        >>> cfg("paths", "resources_dir")
+        'resources'
+    """
+    return CONFIG.get(*keys, default=default)
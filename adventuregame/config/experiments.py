@@ -9,16 +9,36 @@ modify when running experiments:
 - Scoring values
 - Clingo solver settings
 - Generation parameters
+
+The small flat records (Thresholds, TurnLimits, Scoring) are NamedTuples, so
+their fields are read by tuple index; the larger sections stay dataclasses.
 """
 
 import json
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
 
+__all__ = [
+    "Thresholds",
+    "TurnLimits",
+    "Scoring",
+    "ClingoConfig",
+    "GenerationConfig",
+    "ExperimentConfig",
+    "get_experiment_config",
+]
 
-@dataclass(frozen=True)
-class Thresholds:
+
+def _read_only_interned(mapping: Dict[str, str]) -> Mapping[str, str]:
+    """Return a read-only view of a JSON str-to-str dict with interned keys and values."""
+    return MappingProxyType({sys.intern(key): sys.intern(value) for key, value in mapping.items()})
+
+
+class Thresholds(NamedTuple):
     """Threshold values for game mechanics."""
 
     loop_detection: int
@@ -28,16 +48,14 @@ class Thresholds:
     goal_count_min: int
 
 
-@dataclass(frozen=True)
-class TurnLimits:
+class TurnLimits(NamedTuple):
     """Turn limit configuration."""
 
     optimal_solver: int
     benchmark_default: int
 
 
-@dataclass(frozen=True)
-class Scoring:
+class Scoring(NamedTuple):
     """Scoring values."""
 
     success: int
@@ -48,10 +66,10 @@ class Scoring:
 class ClingoConfig:
     """Clingo solver configuration."""
 
-    control_all_models: List[str]
+    control_all_models: Tuple[str, ...]
     status_sat: str
     status_unsat: str
-    picking_strategies: Dict[str, str]
+    picking_strategies: Mapping[str, str]
     default_layout_generation_limit: int
     default_initial_states_per_layout: int
     default_initial_state_limit: int
@@ -65,9 +83,9 @@ class ClingoConfig:
 class GenerationConfig:
     """Instance generation configuration."""
 
-    definition_methods: Dict[str, str]
-    adjective_configs: Dict[str, str]
-    difficulty_levels: Dict[str, str]
+    definition_methods: Mapping[str, str]
+    adjective_configs: Mapping[str, str]
+    difficulty_levels: Mapping[str, str]
 
 
 @dataclass(frozen=True)
@@ -92,6 +110,9 @@ class ExperimentConfig:
         """
         Load experiment configuration from JSON file.
 
+        Each file is parsed once; repeated loads of the same path return the
+        cached instance.
+
         Args:
             config_path: Path to experiments.json. If None, uses default location.
 
@@ -105,65 +126,42 @@ class ExperimentConfig:
         if config_path is None:
             config_path = Path(__file__).parent / "experiments.json"
 
-        try:
-            with open(config_path) as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Experiment config not found: {config_path}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in {config_path}: {e}")
-
-        # Parse thresholds
-        thresholds_data = data["thresholds"]
-        thresholds = Thresholds(
-            loop_detection=thresholds_data["loop_detection"],
-            min_plan_history=thresholds_data["min_plan_history"],
-            bad_plan_viability=thresholds_data["bad_plan_viability"],
-            exploration_history=thresholds_data["exploration_history"],
-            goal_count_min=thresholds_data["goal_count_min"],
-        )
+        return _load_experiment_config(cls, str(Path(config_path).resolve()))
 
-        # Parse turn limits
-        turn_limits_data = data["turn_limits"]
-        turn_limits = TurnLimits(
-            optimal_solver=turn_limits_data["optimal_solver"],
-            benchmark_default=turn_limits_data["benchmark_default"],
-        )
 
-        # Parse scoring
-        scoring_data = data["scoring"]
-        scoring = Scoring(
-            success=scoring_data["success"],
-            failure=scoring_data["failure"],
-        )
+@lru_cache(maxsize=None)
+def _load_experiment_config(config_cls: type, path_str: str) -> ExperimentConfig:
+    """
+    Parse an experiments.json file into an instance of config_cls.
 
-        # Parse clingo
+    Cached per config class and resolved path string, shared by ExperimentConfig.load()
+    and get_experiment_config(). Instances are immutable, so sharing is safe.
+    """
+    config_path = Path(path_str)
+    try:
+        data = json.loads(config_path.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Experiment config not found: {config_path}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {config_path}: {e}")
+
+    # Section keys in experiments.json match the dataclass field names, so a missing or
+    # unexpected key makes a constructor raise; report that as an invalid config
+    try:
+        thresholds = Thresholds(**data["thresholds"])
+        turn_limits = TurnLimits(**data["turn_limits"])
+        scoring = Scoring(**data["scoring"])
+        # Container fields are stored read-only so the frozen config is immutable throughout;
+        # JSON-decoded keys are not interned, so intern them once here for the lookups
         clingo_data = data["clingo"]
-        clingo = ClingoConfig(
-            control_all_models=clingo_data["control_all_models"],
-            status_sat=clingo_data["status_sat"],
-            status_unsat=clingo_data["status_unsat"],
-            picking_strategies=clingo_data["picking_strategies"],
-            default_layout_generation_limit=clingo_data["default_layout_generation_limit"],
-            default_initial_states_per_layout=clingo_data["default_initial_states_per_layout"],
-            default_initial_state_limit=clingo_data["default_initial_state_limit"],
-            default_adventures_per_initial_state=clingo_data[
-                "default_adventures_per_initial_state"
-            ],
-            default_target_adventure_count=clingo_data["default_target_adventure_count"],
-            add_floors_default=clingo_data["add_floors_default"],
-            pair_exits_default=clingo_data["pair_exits_default"],
-        )
-
-        # Parse generation
-        generation_data = data["generation"]
+        clingo_data["control_all_models"] = tuple(clingo_data["control_all_models"])
+        clingo_data["picking_strategies"] = _read_only_interned(clingo_data["picking_strategies"])
+        clingo = ClingoConfig(**clingo_data)
         generation = GenerationConfig(
-            definition_methods=generation_data["definition_methods"],
-            adjective_configs=generation_data["adjective_configs"],
-            difficulty_levels=generation_data["difficulty_levels"],
+            **{key: _read_only_interned(value) for key, value in data["generation"].items()}
         )
 
-        return cls(
+        return config_cls(
             random_seed=data["random_seed"],
             max_random_seed=data["max_random_seed"],
             thresholds=thresholds,
@@ -172,10 +170,8 @@ class ExperimentConfig:
             clingo=clingo,
             generation=generation,
         )
-
-
-# Module-level singleton
-_experiment_config: Optional[ExperimentConfig] = None
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid experiment config structure in {config_path}: {e}")
 
 
 def get_experiment_config(config_path: Optional[Path] = None) -> ExperimentConfig:
@@ -183,7 +179,8 @@ def get_experiment_config(config_path: Optional[Path] = None) -> ExperimentConfi
     Get the global experiment configuration instance.
 
     Args:
-        config_path: Optional path to config file. Only used on first call.
+        config_path: Optional path to config file. Each distinct file is parsed
+            once and cached; the default (None) yields the global instance.
 
     Returns:
         The global ExperimentConfig instance with type-safe access.
@@ -195,7 +192,4 @@ def get_experiment_config(config_path: Optional[Path] = None) -> ExperimentConfi
         >>> print(config.thresholds.loop_detection)
         4
     """
-    global _experiment_config
-    if _experiment_config is None:
-        _experiment_config = ExperimentConfig.load(config_path)
-    return _experiment_config
+    return ExperimentConfig.load(config_path)
@@ -0,0 +1,94 @@
+"""
+Generate precompiled Python data modules from the static JSON configs.
+
+The generated modules (messages_data.py, runtime_data.py) hold the fully
+constructed config objects as Python literals, so the default configs are
+loaded by importing cached bytecode instead of opening and parsing JSON.
+
+Run after editing messages.json or runtime.json:
+    python -m adventuregame.config.generate_data_modules
+"""
+
+import dataclasses
+from pathlib import Path, PurePath
+from typing import Any
+
+from adventuregame.config.messages import MessageTemplates
+from adventuregame.config.runtime import RuntimeConfig
+
+CONFIG_DIR = Path(__file__).parent
+
+INDENT = "    "
+# black/isort line length configured in pyproject.toml
+LINE_LENGTH = 100
+
+
+def to_source(value: Any, depth: int = 0) -> str:
+    """Render a config object tree as a Python expression."""
+    if dataclasses.is_dataclass(value):
+        pad = INDENT * (depth + 1)
+        args = [
+            f"{pad}{f.name}={to_source(getattr(value, f.name), depth + 1)},\n"
+            for f in dataclasses.fields(value)
+            if f.init
+        ]
+        return f"{type(value).__name__}(\n{''.join(args)}{INDENT * depth})"
+    if isinstance(value, PurePath):
+        return f"Path({to_source(str(value))})"
+    if isinstance(value, str) and '"' not in value:
+        # prefer double quotes, matching the formatter used across the repo
+        return f'"{repr(value)[1:-1]}"'
+    return repr(value)
+
+
+def render_module(source_json: str, name: str, value: Any) -> str:
+    """Render a complete data module assigning the config object to ``name``."""
+    classes = sorted({type(obj).__name__ for obj in _walk_dataclasses(value)})
+    module = type(value).__module__
+    needs_path = "Path(" in to_source(value)
+    lines = [
+        f'"""Generated from {source_json} by generate_data_modules.py - do not edit."""',
+        "",
+    ]
+    if needs_path:
+        lines += ["from pathlib import Path", ""]
+    lines += [
+        _render_import(module, classes),
+        "",
+        f"{name} = {to_source(value)}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def _render_import(module: str, names: list) -> str:
+    """Render a from-import the way isort's black profile formats it."""
+    import_line = f"from {module} import {', '.join(names)}"
+    if len(import_line) <= LINE_LENGTH:
+        return import_line
+    return "\n".join([f"from {module} import (", *[f"{INDENT}{name}," for name in names], ")"])
+
+
+def _walk_dataclasses(value: Any):
+    """Yield every dataclass instance in a config object tree."""
+    if dataclasses.is_dataclass(value):
+        yield value
+        for f in dataclasses.fields(value):
+            if f.init:
+                yield from _walk_dataclasses(getattr(value, f.name))
+
+
+def main() -> None:
+    """Regenerate messages_data.py and runtime_data.py from their JSON sources."""
+    targets = [
+        ("messages.json", "messages_data.py", "TEMPLATES", MessageTemplates),
+        ("runtime.json", "runtime_data.py", "RUNTIME", RuntimeConfig),
+    ]
+    for source_json, target, name, config_cls in targets:
+        value = config_cls.load(CONFIG_DIR / source_json)
+        (CONFIG_DIR / target).write_text(render_module(source_json, name, value))
+        print(f"Wrote {CONFIG_DIR / target}")
+
+
+if __name__ == "__main__":
+    main()
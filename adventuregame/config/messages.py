@@ -6,12 +6,24 @@ These can be modified for localization or to change the game's tone.
 """
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
+__all__ = [
+    "InitialMessages",
+    "Descriptions",
+    "InventoryMessages",
+    "ErrorMessages",
+    "Delimiters",
+    "MessageTemplates",
+    "get_message_templates",
+    "MESSAGES",
+]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class InitialMessages:
     """Initial/default messages."""
 
@@ -19,7 +31,7 @@ class InitialMessages:
     initial_response: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Descriptions:
     """Description message templates."""
 
@@ -30,7 +42,7 @@ class Descriptions:
     exit_template: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InventoryMessages:
     """Inventory-related messages."""
 
@@ -38,7 +50,7 @@ class InventoryMessages:
     description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorMessages:
     """Error and failure messages."""
 
@@ -56,7 +68,7 @@ class ErrorMessages:
     cannot_do_that: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Delimiters:
     """Delimiters for parsing and formatting."""
 
@@ -66,7 +78,7 @@ class Delimiters:
     list_last_conjunction: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MessageTemplates:
     """
     Type-safe message templates.
@@ -81,11 +93,22 @@ class MessageTemplates:
     errors: ErrorMessages
     delimiters: Delimiters
 
+    # Error messages keyed by field name, built once for get_error_message()
+    _errors_map: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index the error messages by name (frozen, so bypass __setattr__)."""
+        errors_map = {f.name: getattr(self.errors, f.name) for f in fields(self.errors)}
+        object.__setattr__(self, "_errors_map", errors_map)
+
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> "MessageTemplates":
         """
         Load message templates from JSON file.
 
+        Each file is parsed once; repeated loads of the same path return the
+        cached instance.
+
         Args:
             config_path: Path to messages.json. If None, uses default location.
 
@@ -99,71 +122,7 @@ class MessageTemplates:
         if config_path is None:
             config_path = Path(__file__).parent / "messages.json"
 
-        try:
-            with open(config_path) as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Messages config not found: {config_path}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in {config_path}: {e}")
-
-        # Parse initial messages
-        initial_data = data["initial"]
-        initial = InitialMessages(
-            default_custom_response=initial_data["default_custom_response"],
-            initial_response=initial_data["initial_response"],
-        )
-
-        # Parse descriptions
-        descriptions_data = data["descriptions"]
-        descriptions = Descriptions(
-            room_template=descriptions_data["room_template"],
-            multi_item=descriptions_data["multi_item"],
-            two_items=descriptions_data["two_items"],
-            single_item=descriptions_data["single_item"],
-            exit_template=descriptions_data["exit_template"],
-        )
-
-        # Parse inventory messages
-        inventory_data = data["inventory"]
-        inventory = InventoryMessages(
-            empty=inventory_data["empty"],
-            description=inventory_data["description"],
-        )
-
-        # Parse error messages
-        errors_data = data["errors"]
-        errors = ErrorMessages(
-            unknown_command=errors_data["unknown_command"],
-            undefined_action=errors_data["undefined_action"],
-            unknown_entity=errors_data["unknown_entity"],
-            cannot_take=errors_data["cannot_take"],
-            cannot_put=errors_data["cannot_put"],
-            no_need_open=errors_data["no_need_open"],
-            cannot_close=errors_data["cannot_close"],
-            unknown_item_type=errors_data["unknown_item_type"],
-            already_in_inventory=errors_data["already_in_inventory"],
-            cannot_take_from_inventory=errors_data["cannot_take_from_inventory"],
-            not_in_room=errors_data["not_in_room"],
-            cannot_do_that=errors_data["cannot_do_that"],
-        )
-
-        # Parse delimiters
-        delimiters_data = data["delimiters"]
-        delimiters = Delimiters(
-            plan_delimiter=delimiters_data["plan_delimiter"],
-            plan_separator=delimiters_data["plan_separator"],
-            list_separator=delimiters_data["list_separator"],
-            list_last_conjunction=delimiters_data["list_last_conjunction"],
-        )
-
-        return cls(
-            initial=initial,
-            descriptions=descriptions,
-            inventory=inventory,
-            errors=errors,
-            delimiters=delimiters,
-        )
+        return _load_message_templates(cls, str(Path(config_path).resolve()))
 
     def get_error_message(self, error_type: str) -> Optional[str]:
         """
@@ -181,7 +140,43 @@ class MessageTemplates:
             >>> print(msg)
             I don't know what you mean.
         """
-        return getattr(self.errors, error_type, None)
+        return self._errors_map.get(error_type)
+
+
+@lru_cache(maxsize=None)
+def _load_message_templates(config_cls: type, path_str: str) -> MessageTemplates:
+    """
+    Parse a messages.json file into an instance of config_cls.
+
+    Cached per config class and resolved path string, so reloading the same file is free.
+    Instances are immutable, so sharing is safe.
+    """
+    config_path = Path(path_str)
+    try:
+        data = json.loads(config_path.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Messages config not found: {config_path}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {config_path}: {e}")
+
+    # Section keys in messages.json match the dataclass field names, so a missing or
+    # unexpected key makes a constructor raise; report that as an invalid config
+    try:
+        initial = InitialMessages(**data["initial"])
+        descriptions = Descriptions(**data["descriptions"])
+        inventory = InventoryMessages(**data["inventory"])
+        errors = ErrorMessages(**data["errors"])
+        delimiters = Delimiters(**data["delimiters"])
+
+        return config_cls(
+            initial=initial,
+            descriptions=descriptions,
+            inventory=inventory,
+            errors=errors,
+            delimiters=delimiters,
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid messages config structure in {config_path}: {e}")
 
 
 # Module-level singleton
@@ -194,6 +189,8 @@ def get_message_templates(config_path: Optional[Path] = None) -> MessageTemplate
 
     Args:
         config_path: Optional path to config file. Only used on first call.
+            Without a path, the precompiled messages_data module is imported; run
+            generate_data_modules after editing messages.json.
 
     Returns:
         The global MessageTemplates instance with type-safe access.
@@ -207,5 +204,25 @@ def get_message_templates(config_path: Optional[Path] = None) -> MessageTemplate
     """
     global _message_templates
     if _message_templates is None:
-        _message_templates = MessageTemplates.load(config_path)
+        if config_path is None:
+            # default config: import the precompiled data module instead of parsing JSON
+            from adventuregame.config.messages_data import TEMPLATES
+
+            _message_templates = TEMPLATES
+        else:
+            _message_templates = MessageTemplates.load(config_path)
     return _message_templates
+
+
+# Global instance as a module constant: ``from ... import MESSAGES`` resolves it via
+# the module __getattr__ below on first access, after which it is a plain global
+MESSAGES: MessageTemplates
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``MESSAGES`` to the global message templates on first access (PEP 562)."""
+    if name != "MESSAGES":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = get_message_templates()
+    globals()[name] = value
+    return value
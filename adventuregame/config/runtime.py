@@ -9,12 +9,24 @@ This module provides type-safe access to runtime configuration including:
 """
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+__all__ = [
+    "GrammarFiles",
+    "Paths",
+    "Logging",
+    "Parser",
+    "Game",
+    "RuntimeConfig",
+    "get_runtime_config",
+    "RUNTIME",
+]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GrammarFiles:
     """Grammar file paths."""
 
@@ -24,7 +36,7 @@ class GrammarFiles:
     grammar_core: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Paths:
     """File system paths for the game."""
 
@@ -34,8 +46,21 @@ class Paths:
     instances_dir: Path
     grammar_files: GrammarFiles
 
+    # String forms of the directory paths, computed once at construction
+    game_module_path_str: str = field(init=False, repr=False, compare=False)
+    resources_dir_str: str = field(init=False, repr=False, compare=False)
+    definitions_dir_str: str = field(init=False, repr=False, compare=False)
+    instances_dir_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the string forms of the directory paths (frozen, so bypass __setattr__)."""
+        object.__setattr__(self, "game_module_path_str", str(self.game_module_path))
+        object.__setattr__(self, "resources_dir_str", str(self.resources_dir))
+        object.__setattr__(self, "definitions_dir_str", str(self.definitions_dir))
+        object.__setattr__(self, "instances_dir_str", str(self.instances_dir))
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Logging:
     """Logging configuration."""
 
@@ -43,7 +68,7 @@ class Logging:
     format: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Parser:
     """Parser configuration."""
 
@@ -52,7 +77,7 @@ class Parser:
     event_start_rule: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Game:
     """Game constants."""
 
@@ -62,7 +87,7 @@ class Game:
     command_prefix_with_space: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
     """
     Type-safe runtime configuration.
@@ -81,6 +106,9 @@ class RuntimeConfig:
         """
         Load runtime configuration from JSON file.
 
+        Each file is parsed once; repeated loads of the same path return the
+        cached instance.
+
         Args:
             config_path: Path to runtime.json. If None, uses default location.
 
@@ -94,63 +122,45 @@ class RuntimeConfig:
         if config_path is None:
             config_path = Path(__file__).parent / "runtime.json"
 
-        try:
-            with open(config_path) as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Runtime config not found: {config_path}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in {config_path}: {e}")
-
-        # Parse grammar files
-        grammar_data = data["paths"]["grammar_files"]
-        grammar_files = GrammarFiles(
-            pddl_actions=grammar_data["pddl_actions"],
-            pddl_domain=grammar_data["pddl_domain"],
-            pddl_events=grammar_data["pddl_events"],
-            grammar_core=grammar_data["grammar_core"],
-        )
+        return _load_runtime_config(cls, str(Path(config_path).resolve()))
 
-        # Parse paths
-        paths_data = data["paths"]
-        paths = Paths(
-            game_module_path=Path(paths_data["game_module_path"]),
-            resources_dir=Path(paths_data["resources_dir"]),
-            definitions_dir=Path(paths_data["definitions_dir"]),
-            instances_dir=Path(paths_data["instances_dir"]),
-            grammar_files=grammar_files,
-        )
 
-        # Parse logging
-        logging_data = data["logging"]
-        logging = Logging(
-            level=logging_data["level"],
-            format=logging_data["format"],
-        )
-
-        # Parse parser
-        parser_data = data["parser"]
-        parser = Parser(
-            action_start_rule=parser_data["action_start_rule"],
-            domain_start_rule=parser_data["domain_start_rule"],
-            event_start_rule=parser_data["event_start_rule"],
-        )
+@lru_cache(maxsize=None)
+def _load_runtime_config(config_cls: type, path_str: str) -> RuntimeConfig:
+    """
+    Parse a runtime.json file into an instance of config_cls.
 
-        # Parse game
-        game_data = data["game"]
-        game = Game(
-            name=game_data["name"],
-            description=game_data["description"],
-            command_prefix=game_data["command_prefix"],
-            command_prefix_with_space=game_data["command_prefix_with_space"],
+    Cached per config class and resolved path string, so reloading the same file is free.
+    Instances are immutable, so sharing is safe.
+    """
+    config_path = Path(path_str)
+    try:
+        data = json.loads(config_path.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Runtime config not found: {config_path}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {config_path}: {e}")
+
+    # Section keys in runtime.json match the dataclass field names, so a missing or
+    # unexpected key makes a constructor raise; report that as an invalid config
+    try:
+        paths_data = data["paths"]
+        grammar_files = GrammarFiles(**paths_data.pop("grammar_files"))
+        paths = Paths(
+            grammar_files=grammar_files, **{key: Path(value) for key, value in paths_data.items()}
         )
+        logging = Logging(**data["logging"])
+        parser = Parser(**data["parser"])
+        game = Game(**data["game"])
 
-        return cls(
+        return config_cls(
             paths=paths,
             logging=logging,
             parser=parser,
             game=game,
         )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid runtime config structure in {config_path}: {e}")
 
 
 # Module-level singleton
@@ -163,6 +173,8 @@ def get_runtime_config(config_path: Optional[Path] = None) -> RuntimeConfig:
 
     Args:
         config_path: Optional path to config file. Only used on first call.
+            Without a path, the precompiled runtime_data module is imported; run
+            generate_data_modules after editing runtime.json.
 
     Returns:
         The global RuntimeConfig instance with type-safe access.
@@ -176,5 +188,25 @@ def get_runtime_config(config_path: Optional[Path] = None) -> RuntimeConfig:
     """
     global _runtime_config
     if _runtime_config is None:
-        _runtime_config = RuntimeConfig.load(config_path)
+        if config_path is None:
+            # default config: import the precompiled data module instead of parsing JSON
+            from adventuregame.config.runtime_data import RUNTIME
+
+            _runtime_config = RUNTIME
+        else:
+            _runtime_config = RuntimeConfig.load(config_path)
     return _runtime_config
+
+
+# Global instance as a module constant: ``from ... import RUNTIME`` resolves it via
+# the module __getattr__ below on first access, after which it is a plain global
+RUNTIME: RuntimeConfig
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``RUNTIME`` to the global runtime configuration on first access (PEP 562)."""
+    if name != "RUNTIME":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = get_runtime_config()
+    globals()[name] = value
+    return value
@@ -0,0 +1,35 @@
+"""Generated from runtime.json by generate_data_modules.py - do not edit."""
+
+from pathlib import Path
+
+from adventuregame.config.runtime import Game, GrammarFiles, Logging, Parser, Paths, RuntimeConfig
+
+RUNTIME = RuntimeConfig(
+    paths=Paths(
+        game_module_path=Path("adventuregame"),
+        resources_dir=Path("resources"),
+        definitions_dir=Path("definitions"),
+        instances_dir=Path("in"),
+        grammar_files=GrammarFiles(
+            pddl_actions="pddl_actions.lark",
+            pddl_domain="pddl_domain.lark",
+            pddl_events="pddl_events.lark",
+            grammar_core="grammar_core",
+        ),
+    ),
+    logging=Logging(
+        level="INFO",
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    ),
+    parser=Parser(
+        action_start_rule="action",
+        domain_start_rule="define",
+        event_start_rule="event",
+    ),
+    game=Game(
+        name="adventuregame",
+        description="Interactive Fiction clemgame",
+        command_prefix=">",
+        command_prefix_with_space="> ",
+    ),
+)
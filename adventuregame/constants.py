@@ -8,14 +8,16 @@ not configuration that researchers modify.
 For values that DO change (paths, thresholds, messages), see the config/ module.
 """
 
-from typing import List
+import re
+import sys
+from typing import Final, FrozenSet, Pattern, Tuple
 
-# Action constants
+# Action constants (collections only used for membership tests are frozensets)
 ACTION_DONE = "done"
 ACTION_DONE_COMMAND = "> done"
 ACTION_UNKNOWN = "unknown"
-ACTIONS_EXCLUDED_FROM_SHUFFLE = ["go", "done", "examine", "look"]
-OBJECT_MANIPULATION_ACTIONS = ["take", "put", "open", "close"]
+ACTIONS_EXCLUDED_FROM_SHUFFLE: Final[FrozenSet[str]] = frozenset({"go", "done", "examine", "look"})
+OBJECT_MANIPULATION_ACTIONS: Final[FrozenSet[str]] = frozenset({"take", "put", "open", "close"})
 
 # Entity constants
 PLAYER_ID = "player1"
@@ -23,12 +25,12 @@ INVENTORY_ID = "inventory"
 FLOOR_ID_SUFFIX = "floor1"
 CEILING_ID_SUFFIX = "ceiling1"
 DEFAULT_INSTANCE_SUFFIX = "1"
-ENTITIES_EXEMPT_FROM_SUPPORT = ["floor", "player"]
+ENTITIES_EXEMPT_FROM_SUPPORT: Final[FrozenSet[str]] = frozenset({"floor", "player"})
 FLOOR_TYPE = "floor"
 
 # Predicate constants
-MUTABLE_STATE_PREDICATES = ["open", "closed", "at", "in", "on"]
-INVENTORY_PREDICATES = ["at", "in"]
+MUTABLE_STATE_PREDICATES: Final[FrozenSet[str]] = frozenset({"open", "closed", "at", "in", "on"})
+INVENTORY_PREDICATES: Final[FrozenSet[str]] = frozenset({"at", "in"})
 PREDICATE_TEXT = "text"
 PREDICATE_OPENABLE = "openable"
 PREDICATE_TAKEABLE = "takeable"
@@ -88,7 +90,7 @@ PARSE_ERROR_COMMAND_TAG_MISSING = "command_tag_missing"
 PARSE_ERROR_NEXT_ACTIONS_MISSING = "next_actions_missing"
 
 # Fail type constants
-FAIL_TYPES: List[str] = [
+FAIL_TYPES: Final[Tuple[str, ...]] = (
     "parsing",
     "resolution",
     "lark_exception",
@@ -110,22 +112,28 @@ FAIL_TYPES: List[str] = [
     "going_to_current_room",
     "no_exit_to",
     "inventory_limit_exceeded",
-]
+)
+# FAIL_TYPES is ordered (scoring slices it); validate fail types against the set
+FAIL_TYPES_SET: Final[FrozenSet[str]] = frozenset(FAIL_TYPES)
 
 # Plan metric constants
-PLAN_METRICS: List[str] = [
+PLAN_METRICS: Final[Tuple[str, ...]] = (
     "plan_followed",
     "plan_command_success_ratio",
     "bad_plan_followed",
-]
+)
 
 # Hallucination keyword constants
-HALLUCINATION_KEYWORDS: List[str] = [
+HALLUCINATION_KEYWORDS: Final[Tuple[str, ...]] = (
     "complete",
     "finish",
     "done",
     "successfully",
-]
+)
+# All keywords as one compiled alternation: a single scan of the utterance
+HALLUCINATION_PATTERN: Final[Pattern[str]] = re.compile(
+    "|".join(map(re.escape, HALLUCINATION_KEYWORDS))
+)
 
 # Template placeholder constants
 TEMPLATE_PLACEHOLDER_GOAL = "$GOAL$"
@@ -168,6 +176,10 @@ INDEX_PLAN_ANALYSIS_START_TURN = 1
 INDEX_ZERO = 0
 INDEX_ACTION_STRING_PREFIX_LEN = 9
 INDEX_ACTION_STRING_SUFFIX_LEN = -1
+# Prebuilt slice for the inner part of a clingo action atom string
+ACTION_STRING_INNER: Final[slice] = slice(
+    INDEX_ACTION_STRING_PREFIX_LEN, INDEX_ACTION_STRING_SUFFIX_LEN
+)
 
 # Count constants
 COUNT_INITIAL_INVENTORY_ITEMS = 0
@@ -175,13 +187,13 @@ COUNT_INITIAL_ITERATOR_VALUE = 0
 
 # Tuple length constants
 FACT_TUPLE_LENGTH = 3
-PREDICATE_ARG_LENGTHS = [3, 5, 7]
+PREDICATE_ARG_LENGTHS: Final[Tuple[int, ...]] = (3, 5, 7)
 
 # Generation constants
-ROOM_EXIT_COUNTS = [0, 1, 2, 3]
-INVENTORY_COUNTS = [0, 1]
-CONTAINER_CONTENT_COUNTS = [0, 1, 2, 3]
-SUPPORTED_ENTITY_COUNTS = [0, 1, 2, 3]
+ROOM_EXIT_COUNTS: Final[Tuple[int, ...]] = (0, 1, 2, 3)
+INVENTORY_COUNTS: Final[Tuple[int, ...]] = (0, 1)
+CONTAINER_CONTENT_COUNTS: Final[Tuple[int, ...]] = (0, 1, 2, 3)
+SUPPORTED_ENTITY_COUNTS: Final[Tuple[int, ...]] = (0, 1, 2, 3)
 ENTITY_REPLACEMENT_THRESHOLD = 4
 
 # Output formatting constants
@@ -202,3 +214,11 @@ PROMPT_TEMPLATE_POTION_BREWING = "resources/initial_prompts/potion_brewing"
 PROMPT_TEMPLATE_PLAN = "resources/initial_prompts/plan_prompt_done"
 PROMPT_TEMPLATE_BASIC_INVLIMIT = "resources/initial_prompts/basic_prompt_done_invlimittwo"
 PROMPT_TEMPLATE_PLAN_INVLIMIT = "resources/initial_prompts/plan_prompt_done_invlimittwo"
+
+# The compiler already interns identifier-like literals (PLAYER_ID, KEY_*, EVENT_*,
+# FAIL_TYPES members, ...); intern the remaining string constants ("> done",
+# "new-words", ...) as well, so every equal interned string shares one object
+for _name, _value in list(globals().items()):
+    if _name.isupper() and isinstance(_value, str):
+        globals()[_name] = sys.intern(_value)
+del _name, _value
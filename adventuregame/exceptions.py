@@ -14,7 +14,7 @@ class AdventureGameError(Exception):
     single except clause if needed.
     """
 
-    pass
+    __slots__ = ()
 
 
 class PDDLParseError(AdventureGameError):
@@ -27,7 +27,7 @@ class PDDLParseError(AdventureGameError):
     - Action input commands
     """
 
-    pass
+    __slots__ = ()
 
 
 class ActionResolutionError(AdventureGameError):
@@ -40,7 +40,7 @@ class ActionResolutionError(AdventureGameError):
     - Effect application failures
     """
 
-    pass
+    __slots__ = ()
 
 
 class InvalidStateError(AdventureGameError):
@@ -53,7 +53,7 @@ class InvalidStateError(AdventureGameError):
     - Room connections are malformed
     """
 
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(AdventureGameError):
@@ -66,7 +66,7 @@ class ConfigurationError(AdventureGameError):
     - Configuration values out of valid range
     """
 
-    pass
+    __slots__ = ()
 
 
 class InstanceGenerationError(AdventureGameError):
@@ -79,7 +79,7 @@ class InstanceGenerationError(AdventureGameError):
     - Goal generation failures
     """
 
-    pass
+    __slots__ = ()
 
 
 class ClingoSolverError(AdventureGameError):
@@ -92,7 +92,7 @@ class ClingoSolverError(AdventureGameError):
     - Memory exhaustion
     """
 
-    pass
+    __slots__ = ()
 
 
 class EventProcessingError(AdventureGameError):
@@ -105,7 +105,7 @@ class EventProcessingError(AdventureGameError):
     - Recursive event triggering issues
     """
 
-    pass
+    __slots__ = ()
 
 
 class ValidationError(AdventureGameError):
@@ -118,4 +118,4 @@ class ValidationError(AdventureGameError):
     - Invariant violations
     """
 
-    pass
+    __slots__ = ()
@@ -2,22 +2,47 @@
 IF interpreter for adventuregame.
 """
 
+import hashlib
 import itertools
 import json
 import logging
 import os
+import re
 import sys
 from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 
 import jinja2
+import jinja2.meta
 import lark
 import numpy as np
 from clemcore.clemgame import GameResourceLocator
 from lark import Lark, Transformer
 
-from adventuregame.adv_util import fact_str_to_tuple, fact_tuple_to_str
+from adventuregame.adv_util import (
+    default_instance_id,
+    fact_strs_to_tuples,
+    fact_tuple_to_str,
+    floor_id,
+    load_definition_file,
+)
 from adventuregame.config.compat import get_config
 
 # Import custom exceptions
@@ -46,8 +71,200 @@ RESOURCES_SUBPATH = config.paths["resources_dir"]
 
 GAME_NAME = config.game_constants["game_name"]
 
+# Predicate arguments ending in these are instance IDs, all others are resolved as type words
+_INSTANCE_ID_SUFFIXES: Tuple[str, ...] = tuple("0123456789") + (config.entities["inventory_id"],)
+
 logger = logging.getLogger(__name__)
 
+# Shared empty result for predicate index lookups without matching facts
+_NO_FACTS: FrozenSet[Tuple[Any, ...]] = frozenset()
+# Key of compiled fact templates in parsed PDDL predicate dicts
+_FACT_TEMPLATE_KEY: str = "fact_template"
+# Key of condition kinds in parsed PDDL condition dicts, and the kinds in order of precedence
+_CONDITION_KIND_KEY: str = "condition_kind"
+_CONDITION_KINDS: Tuple[str, ...] = ("not", "predicate", "num_comp", "and", "or")
+# Fact tuples only hold immutable values, so world state snapshots can be shallow set copies
+_FACT_VALUE_TYPES: Tuple[type, ...] = (str, int, float)
+
+# Inputs matching the action grammar's 'unknown' rule, (WORD WS*)+, with lark's common WORD and WS
+_WORDS_ONLY_PATTERN: Pattern[str] = re.compile(r"[a-zA-Z]+(?:[ \t\f\r\n]+[a-zA-Z]+)*[ \t\f\r\n]*")
+_FIRST_WORD_PATTERN: Pattern[str] = re.compile(r"[a-zA-Z]+")
+# String literals in action grammar snippets
+_LARK_LITERAL_PATTERN: Pattern[str] = re.compile(r'"([^"]*)"')
+
+
+@lru_cache(maxsize=32)
+def _get_parser(grammar: str, start: str) -> Lark:
+    """Get a Lark parser for a grammar, compiling it only once per process.
+    Parsers keep no state between parse calls, so interpreters with the same grammar share one.
+    The action grammar is ambiguous (multi-word arguments are only separated by whitespace), so the
+    default Earley parser is kept instead of LALR.
+    Args:
+        grammar: Full Lark grammar string.
+        start: Start rule of the grammar.
+    Returns:
+        The compiled Lark parser.
+    """
+    return Lark(grammar, start=start)
+
+
+@lru_cache(maxsize=None)
+def _get_feedback_template(template_source: str) -> jinja2.Template:
+    """Get a jinja2 template for a feedback template string, compiling it only once per process.
+    Args:
+        template_source: Feedback template string from an action or event definition.
+    Returns:
+        The compiled template.
+    """
+    return jinja2.Template(template_source)
+
+
+@lru_cache(maxsize=None)
+def _get_template_variables(template_source: str) -> FrozenSet[str]:
+    """Get the names of the variables a feedback template string uses.
+    Args:
+        template_source: Feedback template string from an action or event definition.
+    Returns:
+        Set of variable names to be passed when rendering the template.
+    """
+    template_ast = _get_feedback_template(template_source).environment.parse(template_source)
+    return frozenset(jinja2.meta.find_undeclared_variables(template_ast))
+
+
+def _freeze_attributes(attributes: Dict[str, Any]) -> Mapping[str, Any]:
+    """Get a read-only view of type definition attributes, with top-level lists as tuples.
+    Args:
+        attributes: Attribute dict of an entity, room or action type.
+    Returns:
+        Read-only mapping of the attributes.
+    """
+    return MappingProxyType(
+        {key: tuple(value) if type(value) == list else value for key, value in attributes.items()}
+    )
+
+
+@dataclass(frozen=True)
+class _ParserBundle:
+    """Type definitions and action parser built from a set of entity, room and action definitions.
+    Shared between interpreters of game instances using the same definitions; the type definitions
+    are read-only mappings.
+    """
+
+    entity_types: Dict[str, Mapping[str, Any]]
+    room_types: Dict[str, Mapping[str, Any]]
+    action_types: Dict[str, Mapping[str, Any]]
+    repr_str_to_type_dict: Dict[str, str]
+    act_parser: Lark
+    act_transformer: "IFTransformer"
+    action_verbs: FrozenSet[str]
+
+
+class PlanActionResult(NamedTuple):
+    """Result of one executed plan action, serialized as a list in plan result logs."""
+
+    goals_achieved: List[str]
+    response: str
+    action_info: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class _WorldStateDiff:
+    """Facts added to and removed from the world state by one recorded world state change.
+    The first world state history entry holds the full initial world state as added facts.
+    """
+
+    added: FrozenSet[Tuple[Any, ...]]
+    removed: FrozenSet[Tuple[Any, ...]]
+
+
+@dataclass(frozen=True)
+class _FactTemplate:
+    """Fact tuple skeleton of a PDDL predicate, with the positions of its variable arguments.
+    Compiled once per predicate object, so resolving the predicate only fills in variable values:
+    fill(variable_map) returns the fact tuple with variable arguments replaced by their values.
+    """
+
+    skeleton: Tuple[Any, ...]
+    variable_slots: Tuple[Tuple[int, str], ...]
+    fill: Callable[[Dict[str, Any]], Tuple[Any, ...]] = field(compare=False, repr=False)
+
+
+def _compile_fact_builder(
+    skeleton: Tuple[Any, ...], variable_slots: Tuple[Tuple[int, str], ...]
+) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """Generate a function building the fact tuple of a skeleton from a variable map.
+    Constant values are bound as default arguments, so the generated function is a single tuple
+    display of locals and variable map lookups, e.g.
+    lambda variable_map, const0=skeleton[0]: (const0, variable_map['i'], variable_map['r'])
+    Args:
+        skeleton: Fact tuple skeleton; values at variable slots are replaced.
+        variable_slots: Pairs of skeleton index and PDDL variable name.
+    Returns:
+        The fact builder function.
+    """
+    if not variable_slots:
+        # facts without variables are always the same tuple:
+        return lambda variable_map, fact=skeleton: fact
+    slot_variables = dict(variable_slots)
+    constant_params = list()
+    fact_values = list()
+    for arg_idx in range(len(skeleton)):
+        if arg_idx in slot_variables:
+            fact_values.append(f"variable_map[{slot_variables[arg_idx]!r}]")
+        else:
+            constant_params.append(f", const{arg_idx}=skeleton[{arg_idx}]")
+            fact_values.append(f"const{arg_idx}")
+    builder_source = f"lambda variable_map{''.join(constant_params)}: ({', '.join(fact_values)},)"
+    return eval(builder_source, {"skeleton": skeleton})
+
+
+def _get_fact_template(predicate: Dict[str, Any]) -> _FactTemplate:
+    """Get the fact template of a parsed PDDL predicate, compiling it on first use.
+    The template is stored in the predicate dict and must be dropped if its arguments are changed.
+    Args:
+        predicate: Parsed PDDL predicate dict with 'predicate', 'arg1', 'arg2' and 'arg3' keys.
+    Returns:
+        The fact template of the predicate.
+    """
+    fact_template = predicate.get(_FACT_TEMPLATE_KEY)
+    if fact_template is None:
+        # predicates always have at least one argument:
+        skeleton = [predicate["predicate"], predicate["arg1"]]
+        if predicate["arg2"]:
+            skeleton.append(predicate["arg2"])
+            if predicate["arg3"]:
+                skeleton.append(predicate["arg3"])
+        # intern constant values to match the interned values of world state facts:
+        skeleton = [sys.intern(arg) if type(arg) == str else arg for arg in skeleton]
+        # the predicate itself is never a variable value:
+        variable_slots = tuple(
+            (arg_idx, arg["variable"])
+            for arg_idx, arg in enumerate(skeleton)
+            if arg_idx and type(arg) == dict and "variable" in arg
+        )
+        skeleton = tuple(skeleton)
+        fact_template = _FactTemplate(
+            skeleton, variable_slots, _compile_fact_builder(skeleton, variable_slots)
+        )
+        predicate[_FACT_TEMPLATE_KEY] = fact_template
+    return fact_template
+
+
+def _get_condition_kind(conditions: Dict[str, Any]) -> str:
+    """Get the kind of a parsed PDDL condition clause, classifying it on first use.
+    The kind is stored in the condition dict, so later checks skip the key probes.
+    Args:
+        conditions: Parsed PDDL condition dict.
+    Returns:
+        The first of 'not', 'predicate', 'num_comp', 'and' and 'or' that is a key of the
+        condition dict, or an empty string for unsupported conditions.
+    """
+    condition_kind = conditions.get(_CONDITION_KIND_KEY)
+    if condition_kind is None:
+        condition_kind = next((kind for kind in _CONDITION_KINDS if kind in conditions), "")
+        conditions[_CONDITION_KIND_KEY] = condition_kind
+    return condition_kind
+
 
 class IFTransformer(Transformer):
     """IF action grammar transformer to convert Lark parse tree to Python dict.
@@ -71,38 +288,41 @@ class IFTransformer(Transformer):
                 - prep: Preposition (str)
         """
         action: lark.Tree = content[0]
-        action_type = action.data  # main grammar rule the input was parsed as
+        action_type: str = action.data.value  # main grammar rule the input was parsed as
         action_content = action.children  # all parsed arguments of the action 'VP'
-        action_dict = {"type": action_type.value}  # value = string name of rule in grammar
+        action_dict = {"type": action_type}  # value = string name of rule in grammar
+        # if the input can't be parsed as a defined action command, the grammar labels it as 'unknown':
+        action_unknown = action_type == "unknown"
 
-        arguments = []
         arg_idx = 1
 
         for child in action_content:
+            child_class = child.__class__
             # handle potentially multi-word 'thing' arguments; roughly equivalent to generic 'NP':
-            if type(child) == lark.Tree and child.data == "thing":
-                argument_words = [word.value for word in child.children if word.type == "WORD"]
-                arguments.append(" ".join(argument_words))
-                # extract defined adjectives:
-                argument_adjs = [
-                    adj.value.strip() for adj in child.children[:-1] if adj.type == "ADJ"
-                ]
-                if argument_adjs:
-                    action_dict[f"arg{arg_idx}_adjs"] = argument_adjs
-                action_dict[f"arg{arg_idx}"] = arguments[-1]
-                arg_idx += 1
-            # extract defined prepositions:
-            if type(child) == lark.Token and child.type == "PREP":
-                action_dict["prep"] = child.value.strip()
-            # if the input can't be parsed as a defined action command, the grammar labels it as 'unknown'
-            # in this case, the first word is assumed to be the verb and is returned for feedback:
-            if (
-                action_type.value == "unknown"
-                and type(child) == lark.Token
-                and child.type == "WORD"
-            ):
-                action_dict[f"arg{arg_idx}"] = child.value
-                break
+            if child_class is lark.Tree:
+                if child.data == "thing":
+                    # collect argument words and defined adjectives in one pass:
+                    argument_words = list()
+                    argument_adjs = list()
+                    for word in child.children:
+                        word_type = word.type
+                        if word_type == "WORD":
+                            argument_words.append(word.value)
+                        elif word_type == "ADJ":
+                            argument_adjs.append(word.value.strip())
+                    if argument_adjs:
+                        action_dict[f"arg{arg_idx}_adjs"] = argument_adjs
+                    action_dict[f"arg{arg_idx}"] = " ".join(argument_words)
+                    arg_idx += 1
+            elif child_class is lark.Token:
+                child_type = child.type
+                # extract defined prepositions:
+                if child_type == "PREP":
+                    action_dict["prep"] = child.value.strip()
+                # for 'unknown' input, the first word is assumed to be the verb and is returned for feedback:
+                elif action_unknown and child_type == "WORD":
+                    action_dict[f"arg{arg_idx}"] = child.value
+                    break
 
         return action_dict
 
@@ -121,6 +341,9 @@ class AdventureIFInterpreter(GameResourceLocator):
     actions, domains, and events, and employs Lark parsing for player input.
     """
 
+    # Parser bundles by hash of the game path and entity, room and action definition sources:
+    _BUNDLE_CACHE: Dict[str, _ParserBundle] = dict()
+
     def __init__(
         self,
         game_path: str,
@@ -151,11 +374,9 @@ class AdventureIFInterpreter(GameResourceLocator):
         self.repr_str_to_type_dict: Dict[str, str] = dict()
 
         # Entity and room type definitions
-        self.entity_types: Dict[str, Dict[str, Any]] = dict()
-        self.initialize_entity_types()
-
-        self.room_types: Dict[str, Dict[str, Any]] = dict()
-        self.initialize_room_types()
+        # Entity, room and action type definitions are read-only and shared between interpreters
+        self.entity_types: Dict[str, Mapping[str, Any]] = dict()
+        self.room_types: Dict[str, Mapping[str, Any]] = dict()
 
         # PDDL parsers and transformers
         self.action_def_parser: Optional[Lark] = None
@@ -171,8 +392,10 @@ class AdventureIFInterpreter(GameResourceLocator):
         # Action parsing
         self.act_parser: Optional[Lark] = None
         self.act_transformer: IFTransformer = IFTransformer()
-        self.action_types: Dict[str, Dict[str, Any]] = dict()
-        self.initialize_action_types()
+        # first words of all action verbs in the action grammar, plus the action type names:
+        self.action_verbs: FrozenSet[str] = frozenset()
+        self.action_types: Dict[str, Mapping[str, Any]] = dict()
+        self.initialize_parser_bundle(print_lark_grammar=verbose)
 
         # Domain and event definitions
         self.domain: Dict[str, Any] = dict()
@@ -184,8 +407,25 @@ class AdventureIFInterpreter(GameResourceLocator):
 
         # World state tracking
         self.world_state: Set[Tuple[Any, ...]] = set()
-        self.world_state_history: List[Set[Tuple[Any, ...]]] = list()
-        self.goal_state: Set[Tuple[Any, ...]] = set()
+        # Canonical fact tuples, so equal facts in world state, indexes and history are one object:
+        self._fact_intern: Dict[Tuple[Any, ...], Tuple[Any, ...]] = dict()
+        # World state changes as diffs, to be folded back from the current world state:
+        self.world_state_history: List[_WorldStateDiff] = list()
+        # Facts changed by _add_fact/_remove_fact since the last world state history entry:
+        self._added_since_commit: Set[Tuple[Any, ...]] = set()
+        self._removed_since_commit: Set[Tuple[Any, ...]] = set()
+        # Predicate indexes over world_state, kept in sync by _add_fact/_remove_fact:
+        self._by_pred: Dict[str, Set[Tuple[Any, ...]]] = dict()
+        self._by_pred_arg1: Dict[Tuple[str, Any], Set[Tuple[Any, ...]]] = dict()
+        self._by_pred_arg2: Dict[Tuple[str, Any], Set[Tuple[Any, ...]]] = dict()
+        # Instance surface strings, built on first use and dropped when their adj facts change:
+        self._inst_str_cache: Dict[str, str] = dict()
+        # Visible contents of the player's room, dropped on any world state change:
+        self._visible_contents: Optional[List[str]] = None
+        self.goal_state: FrozenSet[Tuple[Any, ...]] = frozenset()
+        # Entities in goal facts, and all values of goal facts, for exploration tracking:
+        self.goal_entities: FrozenSet[Any] = frozenset()
+        self.goal_fact_values: FrozenSet[Any] = frozenset()
         self.goals_achieved: Set[Tuple[Any, ...]] = set()
 
         # Entity and room instance mappings
@@ -200,13 +440,65 @@ class AdventureIFInterpreter(GameResourceLocator):
         self.event_randomization: Dict[str, str] = dict()
 
         self.initialize_states_from_strings()
-        self.initialize_action_parsing(print_lark_grammar=verbose)
 
         # Exploration tracking
         self.exploration_history: List[Set[Tuple[Any, ...]]] = list()
         self.exploration_state: Set[Tuple[Any, ...]] = set()
         self.track_exploration()
 
+    def _load_definition(self, file_path: str) -> Any:
+        """Load a JSON file from the game directory, parsing it only once per process.
+        Args:
+            file_path: Relative path to the file starting from game path, without '.json' ending.
+        Returns:
+            The parsed JSON content, shared between interpreter instances; must not be modified.
+        """
+        return load_definition_file(os.path.join(self.game_path, f"{file_path}.json"))
+
+    def initialize_parser_bundle(self, print_lark_grammar: bool = False) -> None:
+        """Set up entity, room and action types and the action parser for this adventure.
+
+        Game instances using the same definitions share a single _ParserBundle, so the
+        definitions are processed and the action grammar is assembled only once per process.
+
+        Args:
+            print_lark_grammar: If True, logs the complete grammar when it is assembled
+        """
+        definition_sources = [
+            str(self.game_path),
+            self.game_instance[config.keys["entity_definitions"]],
+            self.game_instance[config.keys["room_definitions"]],
+            self.game_instance[config.keys["action_definitions"]],
+        ]
+        bundle_key = hashlib.blake2b(
+            json.dumps(definition_sources, sort_keys=True).encode()
+        ).hexdigest()
+
+        bundle = self._BUNDLE_CACHE.get(bundle_key)
+        if bundle is None:
+            self.initialize_entity_types()
+            self.initialize_room_types()
+            self.initialize_action_types()
+            self.initialize_action_parsing(print_lark_grammar=print_lark_grammar)
+            bundle = _ParserBundle(
+                entity_types=self.entity_types,
+                room_types=self.room_types,
+                action_types=self.action_types,
+                repr_str_to_type_dict=self.repr_str_to_type_dict,
+                act_parser=self.act_parser,
+                act_transformer=self.act_transformer,
+                action_verbs=self.action_verbs,
+            )
+            self._BUNDLE_CACHE[bundle_key] = bundle
+        else:
+            self.entity_types = bundle.entity_types
+            self.room_types = bundle.room_types
+            self.action_types = bundle.action_types
+            self.repr_str_to_type_dict = bundle.repr_str_to_type_dict
+            self.act_parser = bundle.act_parser
+            self.act_transformer = bundle.act_transformer
+            self.action_verbs = bundle.action_verbs
+
     def initialize_entity_types(self) -> None:
         """Load and process entity types in this adventure.
 
@@ -222,7 +514,7 @@ class AdventureIFInterpreter(GameResourceLocator):
         for entity_def in self.game_instance[config.keys["entity_definitions"]]:
             # check if entity definition is file name string:
             if type(entity_def) == str:
-                entities_file = self.load_json(
+                entities_file = self._load_definition(
                     f"resources{os.sep}definitions{os.sep}{entity_def[:-5]}"
                 )
                 entity_definitions += entities_file
@@ -231,18 +523,19 @@ class AdventureIFInterpreter(GameResourceLocator):
                 entity_definitions.append(entity_def)
 
         for entity_definition in entity_definitions:
-            self.entity_types[entity_definition["type_name"]] = dict()
-            for entity_attribute in entity_definition:
+            # type names match the interned strings of world state facts:
+            type_name = sys.intern(entity_definition["type_name"])
+            entity_type = dict()
+            for entity_attribute, attribute_value in entity_definition.items():
                 if entity_attribute == "type_name":
                     # assign surface strings:
-                    self.repr_str_to_type_dict[entity_definition["repr_str"]] = entity_definition[
-                        entity_attribute
-                    ]
+                    self.repr_str_to_type_dict[
+                        sys.intern(entity_definition["repr_str"])
+                    ] = type_name
                 else:
                     # get all other attributes:
-                    self.entity_types[entity_definition["type_name"]][
-                        entity_attribute
-                    ] = entity_definition[entity_attribute]
+                    entity_type[sys.intern(entity_attribute)] = attribute_value
+            self.entity_types[type_name] = _freeze_attributes(entity_type)
 
     def initialize_room_types(self) -> None:
         """Load and process room types in this adventure.
@@ -258,25 +551,25 @@ class AdventureIFInterpreter(GameResourceLocator):
         for room_def in self.game_instance[config.keys["room_definitions"]]:
             # check if room definition is file name string:
             if type(room_def) == str:
-                rooms_file = self.load_json(f"resources{os.sep}definitions{os.sep}{room_def[:-5]}")
+                rooms_file = self._load_definition(
+                    f"resources{os.sep}definitions{os.sep}{room_def[:-5]}"
+                )
                 room_definitions += rooms_file
             # check if room definition is direct dict:
             elif type(room_def) == dict:
                 room_definitions.append(room_def)
 
         for room_definition in room_definitions:
-            self.room_types[room_definition["type_name"]] = dict()
-            for room_attribute in room_definition:
+            type_name = sys.intern(room_definition["type_name"])
+            room_type = dict()
+            for room_attribute, attribute_value in room_definition.items():
                 if room_attribute == "type_name":
                     # assign surface strings:
-                    self.repr_str_to_type_dict[room_definition["repr_str"]] = room_definition[
-                        room_attribute
-                    ]
+                    self.repr_str_to_type_dict[sys.intern(room_definition["repr_str"])] = type_name
                 else:
                     # get all other attributes:
-                    self.room_types[room_definition["type_name"]][room_attribute] = room_definition[
-                        room_attribute
-                    ]
+                    room_type[sys.intern(room_attribute)] = attribute_value
+            self.room_types[type_name] = _freeze_attributes(room_type)
 
     def initialize_pddl_definition_parsing(self) -> None:
         """Initialize PDDL parsers for actions, domains, and events.
@@ -288,21 +581,21 @@ class AdventureIFInterpreter(GameResourceLocator):
         action_def_grammar = self.load_file(
             f"{config.paths['resources_dir']}{os.sep}{config.paths['grammar_files']['pddl_actions']}"
         )
-        self.action_def_parser = Lark(
-            action_def_grammar, start=config.parser_settings["action_grammar_start_rule"]
+        self.action_def_parser = _get_parser(
+            action_def_grammar, config.parser_settings["action_grammar_start_rule"]
         )
         domain_def_grammar = self.load_file(
             f"{config.paths['resources_dir']}{os.sep}{config.paths['grammar_files']['pddl_domain']}"
         )
-        self.domain_def_parser = Lark(
-            domain_def_grammar, start=config.parser_settings["domain_grammar_start_rule"]
+        self.domain_def_parser = _get_parser(
+            domain_def_grammar, config.parser_settings["domain_grammar_start_rule"]
         )
         if config.keys["event_definitions"] in self.game_instance:
             event_def_grammar = self.load_file(
                 f"{config.paths['resources_dir']}{os.sep}{config.paths['grammar_files']['pddl_events']}"
             )
-            self.event_def_parser = Lark(
-                event_def_grammar, start=config.parser_settings["event_grammar_start_rule"]
+            self.event_def_parser = _get_parser(
+                event_def_grammar, config.parser_settings["event_grammar_start_rule"]
             )
 
     def initialize_action_types(self) -> None:
@@ -320,7 +613,7 @@ class AdventureIFInterpreter(GameResourceLocator):
         for action_def in self.game_instance[config.keys["action_definitions"]]:
             # check if action definition is file name string:
             if type(action_def) == str:
-                actions_file = self.load_json(
+                actions_file = self._load_definition(
                     f"resources{os.sep}definitions{os.sep}{action_def[:-5]}"
                 )
                 action_definitions += actions_file
@@ -329,22 +622,20 @@ class AdventureIFInterpreter(GameResourceLocator):
                 action_definitions.append(action_def)
 
         for action_definition in action_definitions:
-            self.action_types[action_definition["type_name"]] = dict()
+            action_type = dict()
             # get all action attributes:
-            for action_attribute in action_definition:
+            for action_attribute, attribute_value in action_definition.items():
                 if not action_attribute == "type_name":
-                    self.action_types[action_definition["type_name"]][
-                        action_attribute
-                    ] = action_definition[action_attribute]
-
-        for action_type in self.action_types:
-            cur_action_type = self.action_types[action_type]
-            if "pddl" in cur_action_type:
-                parsed_action_pddl = self.action_def_parser.parse(cur_action_type["pddl"])
+                    action_type[sys.intern(action_attribute)] = attribute_value
+            if "pddl" in action_type:
+                parsed_action_pddl = self.action_def_parser.parse(action_type["pddl"])
                 processed_action_pddl = self.action_def_transformer.transform(parsed_action_pddl)
-                cur_action_type["interaction"] = processed_action_pddl
+                action_type["interaction"] = processed_action_pddl
             else:
                 raise KeyError
+            self.action_types[sys.intern(action_definition["type_name"])] = _freeze_attributes(
+                action_type
+            )
 
     def initialize_domain(self) -> None:
         """Load and process the domain(s) used in this adventure.
@@ -366,7 +657,9 @@ class AdventureIFInterpreter(GameResourceLocator):
 
         # check if action definition is file name string:
         if type(domain_def) == str:
-            domain_file = self.load_json(f"resources{os.sep}definitions{os.sep}{domain_def[:-5]}")
+            domain_file = self._load_definition(
+                f"resources{os.sep}definitions{os.sep}{domain_def[:-5]}"
+            )
             # domain_definitions += domain_file
             domain_definitions.append(domain_file)
         # check if room definition is direct dict:
@@ -405,23 +698,14 @@ class AdventureIFInterpreter(GameResourceLocator):
         for entity_type in self.domain["types"]["entity"]:
             if "traits" in self.entity_types[entity_type]:
                 for trait in self.entity_types[entity_type]["traits"]:
-                    if trait not in trait_type_dict:
-                        trait_type_dict[trait] = [entity_type]
-                    else:
-                        trait_type_dict[trait].append(entity_type)
-                    if trait not in self.domain["types"]:
-                        self.domain["types"][trait] = [entity_type]
-                    else:
-                        self.domain["types"][trait].append(entity_type)
+                    trait_type_dict.setdefault(trait, []).append(entity_type)
+                    self.domain["types"].setdefault(trait, []).append(entity_type)
 
         # REVERSE SUBTYPE/SUPERTYPE DICT
         supertype_dict = dict()
         for supertype, subtypes in self.domain["types"].items():
             for subtype in subtypes:
-                if subtype not in supertype_dict:
-                    supertype_dict[subtype] = [supertype]
-                else:
-                    supertype_dict[subtype].append(supertype)
+                supertype_dict.setdefault(subtype, []).append(supertype)
 
         self.domain["supertypes"] = supertype_dict
 
@@ -447,7 +731,7 @@ class AdventureIFInterpreter(GameResourceLocator):
         for event_def in self.game_instance[config.keys["event_definitions"]]:
             # check if event definition is file name string:
             if type(event_def) == str:
-                events_file = self.load_json(
+                events_file = self._load_definition(
                     f"resources{os.sep}definitions{os.sep}{event_def[:-5]}"
                 )
                 event_definitions += events_file
@@ -486,27 +770,34 @@ class AdventureIFInterpreter(GameResourceLocator):
         """
         act_grammar_rules = list()
         act_grammar_larks = list()
+        action_verbs = set(self.action_types)
 
         for action_type in self.action_types:
             cur_action_type = self.action_types[action_type]
             action_rule = cur_action_type["lark"].split(":")[0]
             act_grammar_rules.append(action_rule)
             act_grammar_larks.append(cur_action_type["lark"])
+            # collect verbs from the action's terminal lines, ie 'TAKE.1: ("take" | "get") WS':
+            for lark_line in cur_action_type["lark"].split("\n"):
+                if lark_line.split(":")[0].split(".")[0].isupper():
+                    for verb in _LARK_LITERAL_PATTERN.findall(lark_line):
+                        if verb.split():
+                            action_verbs.add(verb.split()[0])
+        self.action_verbs = frozenset(action_verbs)
         # root rule to parse any action command input, with fallback 'unknown':
         act_grammar_action_line = f"action: {' | '.join(act_grammar_rules)} | unknown\n"
         # append all individual action lark grammar snippets:
         act_grammar_larks_str = "\n".join(act_grammar_larks)
         # gather all possible adjectives from entity definitions:
         all_adjs = set()
-        for entity_type, entity_def in self.entity_types.items():
+        for entity_def in self.entity_types.values():
             if "possible_adjs" in entity_def:
-                new_adj_set = set(entity_def["possible_adjs"])
-                all_adjs.update(new_adj_set)
+                all_adjs.update(entity_def["possible_adjs"])
         all_adjs = [f'"{adj}"' for adj in all_adjs]
         # adjective rule:
         act_grammar_adj_line = f"ADJ.1: ({' | '.join(all_adjs)}) WS\n"
         # load the core grammar from file:
-        grammar_core = self.load_json(f"resources{os.sep}grammar_core")
+        grammar_core = self._load_definition(f"resources{os.sep}grammar_core")
         grammar_head = grammar_core["grammar_head"]
         grammar_foot = grammar_core["grammar_foot"]
         # combine adventure-specific grammar rules with core grammar:
@@ -517,8 +808,8 @@ class AdventureIFInterpreter(GameResourceLocator):
         # Log grammar in verbose mode for inspection:
         if print_lark_grammar:
             logger.debug("Action grammar:\n%s", act_grammar)
-        # initialize lark parser with the combined grammar:
-        self.act_parser = Lark(act_grammar, start="action")
+        # get lark parser for the combined grammar:
+        self.act_parser = _get_parser(act_grammar, "action")
 
     def initialize_states_from_strings(self) -> None:
         """Initialize world state and goal state from game instance data.
@@ -534,8 +825,11 @@ class AdventureIFInterpreter(GameResourceLocator):
         self.inst_to_type_dict, and self.room_to_type_dict.
         """
         # INITIAL STATE:
-        for fact_string in self.game_instance["initial_state"]:
-            self.world_state.add(fact_str_to_tuple(fact_string))
+        self.world_state.update(
+            map(self._intern_fact, fact_strs_to_tuples(self.game_instance["initial_state"]))
+        )
+        # index the initial facts by predicate; augmentations below keep the indexes in sync:
+        self._index_world_state()
 
         # NOTE: The following world state augmentations are left in here to make manual adventure creation/modification
         # convenient. Initial adventure world states generated with the clingo adventure generator already cover these
@@ -545,151 +839,245 @@ class AdventureIFInterpreter(GameResourceLocator):
         facts_to_add = set()
 
         # add trait facts for objects:
-        for fact in self.world_state:
-            if fact[0] == "type":
-                # logger.info({"type fact for trait assignment": fact})
-                # add trait facts by entity type:
-                if "traits" in self.entity_types[fact[2]]:
-                    type_traits: list = self.entity_types[fact[2]]["traits"]
-                    for type_trait in type_traits:
-                        facts_to_add.add((type_trait, fact[1]))
+        for fact in self._facts_by_pred("type"):
+            # add trait facts by entity type:
+            if "traits" in self.entity_types[fact[2]]:
+                type_traits: Tuple[str, ...] = self.entity_types[fact[2]]["traits"]
+                for type_trait in type_traits:
+                    facts_to_add.add((type_trait, fact[1]))
 
         # add floors to rooms:
-        for fact in self.world_state:
-            if fact[0] == "room":
-                facts_to_add.add(("type", f"{fact[1]}floor1", "floor"))
-                # add floor:
-                facts_to_add.add(("at", f"{fact[1]}floor1", fact[1]))
+        for fact in self._facts_by_pred("room"):
+            room_floor_id = floor_id(fact[1])
+            facts_to_add.add(("type", room_floor_id, "floor"))
+            # add floor:
+            facts_to_add.add(("at", room_floor_id, fact[1]))
 
-        self.world_state = self.world_state.union(facts_to_add)
+        self._update_world_state(_NO_FACTS, facts_to_add)
+        facts_to_add = set()
 
         # dict with the type for each entity instance in the adventure:
-        self.inst_to_type_dict = dict()
-        # get entity instance types from world state:
-        for fact in self.world_state:
-            # entity instance to entity type mapping:
-            if fact[0] == "type":
-                self.inst_to_type_dict[fact[1]] = fact[2]
-
+        self.inst_to_type_dict = {fact[1]: fact[2] for fact in self._facts_by_pred("type")}
         # dict with the type for each room instance in the adventure:
-        self.room_to_type_dict = dict()
-        # get room instance types from world state:
-        for fact in self.world_state:
-            # room instance to room type mapping:
-            if fact[0] == "room":
-                self.room_to_type_dict[fact[1]] = fact[2]
+        self.room_to_type_dict = {fact[1]: fact[2] for fact in self._facts_by_pred("room")}
 
         # put 'supported' items on the floor if they are not 'in' or 'on':
-        for fact in self.world_state:
-            if fact[1] in self.inst_to_type_dict:
-                if self.inst_to_type_dict[fact[1]] in self.entity_types:
-                    pass
-            if fact[0] == "at" and ("needs_support", fact[1]) in self.world_state:
-                currently_supported = False
-                for state_pred2 in self.world_state:
-                    if state_pred2[0] == "on" and state_pred2[1] == fact[1]:
-                        currently_supported = True
-                        break
-                    if state_pred2[0] == "in" and state_pred2[1] == fact[1]:
-                        currently_supported = True
-                        break
-                if not currently_supported:
-                    facts_to_add.add(("on", fact[1], f"{fact[2]}floor"))
+        for fact in self._facts_by_pred("needs_support"):
+            if self._facts_by_arg1("on", fact[1]) or self._facts_by_arg1("in", fact[1]):
+                continue
+            for at_fact in self._facts_by_arg1("at", fact[1]):
+                facts_to_add.add(("on", fact[1], f"{at_fact[2]}floor"))
 
         # make items that are not 'in' closed containers or 'in' inventory or 'on' supports 'accessible':
-        for fact in self.world_state:
-            if fact[1] in self.inst_to_type_dict:
-                if self.inst_to_type_dict[fact[1]] in self.entity_types:
-                    pass
-            if fact[0] == "in" and ("container", fact[2]) in self.world_state:
-                container_currently_open = False
-                for state_pred2 in self.world_state:
-                    if state_pred2[0] == "open" and state_pred2[1] == fact[2]:
-                        container_currently_open = True
-                        break
-                if container_currently_open:
-                    facts_to_add.add(("accessible", fact[1]))
-            if fact[0] == "in" and fact[2] == "inventory":
+        for fact in self._facts_by_pred("in"):
+            if fact[2] == "inventory" or (
+                ("container", fact[2]) in self.world_state and self._facts_by_arg1("open", fact[2])
+            ):
                 facts_to_add.add(("accessible", fact[1]))
-            if fact[0] == "on" and ("support", fact[2]) in self.world_state:
+        for fact in self._facts_by_pred("on"):
+            if ("support", fact[2]) in self.world_state:
                 facts_to_add.add(("accessible", fact[1]))
-            if (
-                fact[0] == "type"
-                and ("needs_support", fact[1]) not in self.world_state
-                and fact[2] not in tuple(config.entities["exempt_from_support"])
-            ):
+        exempt_from_support = config.entities["exempt_from_support"]
+        for fact in self._facts_by_pred("type"):
+            needs_support = ("needs_support", fact[1]) in self.world_state
+            if not needs_support and fact[2] not in exempt_from_support:
                 facts_to_add.add(("accessible", fact[1]))
         # make inventory 'accessible' from the start:
         facts_to_add.add(("accessible", config.entities["inventory_id"]))
 
-        self.world_state = self.world_state.union(facts_to_add)
+        self._update_world_state(_NO_FACTS, facts_to_add)
 
         # FUNCTIONS
         if "functions" in self.domain:
-            # logger.info(f"Domain functions: {self.domain['functions']}")
             # convert premade initial_state function fact string numbers to proper numbers:
             for function_def in self.domain["functions"]:
-                # logger.info(f"Checking domain function: {function_def}")
-                found_function_facts = list()
-                for fact in self.world_state:
-                    if fact[0] == function_def["function_def_predicate"]:
-                        found_function_facts.append(fact)
-                # logger.info(f"Found function facts: {found_function_facts}")
+                function_predicate = function_def["function_def_predicate"]
                 # remove non-number function facts and replace with number function facts:
-                for found_function_fact in found_function_facts:
-                    self.world_state.remove(found_function_fact)
+                for found_function_fact in list(self._facts_by_pred(function_predicate)):
+                    self._remove_fact(found_function_fact)
                     found_function_fact_list = list(found_function_fact)
                     if "." in found_function_fact_list[2]:
                         found_function_fact_list[2] = float(found_function_fact_list[2])
                     else:
                         found_function_fact_list[2] = int(found_function_fact_list[2])
-                    found_function_fact_tuple = tuple(found_function_fact_list)
-                    self.world_state.add(found_function_fact_tuple)
+                    self._add_fact(tuple(found_function_fact_list))
 
                 # add function facts with value 0 for defined functions in the domain for corresponding type instances:
-                for fact in self.world_state:
-                    # TODO?: use domain type inheritance to augment in addition to direct type?
-                    if fact[0] == "type" and fact[2] == function_def["function_def_type"]:
-                        augmentable_function_fact = [
-                            function_def["function_def_predicate"],
-                            fact[1],
-                            0,
-                        ]
-                        function_fact_already_exists = False
-                        for fact2 in self.world_state:
-                            if (
-                                fact2[0] == function_def["function_def_predicate"]
-                                and fact2[1] == fact[1]
-                            ):
-                                function_fact_already_exists = True
-                        if not function_fact_already_exists:
-                            self.world_state.add(tuple(augmentable_function_fact))
+                # TODO?: use domain type inheritance to augment in addition to direct type?
+                for fact in list(self._facts_by_arg2("type", function_def["function_def_type"])):
+                    if not self._facts_by_arg1(function_predicate, fact[1]):
+                        self._add_fact((function_predicate, fact[1], 0))
 
                 # add missing function fact(s) with value 0 for inventory as there is no type fact for inventory:
                 if function_def["function_def_type"] == config.entities["inventory_id"]:
-                    inventory_function_fact_already_exists = False
-                    for fact in self.world_state:
-                        if (
-                            fact[0] == function_def["function_def_predicate"]
-                            and fact[1] == config.entities["inventory_id"]
-                        ):
-                            inventory_function_fact_already_exists = True
-                    if not inventory_function_fact_already_exists:
-                        self.world_state.add(
-                            (
-                                function_def["function_def_predicate"],
-                                config.entities["inventory_id"],
-                                0,
-                            )
-                        )
+                    inventory_id = config.entities["inventory_id"]
+                    if not self._facts_by_arg1(function_predicate, inventory_id):
+                        self._add_fact((function_predicate, inventory_id, 0))
 
         # add initial world state to world state history:
-        self.world_state_history.append(deepcopy(self.world_state))
+        self.world_state_history.append(_WorldStateDiff(frozenset(self.world_state), _NO_FACTS))
+        self._added_since_commit.clear()
+        self._removed_since_commit.clear()
 
         # GOALS
-        # get goal state fact set:
-        for fact_string in self.game_instance[config.keys["goal_state"]]:
-            self.goal_state.add(fact_str_to_tuple(fact_string))
+        # get goal state fact set; goals are fixed for the whole episode:
+        goal_facts = fact_strs_to_tuples(self.game_instance[config.keys["goal_state"]])
+        self.goal_state = frozenset(map(self._intern_fact, goal_facts))
+        # TODO: expand to handle new-words goal tuples/any goal tuples
+        self.goal_entities = frozenset(
+            goal_arg for goal_fact in self.goal_state for goal_arg in goal_fact[1:3]
+        )
+        self.goal_fact_values = frozenset(itertools.chain.from_iterable(self.goal_state))
+
+    def _index_fact(self, fact: Tuple[Any, ...]) -> None:
+        """Add a fact to the predicate indexes.
+        Args:
+            fact: The fact tuple to index. Ex: ('at', 'apple1', 'kitchen1')
+        """
+        assert all(
+            isinstance(fact_value, _FACT_VALUE_TYPES) for fact_value in fact
+        ), f"Fact {fact} holds a mutable value"
+        self._by_pred.setdefault(fact[0], set()).add(fact)
+        self._by_pred_arg1.setdefault((fact[0], fact[1]), set()).add(fact)
+        if len(fact) > 2:
+            self._by_pred_arg2.setdefault((fact[0], fact[2]), set()).add(fact)
+
+    def _unindex_fact(self, fact: Tuple[Any, ...]) -> None:
+        """Remove a fact from the predicate indexes.
+        Args:
+            fact: The fact tuple to remove from the indexes.
+        """
+        self._by_pred[fact[0]].discard(fact)
+        self._by_pred_arg1[(fact[0], fact[1])].discard(fact)
+        if len(fact) > 2:
+            self._by_pred_arg2[(fact[0], fact[2])].discard(fact)
+        if fact[0] == "adj":
+            self._inst_str_cache.pop(fact[1], None)
+
+    def _index_world_state(self) -> None:
+        """Rebuild the predicate indexes from the full world state.
+        Must be called whenever self.world_state is replaced instead of mutated via _add_fact/_remove_fact.
+        """
+        self._by_pred = dict()
+        self._by_pred_arg1 = dict()
+        self._by_pred_arg2 = dict()
+        self._inst_str_cache = dict()
+        self._visible_contents = None
+        for fact in self.world_state:
+            self._index_fact(fact)
+
+    def _intern_fact(self, fact: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """Get the canonical tuple object for a fact.
+        Args:
+            fact: The fact tuple.
+        Returns:
+            The first equal fact tuple passed to this method.
+        """
+        return self._fact_intern.setdefault(fact, fact)
+
+    def _add_fact(self, fact: Tuple[Any, ...]) -> None:
+        """Add a fact to the world state and the predicate indexes.
+        Args:
+            fact: The fact tuple to add.
+        """
+        if fact not in self.world_state:
+            fact = self._intern_fact(fact)
+            self.world_state.add(fact)
+            self._index_fact(fact)
+            if fact in self._removed_since_commit:
+                self._removed_since_commit.remove(fact)
+            else:
+                self._added_since_commit.add(fact)
+            self._visible_contents = None
+            if fact[0] == "adj":
+                self._inst_str_cache.pop(fact[1], None)
+
+    def _remove_fact(self, fact: Tuple[Any, ...]) -> None:
+        """Remove a fact from the world state and the predicate indexes.
+        Args:
+            fact: The fact tuple to remove. Must be in the world state.
+        """
+        self.world_state.remove(fact)
+        if fact in self._added_since_commit:
+            self._added_since_commit.remove(fact)
+        else:
+            self._removed_since_commit.add(fact)
+        self._visible_contents = None
+        self._unindex_fact(fact)
+
+    def _update_world_state(self, facts_to_remove: Set[Any], facts_to_add: Set[Any]) -> None:
+        """Remove and then add batches of facts with single set operations, updating the indexes.
+        Unlike _add_fact/_remove_fact, the changes are not recorded for the world state history.
+        Args:
+            facts_to_remove: Fact tuples to remove; facts not in the world state are ignored.
+            facts_to_add: Fact tuples to add; facts already in the world state are ignored.
+        """
+        removed_facts = self.world_state.intersection(facts_to_remove)
+        self.world_state -= removed_facts
+        for fact in removed_facts:
+            self._unindex_fact(fact)
+        added_facts = {
+            self._intern_fact(fact) for fact in facts_to_add if fact not in self.world_state
+        }
+        self.world_state |= added_facts
+        for fact in added_facts:
+            self._index_fact(fact)
+            if fact[0] == "adj":
+                self._inst_str_cache.pop(fact[1], None)
+        self._visible_contents = None
+
+    def _commit_world_state_diff(self) -> _WorldStateDiff:
+        """Record the world state changes since the last world state history entry.
+        Returns:
+            The recorded world state diff.
+        """
+        world_state_diff = _WorldStateDiff(
+            frozenset(self._added_since_commit), frozenset(self._removed_since_commit)
+        )
+        self.world_state_history.append(world_state_diff)
+        self._added_since_commit.clear()
+        self._removed_since_commit.clear()
+        return world_state_diff
+
+    def _revert_world_state_diffs(self, diff_count: int) -> None:
+        """Revert the world state in place by the last world state history entries.
+        Uncommitted changes since the last entry are reverted as well.
+        Args:
+            diff_count: Number of world state history entries to revert and drop.
+        """
+        self._update_world_state(self._added_since_commit, self._removed_since_commit)
+        self._added_since_commit.clear()
+        self._removed_since_commit.clear()
+        for _ in range(diff_count):
+            world_state_diff = self.world_state_history.pop()
+            self._update_world_state(world_state_diff.added, world_state_diff.removed)
+
+    def get_world_state_at(self, history_idx: int) -> Set[Tuple[Any, ...]]:
+        """Reconstruct a prior world state by folding world state history diffs back.
+        Args:
+            history_idx: Index of the world state history entry after which to get the world state.
+        Returns:
+            The world state set at that point of the history.
+        """
+        history_idx %= len(self.world_state_history)
+        world_state = self.world_state - self._added_since_commit
+        world_state |= self._removed_since_commit
+        for world_state_diff in reversed(self.world_state_history[history_idx + 1 :]):
+            world_state -= world_state_diff.added
+            world_state |= world_state_diff.removed
+        return world_state
+
+    def _facts_by_pred(self, predicate: str):
+        """Get all world state facts with the given predicate."""
+        return self._by_pred.get(predicate, _NO_FACTS)
+
+    def _facts_by_arg1(self, predicate: str, arg1: Any):
+        """Get all world state facts with the given predicate and first argument."""
+        return self._by_pred_arg1.get((predicate, arg1), _NO_FACTS)
+
+    def _facts_by_arg2(self, predicate: str, arg2: Any):
+        """Get all world state facts with the given predicate and second argument."""
+        return self._by_pred_arg2.get((predicate, arg2), _NO_FACTS)
 
     def _get_inst_str(self, inst) -> str:
         """
@@ -700,11 +1088,11 @@ class AdventureIFInterpreter(GameResourceLocator):
         Returns:
             Full surface string representation of the object instance. Ex: 'red apple', 'living room'
         """
-        inst_adjs = list()
+        if inst in self._inst_str_cache:
+            return self._inst_str_cache[inst]
+
         # get instance adjectives from adj facts:
-        for fact in self.world_state:
-            if fact[0] == "adj" and fact[1] == inst:
-                inst_adjs.append(fact[2])
+        inst_adjs = [fact[2] for fact in self._facts_by_arg1("adj", inst)]
 
         # get type of instance:
         inst_type = self._inst_to_type(inst)
@@ -720,6 +1108,7 @@ class AdventureIFInterpreter(GameResourceLocator):
         # combine into full surface string:
         inst_adjs.append(inst_str)
         adj_str = " ".join(inst_adjs)
+        self._inst_str_cache[inst] = adj_str
 
         return adj_str
 
@@ -741,13 +1130,14 @@ class AdventureIFInterpreter(GameResourceLocator):
             # that may not be registered in type dictionaries. Common in procedural
             # adventure generation where entity instances are created on-the-fly.
             logger.info(
-                f"_inst_to_type got {inst}, which is not in the _to_type dicts! "
-                f"Heuristically culling numbers from inst string end as fallback..."
+                "_inst_to_type got %s, which is not in the _to_type dicts! "
+                "Heuristically culling numbers from inst string end as fallback...",
+                inst,
             )
             inst_type = deepcopy(inst)
             while inst_type.endswith(("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")):
                 inst_type = inst_type[:-1]
-            logger.info(f"inst_type after heuristic culling: {inst_type}")
+            logger.info("inst_type after heuristic culling: %s", inst_type)
 
         return inst_type
 
@@ -756,10 +1146,9 @@ class AdventureIFInterpreter(GameResourceLocator):
         Get the current player location's internal room string ID.
         """
         player_room: str = ""
-        for fact in self.world_state:
-            if fact[0] == "at" and fact[1] == "player1":
-                player_room = fact[2]
-                break
+        for fact in self._facts_by_arg1("at", "player1"):
+            player_room = fact[2]
+            break
 
         return player_room
 
@@ -769,9 +1158,9 @@ class AdventureIFInterpreter(GameResourceLocator):
         """
         player_room = self.get_player_room()
         room_contents = list()
-        for fact in self.world_state:
+        for fact in self._facts_by_arg2("at", player_room):
             # get all entities 'at' the player's location, except the player themselves:
-            if fact[0] == "at" and fact[2] == player_room and not fact[1] == "player1":
+            if not fact[1] == "player1":
                 room_contents.append(fact[1])
 
         return room_contents
@@ -782,7 +1171,11 @@ class AdventureIFInterpreter(GameResourceLocator):
         Entities 'in' closed entities are not returned.
         In v2, this is NO LONGER used to determine if an entity is accessible for interaction - this is handled via PDDL
         action definition now.
+        The result is kept until the world state changes.
         """
+        if self._visible_contents is not None:
+            return list(self._visible_contents)
+
         room_contents = self.get_player_room_contents()
         visible_contents = list()
         for thing in room_contents:
@@ -792,41 +1185,31 @@ class AdventureIFInterpreter(GameResourceLocator):
 
             # do not access entities inside closed containers:
             contained_in = None
-            for fact in self.world_state:
-                # check if entity is 'in' closed container:
-                if fact[0] == "in" and fact[1] == thing:
-                    contained_in = fact[2]
-                    for state_pred2 in self.world_state:
-                        if state_pred2[1] == contained_in:
-                            if state_pred2[0] == "closed":
-                                # not visible/accessible in closed container
-                                break
-                            elif state_pred2[0] == "open":
-                                visible_contents.append(thing)
-                                break
-                            elif state_pred2[1] == "inventory":
-                                # inventory content is not visible
-                                break
-                            else:
-                                visible_contents.append(thing)
-                                break
+            for fact in self._facts_by_arg1("in", thing):
+                contained_in = fact[2]
+                if contained_in == "inventory":
+                    # inventory content is not visible
+                    continue
+                if ("closed", contained_in) in self.world_state:
+                    # not visible/accessible in closed container
+                    continue
+                visible_contents.append(thing)
 
             if contained_in:
                 continue
             visible_contents.append(thing)
 
-        return visible_contents
+        self._visible_contents = visible_contents
+
+        return list(visible_contents)
 
     def get_player_room_exits(self) -> List:
         """
         Get all passages in the current room.
         """
         player_room = self.get_player_room()
-        room_exits = list()
-        for fact in self.world_state:
-            # passage facts are 'exit' in the adventure/instance format
-            if fact[0] == "exit" and fact[1] == player_room:
-                room_exits.append(fact[2])
+        # passage facts are 'exit' in the adventure/instance format
+        room_exits = [fact[2] for fact in self._facts_by_arg1("exit", player_room)]
 
         return room_exits
 
@@ -839,7 +1222,7 @@ class AdventureIFInterpreter(GameResourceLocator):
         # create room description start:
         room_repr_str = self.room_types[self.room_to_type_dict[player_room]]["repr_str"]
         # using simple type surface string due to v1 not having multiple rooms of the same type:
-        player_at_str = config.messages["room_description_template"].format(
+        player_at_str = config.messages_ns.room_description_template.format(
             room_repr_str=room_repr_str
         )
 
@@ -849,79 +1232,57 @@ class AdventureIFInterpreter(GameResourceLocator):
         # convert to types:
         visible_contents = [self._get_inst_str(instance) for instance in internal_visible_contents]
 
+        # description sentences, joined with single spaces at the end:
+        room_desc_parts = [player_at_str]
+
         # create visible room content description:
-        visible_contents_str = str()
         if len(visible_contents) >= 3:
-            comma_list = f"{config.delimiters['list_separator']}".join(visible_contents[:-1])
+            comma_list = config.delimiters["list_separator"].join(visible_contents[:-1])
             and_last = f"{config.delimiters['list_last_conjunction']}{visible_contents[-1]}"
-            items_str = f"{comma_list} {and_last}"
-            visible_contents_str = config.messages["multi_item_description"].format(items=items_str)
-            visible_contents_str = " " + visible_contents_str
+            room_desc_parts.append(
+                config.messages_ns.multi_item_description.format(items=f"{comma_list} {and_last}")
+            )
         elif len(visible_contents) == 2:
-            visible_contents_str = config.messages["two_item_description"].format(
-                item1=visible_contents[0], item2=visible_contents[1]
+            room_desc_parts.append(
+                config.messages_ns.two_item_description.format(
+                    item1=visible_contents[0], item2=visible_contents[1]
+                )
             )
-            visible_contents_str = " " + visible_contents_str
         elif len(visible_contents) == 1:
-            visible_contents_str = config.messages["single_item_description"].format(
-                item=visible_contents[0]
+            room_desc_parts.append(
+                config.messages_ns.single_item_description.format(item=visible_contents[0])
             )
-            visible_contents_str = " " + visible_contents_str
 
         # get predicate state facts of visible objects and create textual representations:
         # NOTE: Future enhancement - extract state description templates to config
         # for localization support (see config.messages for existing templates)
-        visible_content_state_strs = list()
-        for thing in internal_visible_contents:
-            for fact in self.world_state:
-                if fact[0] == "closed" and fact[1] == thing:
-                    visible_content_state_strs.append(f"The {self._get_inst_str(thing)} is closed.")
-                elif fact[0] == "open" and fact[1] == thing:
-                    visible_content_state_strs.append(f"The {self._get_inst_str(thing)} is open.")
-                if fact[0] == "in" and fact[1] == thing:
-                    visible_content_state_strs.append(
-                        f"The {self._get_inst_str(thing)} is in the {self._get_inst_str(fact[2])}."
-                    )
-                if fact[0] == "on" and fact[1] == thing:
-                    visible_content_state_strs.append(
-                        f"The {self._get_inst_str(thing)} is on the {self._get_inst_str(fact[2])}."
-                    )
-
-        if visible_content_state_strs:
-            visible_content_state_combined = " ".join(visible_content_state_strs)
-            visible_content_state_combined = " " + visible_content_state_combined
-        else:
-            visible_content_state_combined = str()
+        for thing, thing_str in zip(internal_visible_contents, visible_contents):
+            if ("closed", thing) in self.world_state:
+                room_desc_parts.append(f"The {thing_str} is closed.")
+            if ("open", thing) in self.world_state:
+                room_desc_parts.append(f"The {thing_str} is open.")
+            for fact in self._facts_by_arg1("in", thing):
+                room_desc_parts.append(f"The {thing_str} is in the {self._get_inst_str(fact[2])}.")
+            for fact in self._facts_by_arg1("on", thing):
+                room_desc_parts.append(f"The {thing_str} is on the {self._get_inst_str(fact[2])}.")
 
         # get room passages and create textual representation:
-        room_exits = self.get_player_room_exits()
-        exits_str = str()
-        if len(room_exits) == 1:
-            exits_str = f" There is a passage to a {self._get_inst_str(room_exits[0])} here."
-        elif len(room_exits) == 2:
-            exits_str = (
-                f" There are passages to a {self._get_inst_str(room_exits[0])} and a "
-                f"{self._get_inst_str(room_exits[1])} here."
-            )
-        elif len(room_exits) >= 3:
-            comma_exits = ", a ".join(
-                [self._get_inst_str(room_exit) for room_exit in room_exits[:-1]]
+        exit_strs = [self._get_inst_str(room_exit) for room_exit in self.get_player_room_exits()]
+        if len(exit_strs) == 1:
+            room_desc_parts.append(f"There is a passage to a {exit_strs[0]} here.")
+        elif len(exit_strs) >= 2:
+            room_desc_parts.append(
+                f"There are passages to a {', a '.join(exit_strs[:-1])} and a {exit_strs[-1]} here."
             )
-            exits_str = f" There are passages to a {comma_exits} and a {self._get_inst_str(room_exits[-1])} here."
 
         # combine full room description:
-        room_description = (
-            f"{player_at_str}{visible_contents_str}{visible_content_state_combined}{exits_str}"
-        )
+        room_description = " ".join(room_desc_parts)
 
         return room_description
 
     def get_inventory_content(self) -> list:
         """Get list of inventroy content."""
-        inventory_content = list()
-        for fact in self.world_state:
-            if fact[0] == "in" and fact[2] == "inventory":
-                inventory_content.append(fact[1])
+        inventory_content = [fact[1] for fact in self._facts_by_arg2("in", "inventory")]
 
         return inventory_content
 
@@ -934,7 +1295,7 @@ class AdventureIFInterpreter(GameResourceLocator):
         inv_item_cnt = len(inv_list)
         inv_desc: str
         if inv_item_cnt == 0:
-            inv_desc = str(config.messages["empty_inventory"])
+            inv_desc = str(config.messages_ns.empty_inventory)
             return inv_desc
         elif inv_item_cnt == 1:
             inv_str = f"a {self._get_inst_str(inv_list[0])}"
@@ -942,15 +1303,12 @@ class AdventureIFInterpreter(GameResourceLocator):
             inv_strs = [f"a {self._get_inst_str(inv_item)}" for inv_item in inv_list]
             inv_str = ", ".join(inv_strs[:-1])
             inv_str += f" and {inv_strs[-1]}"
-        inv_desc = str(config.messages["inventory_description"].format(items=inv_str))
+        inv_desc = str(config.messages_ns.inventory_description.format(items=inv_str))
 
         return inv_desc
 
     def get_container_content(self, container_id) -> list:
-        container_content = list()
-        for fact in self.world_state:
-            if fact[0] == "in" and fact[2] == container_id:
-                container_content.append(fact[1])
+        container_content = [fact[1] for fact in self._facts_by_arg2("in", container_id)]
 
         return container_content
 
@@ -984,9 +1342,8 @@ class AdventureIFInterpreter(GameResourceLocator):
         Returns:
             Entity ID string
         """
-        for fact in self.world_state:
-            if fact[0] == "type" and fact[2] == entity:
-                return str(fact[1])
+        for fact in self._facts_by_arg2("type", entity):
+            return str(fact[1])
         return ""
 
     def _strip_entity_id_suffix(self, entity_id: str) -> str:
@@ -999,17 +1356,10 @@ class AdventureIFInterpreter(GameResourceLocator):
     def _describe_container_contents(self, entity_id: str, container_entity: str) -> str:
         """Generate description of container contents."""
         contained_entities = []
-        for fact in self.world_state:
-            if (
-                len(fact) == 3
-                and fact[2] == entity_id
-                and fact[0] == config.predicates["predicate_in"]
-            ):
-                if ("accessible", fact[1]) in self.world_state:
-                    contained_entity = self._strip_entity_id_suffix(fact[1])
-                    contained_entities.append(
-                        f"a {self.entity_types[contained_entity]['repr_str']}"
-                    )
+        for fact in self._facts_by_arg2(config.predicates["predicate_in"], entity_id):
+            if ("accessible", fact[1]) in self.world_state:
+                contained_entity = self._strip_entity_id_suffix(fact[1])
+                contained_entities.append(f"a {self.entity_types[contained_entity]['repr_str']}")
 
         if ("closed", entity_id) in self.world_state:
             return f"You can't see the {self.entity_types[container_entity]['repr_str']}'s contents because it is closed."
@@ -1026,14 +1376,9 @@ class AdventureIFInterpreter(GameResourceLocator):
     def _describe_support_contents(self, entity_id: str, support_entity: str) -> str:
         """Generate description of entities on support surface."""
         supported_entities = []
-        for fact in self.world_state:
-            if (
-                len(fact) == 3
-                and fact[2] == entity_id
-                and fact[0] == config.predicates["predicate_on"]
-            ):
-                supported_entity = self._strip_entity_id_suffix(fact[1])
-                supported_entities.append(f"a {self.entity_types[supported_entity]['repr_str']}")
+        for fact in self._facts_by_arg2(config.predicates["predicate_on"], entity_id):
+            supported_entity = self._strip_entity_id_suffix(fact[1])
+            supported_entities.append(f"a {self.entity_types[supported_entity]['repr_str']}")
 
         if len(supported_entities) == 0:
             return f"There is nothing on the {self.entity_types[support_entity]['repr_str']}."
@@ -1076,9 +1421,9 @@ class AdventureIFInterpreter(GameResourceLocator):
                 openable_entity = self._strip_entity_id_suffix(fact[1])
                 openable_state = next(
                     (
-                        f[0]
-                        for f in self.world_state
-                        if f[1] == entity_id and f[0] in ("open", "closed")
+                        state
+                        for state in ("open", "closed")
+                        if (state, entity_id) in self.world_state
                     ),
                     "unknown",
                 )
@@ -1097,7 +1442,9 @@ class AdventureIFInterpreter(GameResourceLocator):
             elif fact[0] == config.predicates["needs_support"]:
                 needs_support_entity = self._strip_entity_id_suffix(fact[1])
                 support_fact = next(
-                    (f for f in self.world_state if f[1] == entity_id and f[0] in ("on", "in")),
+                    itertools.chain(
+                        self._facts_by_arg1("on", entity_id), self._facts_by_arg1("in", entity_id)
+                    ),
                     None,
                 )
                 if support_fact:
@@ -1149,17 +1496,14 @@ class AdventureIFInterpreter(GameResourceLocator):
         # get entity ID:
         # NOTE: This assumes only one instance of any entity type is in any adventure!
         entity_id = str()
-        for fact in self.world_state:
-            if fact[0] == "type" and fact[2] == entity:
-                entity_id = fact[1]
-                break
+        for fact in self._facts_by_arg2("type", entity):
+            entity_id = fact[1]
+            break
 
         # get entity's text fact:
-        for fact in self.world_state:
-            if fact[1] == entity_id:
-                # return text fact content:
-                if fact[0] == config.predicates["text"]:
-                    return str(fact[2])
+        for fact in self._facts_by_arg1(config.predicates["text"], entity_id):
+            # return text fact content:
+            return str(fact[2])
 
         # Return empty string if no text fact is found
         return ""
@@ -1168,29 +1512,23 @@ class AdventureIFInterpreter(GameResourceLocator):
         current_perceived: set = set()
 
         # get player room at fact
-        for fact in self.world_state:
-            if fact[0] == "at" and fact[1] == config.entities["player_id"]:
-                current_perceived.add(fact)
+        current_perceived.update(self._facts_by_arg1("at", config.entities["player_id"]))
 
-        visible_room_contents = self.get_player_room_contents_visible()
-        for fact in self.world_state:
-            if fact[1] in visible_room_contents and fact[0] in self.domain["mutable_states"]:
-                current_perceived.add(fact)
+        visible_room_contents = set(self.get_player_room_contents_visible())
+        for mutable_state in set(self.domain["mutable_states"]):
+            for fact in self._facts_by_pred(mutable_state):
+                if fact[1] in visible_room_contents:
+                    current_perceived.add(fact)
 
         inventory_content = self.get_inventory_content()
-        for fact in self.world_state:
-            if fact[1] in inventory_content and fact[0] in ("at", "in"):
-                current_perceived.add(fact)
-            if (
-                fact[1] == config.entities["inventory_id"] and fact[0] == "itemcount"
-            ):  # TODO: de-hardcode this
-                current_perceived.add(fact)
+        for inventory_item in inventory_content:
+            current_perceived.update(self._facts_by_arg1("at", inventory_item))
+            current_perceived.update(self._facts_by_arg1("in", inventory_item))
+        # TODO: de-hardcode this
+        current_perceived.update(self._facts_by_arg1("itemcount", config.entities["inventory_id"]))
 
         # current_room_exits = self.get_player_room_exits()
-        for fact in self.world_state:
-            # if fact[0] == "exit" and fact[1] in current_room_exits:
-            if fact[0] == "exit" and fact[1] == self.get_player_room():
-                current_perceived.add(fact)
+        current_perceived.update(self._facts_by_arg1("exit", self.get_player_room()))
 
         # logger.info(f"current_perceived: {current_perceived}")
 
@@ -1209,24 +1547,15 @@ class AdventureIFInterpreter(GameResourceLocator):
             prior_known: set = self.exploration_history[-1]
             # logger.info(f"prior_known: {prior_known}")
 
-            # changes:
-            current_set_difference = current_perceived.difference(prior_known)  # newly perceived
+            # newly perceived:
+            current_set_difference = current_perceived.difference(prior_known)
             # logger.info(f"current_set_difference: {current_set_difference}")
-            prior_set_difference = prior_known.difference(current_perceived)  # perceived before
-            # logger.info(f"prior_set_difference: {prior_set_difference}")
-
-            # not changed:
-            current_set_intersect = current_perceived.intersection(prior_known)
-            # logger.info(f"current_set_intersect: {current_set_intersect}")
 
             # logger.info(f"Exploration state before update: {self.exploration_state}")
+            # a new set, as the initial exploration history entry is the initial exploration state:
             self.exploration_state = self.exploration_state.union(current_set_difference)
-            # self.exploration_state = self.exploration_state.union(current_set_difference).difference(prior_set_difference)
             # logger.info(f"Exploration state after update: {self.exploration_state}")
 
-            new_exploration_state_difference = self.exploration_state.difference(prior_known)
-            # logger.info(f"new_exploration_state_difference: {new_exploration_state_difference}")
-
             # logger.info(f"Action resolution world_state_effects: {world_state_effects}")
             """
             for added_fact in world_state_effects['added']:
@@ -1245,14 +1574,11 @@ class AdventureIFInterpreter(GameResourceLocator):
             # set operations would
             if world_state_effects:
                 for removed_fact in world_state_effects["removed"]:
-                    if removed_fact in self.exploration_state:
-                        # logger.info(f"Removing fact {removed_fact} from exploration state.")
-                        self.exploration_state.remove(removed_fact)
-                        # logger.info(f"Fact {removed_fact} in exploration state: {removed_fact in self.exploration_state}")
+                    self.exploration_state.discard(removed_fact)
 
             # logger.info(f"Current exploration_state: {self.exploration_state}")
             # record current exploration state:
-            self.exploration_history.append(deepcopy(self.exploration_state))
+            self.exploration_history.append(self.exploration_state.copy())
             # logger.info(f"Current exploration_history: {self.exploration_history}")
 
         # record initial exploration state:
@@ -1288,130 +1614,146 @@ class AdventureIFInterpreter(GameResourceLocator):
             >>> if success:
             ...     print(action_dict)  # {"type": "take", "arg1": "apple"}
         """
-        # remove final punctuation:
-        if action_input.endswith(".") or action_input.endswith("!"):
-            action_input = action_input[:-1]
-        # lower for proper parsing:
-        action_input = action_input.lower()
+        # remove final punctuation and lower for proper parsing:
+        action_input = action_input.rstrip(".!?").lower()
 
-        logger.info(f"Cleaned action input: {action_input}")
+        logger.info("Cleaned action input: %s", action_input)
+
+        # every action rule starts with a verb, so plain words without one can only parse as 'unknown':
+        if _WORDS_ONLY_PATTERN.fullmatch(action_input):
+            first_word = _FIRST_WORD_PATTERN.match(action_input).group()
+            if first_word not in self.action_verbs:
+                logger.info("Parsing undefined action with undefined verb")
+                fail_dict: Dict[str, str] = {
+                    "phase": "parsing",
+                    "fail_type": "undefined_action_verb",
+                    "arg": first_word,
+                }
+                return (
+                    False,
+                    config.messages_ns.undefined_action.format(action=first_word),
+                    fail_dict,
+                )
 
         # try parsing input, return lark_exception failure if parsing fails:
         try:
             parsed_command = self.act_parser.parse(action_input)
         except lark.exceptions.LarkError as exception:
             logger.error("Failed to parse action input '%s': %s", action_input, exception)
-            fail_dict: Dict[str, str] = {
+            fail_dict = {
                 "phase": "parsing",
                 "fail_type": "lark_exception",
                 "arg": str(exception),
             }
-            return False, config.messages["unknown_command"], fail_dict
+            return False, config.messages_ns.unknown_command, fail_dict
         action_dict = self.act_transformer.transform(parsed_command)
+        action_type = action_dict["type"]
+        arg1 = action_dict.get("arg1")
+        arg2 = action_dict.get("arg2")
 
         # catch 'unknown' action parses:
-        if action_dict["type"] == config.actions["unknown"]:
-            if action_dict["arg1"] in self.action_types:
-                logger.info(f"Parsing unknown action with defined verb")
-                logger.info(f"{action_dict}")
+        if action_type == config.actions["unknown"]:
+            if arg1 in self.action_types:
+                logger.info("Parsing unknown action with defined verb")
+                logger.info("%s", action_dict)
                 fail_dict = {
                     "phase": "parsing",
                     "fail_type": "malformed_command",
                     "arg": str(action_dict),
                 }
-                return False, config.messages["unknown_command"], fail_dict
+                return False, config.messages_ns.unknown_command, fail_dict
 
-        if action_dict["type"] not in self.action_types:
-            if "arg1" in action_dict:
-                logger.info(f"Parsing undefined action with undefined verb")
+        if action_type not in self.action_types:
+            if arg1 is not None:
+                logger.info("Parsing undefined action with undefined verb")
                 fail_dict = {
                     "phase": "parsing",
                     "fail_type": "undefined_action_verb",
-                    "arg": action_dict["arg1"],
+                    "arg": arg1,
                 }
                 return (
                     False,
-                    config.messages["undefined_action"].format(action=action_dict["arg1"]),
+                    config.messages_ns.undefined_action.format(action=arg1),
                     fail_dict,
                 )
             else:
-                logger.info(f"Parsing undefined action without verb")
+                logger.info("Parsing undefined action without verb")
                 fail_dict = {
                     "phase": "parsing",
                     "fail_type": "undefined_action",
                     "arg": action_input,
                 }
-                return False, config.messages["unknown_command"], fail_dict
+                return False, config.messages_ns.unknown_command, fail_dict
 
-        logger.info(f"current parsed action_dict: {action_dict}")
+        logger.info("current parsed action_dict: %s", action_dict)
 
-        if action_dict["type"] == config.actions["done"]:
+        if action_type == config.actions["done"]:
             return True, action_dict, {}
 
-        if "arg1" in action_dict:
-            if action_dict["arg1"] in self.repr_str_to_type_dict:
-                # convert arg1 from repr to internal type:
-                action_dict["arg1"] = self.repr_str_to_type_dict[action_dict["arg1"]]
-            else:
+        if arg1 is not None:
+            arg1_type = self.repr_str_to_type_dict.get(arg1)
+            if arg1_type is None:
                 # in this case, the action is defined, but the first argument isn't, leading to corresponding feedback
                 fail_dict = {
                     "phase": "parsing",
                     "fail_type": "undefined_repr_str",
-                    "arg": action_dict["arg1"],
+                    "arg": arg1,
                 }
                 return (
                     False,
-                    config.messages["unknown_entity"].format(arg=action_dict["arg1"]),
+                    config.messages_ns.unknown_entity.format(arg=arg1),
                     fail_dict,
                 )
+            # convert arg1 from repr to internal type:
+            arg1 = action_dict["arg1"] = arg1_type
 
             # TODO?: Remove action-type specific hardcode below?; should be handled by PDDL-based resolution now
 
-            if action_dict["arg1"] not in self.entity_types:
-                logger.info(f"Action arg1 '{action_dict['arg1']}' is not an entity")
+            if arg1 not in self.entity_types:
+                logger.info("Action arg1 '%s' is not an entity", arg1)
                 # handle manipulating rooms, ie "> take from kitchen":
-                if action_dict["arg1"] in self.room_types:
-                    if action_dict["type"] in ["take", "put", "open", "close"]:
-                        logger.info(f"Action type is '{action_dict['type']}', manipulating room")
+                if arg1 in self.room_types:
+                    if action_type in ["take", "put", "open", "close"]:
+                        logger.info("Action type is '%s', manipulating room", action_type)
                         fail_dict = {
                             "phase": "parsing",
                             "fail_type": "manipulating_room",
-                            "arg": action_dict["arg1"],
+                            "arg": arg1,
                         }
-                        if action_dict["type"] == "take":
-                            fail_response = config.messages["cannot_take"].format(
-                                action=action_dict["type"], arg=action_dict["arg1"]
+                        if action_type == "take":
+                            fail_response = config.messages_ns.cannot_take.format(
+                                action=action_type, arg=arg1
                             )
-                        elif action_dict["type"] == "put":
-                            fail_response = config.messages["cannot_put"].format(
-                                action=action_dict["type"], arg=action_dict["arg1"]
+                        elif action_type == "put":
+                            fail_response = config.messages_ns.cannot_put.format(
+                                action=action_type, arg=arg1
                             )
-                        elif action_dict["type"] == "open":
-                            fail_response = config.messages["no_need_open"].format(
-                                action=action_dict["type"], arg=action_dict["arg1"]
+                        elif action_type == "open":
+                            fail_response = config.messages_ns.no_need_open.format(
+                                action=action_type, arg=arg1
                             )
-                        elif action_dict["type"] == "close":
-                            fail_response = config.messages["cannot_close"].format(
-                                action=action_dict["type"], arg=action_dict["arg1"]
+                        elif action_type == "close":
+                            fail_response = config.messages_ns.cannot_close.format(
+                                action=action_type, arg=arg1
                             )
                         return False, fail_response, fail_dict
                 else:
-                    logger.info(f"Action arg1 {action_dict['arg1']} is not a room either")
+                    logger.info("Action arg1 %s is not a room either", arg1)
                     fail_dict = {
                         "phase": "parsing",
                         "fail_type": "undefined_argument_type",
-                        "arg": action_dict["arg1"],
+                        "arg": arg1,
                     }
                     return (
                         False,
-                        config.messages["unknown_item_type"].format(arg=action_dict["arg1"]),
+                        config.messages_ns.unknown_item_type.format(arg=arg1),
                         fail_dict,
                     )
 
-        if "arg2" in action_dict:
-            if action_dict["type"] == "take":
+        if arg2 is not None:
+            if action_type == "take":
                 # handle unnecessary inventory interaction:
-                if action_dict["arg2"] == config.entities["inventory_id"]:
+                if arg2 == config.entities["inventory_id"]:
                     # TODO: remove 'taking from inventory', now handled via PDDL precondition
                     #  but PDDL handling does it via precondition (not (in <item> inventory)), not by checking for the
                     #  second argument, so check if this handling here might still be useful
@@ -1419,55 +1761,55 @@ class AdventureIFInterpreter(GameResourceLocator):
                     # get inventory content:
                     inventory_content = self.get_inventory_content()
                     for inventory_item in inventory_content:
-                        if self.inst_to_type_dict[inventory_item] == action_dict["arg1"]:
+                        if self.inst_to_type_dict[inventory_item] == arg1:
                             fail_dict = {
                                 "phase": "resolution",
                                 "fail_type": "taking_from_inventory",
-                                "arg": action_dict["arg1"],
+                                "arg": arg1,
                             }
                             return (
                                 False,
-                                config.messages["already_in_inventory"].format(
-                                    item=self.entity_types[action_dict["arg1"]]["repr_str"]
+                                config.messages_ns.already_in_inventory.format(
+                                    item=self.entity_types[arg1]["repr_str"]
                                 ),
                                 fail_dict,
                             )
                     fail_dict = {
                         "phase": "parsing",
                         "fail_type": "taking_from_inventory",
-                        "arg": action_dict["arg2"],
+                        "arg": arg2,
                     }
-                    return False, config.messages["cannot_take_from_inventory"], fail_dict
-            if action_dict["arg2"] in self.repr_str_to_type_dict:
-                # convert arg1 from repr to internal type:
-                action_dict["arg2"] = self.repr_str_to_type_dict[action_dict["arg2"]]
-                # handle other room interaction attempts; ie "> take plate from kitchen" while player is elsewhere:
-                if action_dict["arg2"] in self.room_types:
-                    cur_room_str = self.room_types[self.room_to_type_dict[self.get_player_room()]][
-                        "repr_str"
-                    ]
-                    if not action_dict["arg2"] == cur_room_str:
-                        fail_dict = {
-                            "phase": "parsing",
-                            "fail_type": "other_room_argument",
-                            "arg": action_dict["arg2"],
-                        }
-                        return (
-                            False,
-                            config.messages["not_in_room"].format(room=action_dict["arg2"]),
-                            fail_dict,
-                        )
-            else:
+                    return False, config.messages_ns.cannot_take_from_inventory, fail_dict
+            arg2_type = self.repr_str_to_type_dict.get(arg2)
+            if arg2_type is None:
                 fail_dict = {
                     "phase": "parsing",
                     "fail_type": "undefined_repr_str",
-                    "arg": action_dict["arg2"],
+                    "arg": arg2,
                 }
                 return (
                     False,
-                    config.messages["unknown_entity"].format(arg=action_dict["arg2"]),
+                    config.messages_ns.unknown_entity.format(arg=arg2),
                     fail_dict,
                 )
+            # convert arg2 from repr to internal type:
+            arg2 = action_dict["arg2"] = arg2_type
+            # handle other room interaction attempts; ie "> take plate from kitchen" while player is elsewhere:
+            if arg2 in self.room_types:
+                cur_room_str = self.room_types[self.room_to_type_dict[self.get_player_room()]][
+                    "repr_str"
+                ]
+                if not arg2 == cur_room_str:
+                    fail_dict = {
+                        "phase": "parsing",
+                        "fail_type": "other_room_argument",
+                        "arg": arg2,
+                    }
+                    return (
+                        False,
+                        config.messages_ns.not_in_room.format(room=arg2),
+                        fail_dict,
+                    )
 
         return True, action_dict, {}
 
@@ -1500,30 +1842,7 @@ class AdventureIFInterpreter(GameResourceLocator):
 
         predicate_type = predicate["predicate"]
 
-        predicate_arg1 = predicate["arg1"]
-        if "variable" in predicate_arg1:
-            predicate_arg1 = variable_map[predicate_arg1["variable"]]
-            # for now:
-            if type(predicate_arg1) == list:
-                when_condition_arg1 = predicate_arg1[0]
-
-        predicate_list = [predicate_type, predicate_arg1]
-
-        predicate_arg2 = None
-        if predicate["arg2"]:
-            predicate_arg2 = predicate["arg2"]
-            if "variable" in predicate_arg2:
-                predicate_arg2 = variable_map[predicate_arg2["variable"]]
-            predicate_list.append(predicate_arg2)
-
-        predicate_arg3 = None
-        if predicate["arg3"]:
-            predicate_arg3 = predicate["arg3"]
-            if "variable" in predicate_arg3:
-                predicate_arg3 = variable_map[predicate_arg3["variable"]]
-            predicate_list.append(predicate_arg3)
-
-        predicate_tuple = tuple(predicate_list)
+        predicate_tuple = _get_fact_template(predicate).fill(variable_map)
 
         # logger.info(f"predicate_to_tuple predicate_tuple intermediate: {predicate_tuple}")
         # rint(f"predicate_to_tuple predicate_tuple intermediate: {predicate_tuple}")
@@ -1543,34 +1862,21 @@ class AdventureIFInterpreter(GameResourceLocator):
                     #    tuple_arg = tuple_arg[0]
 
                     # if not tuple_arg.endswith(("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")):
-                    if not tuple_arg.endswith(
-                        (
-                            "0",
-                            "1",
-                            "2",
-                            "3",
-                            "4",
-                            "5",
-                            "6",
-                            "7",
-                            "8",
-                            "9",
-                            config.entities["inventory_id"],
-                        )
-                    ):
-                        # go over world state facts to find room or type predicate:
-                        for fact in self.world_state:
-                            # check for predicate fact matching action argument:
-                            if fact[0] == "room" or fact[0] == "type":
-                                if fact[2] == tuple_arg:
-                                    type_matched_instances.append(fact[1])
+                    if not tuple_arg.endswith(_INSTANCE_ID_SUFFIXES):
+                        # get room or type predicate facts matching action argument:
+                        for fact in itertools.chain(
+                            self._facts_by_arg2("room", tuple_arg),
+                            self._facts_by_arg2("type", tuple_arg),
+                        ):
+                            type_matched_instances.append(fact[1])
 
                         # logger.info(f"type_matched_instances: {type_matched_instances}")
 
                         # fallback to prevent list index out-of-range exceptions:
                         if not type_matched_instances:
                             logger.info(
-                                f"Empty type_matched_instances for predicate_to_tuple tuple_arg intermediate: {tuple_arg}"
+                                "Empty type_matched_instances for predicate_to_tuple tuple_arg intermediate: %s",
+                                tuple_arg,
                             )
                             type_matched_instances = [None]
                             # there will be no matching facts for the condition check, since none were found
@@ -1650,26 +1956,27 @@ class AdventureIFInterpreter(GameResourceLocator):
             If precon_trace=False: Boolean indicating if conditions are satisfied
         """
         # Dispatch to appropriate handler based on condition type
-        if "not" in conditions:
-            return self._check_not_condition(
-                conditions, variable_map, check_precon_idx, precon_trace
-            )
-        elif "predicate" in conditions:
-            return self._check_predicate_condition(
-                conditions, variable_map, check_precon_idx, precon_trace
-            )
-        elif "num_comp" in conditions:
-            return self._check_num_comp_condition(
-                conditions, variable_map, check_precon_idx, precon_trace
-            )
-        elif "and" in conditions:
-            return self._check_and_condition(
-                conditions, variable_map, check_precon_idx, precon_trace
-            )
-        elif "or" in conditions:
-            return self._check_or_condition(
-                conditions, variable_map, check_precon_idx, precon_trace
-            )
+        match _get_condition_kind(conditions):
+            case "not":
+                return self._check_not_condition(
+                    conditions, variable_map, check_precon_idx, precon_trace
+                )
+            case "predicate":
+                return self._check_predicate_condition(
+                    conditions, variable_map, check_precon_idx, precon_trace
+                )
+            case "num_comp":
+                return self._check_num_comp_condition(
+                    conditions, variable_map, check_precon_idx, precon_trace
+                )
+            case "and":
+                return self._check_and_condition(
+                    conditions, variable_map, check_precon_idx, precon_trace
+                )
+            case "or":
+                return self._check_or_condition(
+                    conditions, variable_map, check_precon_idx, precon_trace
+                )
 
         # NOTE: Handling forall conditions not implemented due to time constraints.
         return False
@@ -1822,11 +2129,10 @@ class AdventureIFInterpreter(GameResourceLocator):
 
             # Get numerical value from world state
             value = None
-            for fact in self.world_state:
-                if fact[0] == function_list[0] and fact[1] == function_list[1]:
-                    function_list.append(fact[2])
-                    value = fact[2]
-                    break
+            for fact in self._facts_by_arg1(function_list[0], function_list[1]):
+                function_list.append(fact[2])
+                value = fact[2]
+                break
         else:
             value = None
 
@@ -1889,9 +2195,17 @@ class AdventureIFInterpreter(GameResourceLocator):
         Returns:
             bool or dict depending on precon_trace flag
         """
-        and_conditions_checklist = []
         conditions_list = conditions["and"]
 
+        # without tracing, stop at the first unfulfilled condition:
+        if not precon_trace and not check_precon_idx:
+            return all(
+                self.check_conditions(and_condition, variable_map, False, False)
+                for and_condition in conditions_list
+            )
+
+        and_conditions_checklist = []
+
         if precon_trace:
             and_dict: Dict[str, Any] = {"and": []}
 
@@ -1938,9 +2252,17 @@ class AdventureIFInterpreter(GameResourceLocator):
         Returns:
             bool or dict depending on precon_trace flag
         """
-        or_conditions_checklist = []
         conditions_list = conditions["or"]
 
+        # without tracing, stop at the first fulfilled condition:
+        if not precon_trace and not check_precon_idx:
+            return any(
+                self.check_conditions(or_condition, variable_map, False, False)
+                for or_condition in conditions_list
+            )
+
+        or_conditions_checklist = []
+
         if precon_trace:
             or_dict: Dict[str, Any] = {"or": []}
 
@@ -1969,6 +2291,53 @@ class AdventureIFInterpreter(GameResourceLocator):
 
         return any_true
 
+    def _filter_forall_values(
+        self,
+        forall_body: List[Dict[str, Any]],
+        iterated_variable: str,
+        iterated_values: List[str],
+        variable_map: Dict[str, str],
+    ) -> List[str]:
+        """Filter forall iteration values by a single predicate when condition in one batch.
+        Forall bodies like (when (in ?e ?i) ...) only have effects for objects whose condition
+        fact is in the world state, so the condition facts of all objects are checked with one set
+        intersection instead of resolving the when clause for each object.
+        Objects with condition facts that need type word resolution are kept for the full check.
+        Args:
+            forall_body: Forall clause body elements.
+            iterated_variable: Forall variable to assign the iterated objects to.
+            iterated_values: Objects to iterate over.
+            variable_map: Current action parameter bindings.
+        Returns:
+            The iterated objects that can have effects, in iteration order.
+        """
+        if len(forall_body) != 1 or "when" not in forall_body[0]:
+            return iterated_values
+        when_conditions = forall_body[0]["when"][0]
+        if _get_condition_kind(when_conditions) != "predicate":
+            return iterated_values
+        if when_conditions["predicate"] in ("type", "room"):
+            return iterated_values
+
+        fact_template = _get_fact_template(when_conditions)
+        iteration_variable_map = dict(variable_map)
+        condition_facts = list()
+        for iterated_object in iterated_values:
+            iteration_variable_map[iterated_variable] = iterated_object
+            condition_facts.append(fact_template.fill(iteration_variable_map))
+        held_facts = self.world_state.intersection(condition_facts)
+
+        return [
+            iterated_object
+            for iterated_object, condition_fact in zip(iterated_values, condition_facts)
+            if condition_fact in held_facts
+            or None in condition_fact
+            or any(
+                isinstance(fact_arg, str) and not fact_arg.endswith(_INSTANCE_ID_SUFFIXES)
+                for fact_arg in condition_fact[1:]
+            )
+        ]
+
     def resolve_forall(
         self, forall_clause: Dict[str, Any], variable_map: Dict[str, str]
     ) -> Dict[str, List[Tuple[Any, ...]]]:
@@ -1995,7 +2364,7 @@ class AdventureIFInterpreter(GameResourceLocator):
             forall_predicate = forall_type["predicate"]
             if "variable" in forall_predicate:
                 # since this is no type_list, supply list of all __entities__:
-                all_entities_list = [fact[1] for fact in self.world_state if fact[0] == "type"]
+                all_entities_list = [fact[1] for fact in self._facts_by_pred("type")]
 
                 # NOTE: This assumes that forall clauses will only iterate over entities, NOT rooms!
 
@@ -2011,16 +2380,19 @@ class AdventureIFInterpreter(GameResourceLocator):
                         type_list_item_variable = type_list_item["variable"]
                         # get all type-matched objects:
                         type_matched_objects = list()
-                        for fact in self.world_state:
-                            # TODO?: use domain type definitions, employ object type inheritance?
-                            if fact[0] == type_list_type:  # relies on type facts for now
-                                type_matched_objects.append(fact[1])
+                        # TODO?: use domain type definitions, employ object type inheritance?
+                        # relies on type facts for now:
+                        for fact in self._facts_by_pred(type_list_type):
+                            type_matched_objects.append(fact[1])
                         # assign all matched objects to forall variable map:
                         forall_variable_map[type_list_item_variable] = type_matched_objects
 
         # NOTE: For now only covering forall with a single variable/type to iterate over, due to time constraints.
 
         for iterated_variable, iterated_values in forall_variable_map.items():
+            iterated_values = self._filter_forall_values(
+                forall_clause["body"], iterated_variable, iterated_values, variable_map
+            )
             for iterated_object in iterated_values:
                 # create individual variable map for this iterated object:
                 iteration_forall_variable_map = dict()
@@ -2132,34 +2504,19 @@ class AdventureIFInterpreter(GameResourceLocator):
             effect = effect["not"]
 
         if "predicate" in effect:
-            effect_list = [
-                effect["predicate"],
-                effect["arg1"],
-            ]  # effect predicates always have at least one argument
-            if effect["arg2"]:
-                effect_list.append(effect["arg2"])
-                if effect["arg3"]:
-                    effect_list.append(effect["arg3"])
-
             # apply variable map:
-            for effect_arg_idx, effect_arg in enumerate(effect_list):
-                if effect_arg_idx == 0:  # predicate does not need variable value application
-                    continue
-                if type(effect_arg) == dict and "variable" in effect_arg:
-                    effect_list[effect_arg_idx] = variable_map[effect_arg["variable"]]
-
-            effect_tuple = tuple(effect_list)
+            effect_tuple = _get_fact_template(effect).fill(variable_map)
 
             # return unfilled dict for fact tuples with None, as this marks optional action arguments:
             if None in effect_tuple:
                 return resolve_effect_results
 
             if effect_polarity:
-                self.world_state.add(effect_tuple)
+                self._add_fact(effect_tuple)
                 resolve_effect_results["added"].append(effect_tuple)
             elif not effect_polarity:
                 if effect_tuple in self.world_state:
-                    self.world_state.remove(effect_tuple)
+                    self._remove_fact(effect_tuple)
                 resolve_effect_results["removed"].append(effect_tuple)
         elif "function_change" in effect:
             # logger.info(f"function_change effect passed to resolve_effect: {effect}")
@@ -2173,15 +2530,14 @@ class AdventureIFInterpreter(GameResourceLocator):
                 arg1_function_list.append(effect["arg1"]["function_id"])
                 arg1_function_var = effect["arg1"]["function_variable"]["variable"]
                 arg1_function_object = variable_map[arg1_function_var]
-                logger.info(f"num_comp condition arg1 function object: {arg1_function_object}")
+                logger.info("num_comp condition arg1 function object: %s", arg1_function_object)
                 arg1_function_list.append(arg1_function_object)
 
             if not arg1_is_number:
                 # get numerical value of first argument from function fact:
-                for fact in self.world_state:
-                    if fact[0] == arg1_function_list[0] and fact[1] == arg1_function_list[1]:
-                        arg1_function_list.append(fact[2])
-                        arg1_value = fact[2]
+                for fact in self._facts_by_arg1(arg1_function_list[0], arg1_function_list[1]):
+                    arg1_function_list.append(fact[2])
+                    arg1_value = fact[2]
             else:
                 arg1_value = effect["arg1"]["function_number"]
                 if "." in arg1_value:
@@ -2197,15 +2553,14 @@ class AdventureIFInterpreter(GameResourceLocator):
                 arg2_function_list.append(effect["arg2"]["function_id"])
                 arg2_function_var = effect["arg2"]["function_variable"]["variable"]
                 arg2_function_object = variable_map[arg2_function_var]
-                logger.info(f"num_comp condition arg2 function object: {arg2_function_object}")
+                logger.info("num_comp condition arg2 function object: %s", arg2_function_object)
                 arg2_function_list.append(arg2_function_object)
 
             if not arg2_is_number:
                 # get numerical value of second argument from function fact:
-                for fact in self.world_state:
-                    if fact[0] == arg2_function_list[0] and fact[1] == arg2_function_list[1]:
-                        arg2_function_list.append(fact[2])
-                        arg2_value = fact[2]
+                for fact in self._facts_by_arg1(arg2_function_list[0], arg2_function_list[1]):
+                    arg2_function_list.append(fact[2])
+                    arg2_value = fact[2]
             else:
                 arg2_value = effect["arg2"]["function_number"]
                 if "." in arg2_value:
@@ -2215,7 +2570,7 @@ class AdventureIFInterpreter(GameResourceLocator):
 
             # remove old function value fact:
             if tuple(arg1_function_list) in self.world_state:
-                self.world_state.remove(tuple(arg1_function_list))
+                self._remove_fact(tuple(arg1_function_list))
             resolve_effect_results["removed"].append(tuple(arg1_function_list))
 
             # get function change type:
@@ -2230,7 +2585,7 @@ class AdventureIFInterpreter(GameResourceLocator):
                 case "assign":
                     arg1_function_list[2] = arg2_value
 
-            self.world_state.add(tuple(arg1_function_list))
+            self._add_fact(tuple(arg1_function_list))
             resolve_effect_results["added"].append(tuple(arg1_function_list))
 
         # logger.info(f"resolve_effect results: {resolve_effect_results}")
@@ -2281,6 +2636,12 @@ class AdventureIFInterpreter(GameResourceLocator):
 
         parameters = parameters_base["type_list"]
 
+        # lookups that stay the same for all parameters:
+        player_room = self.get_player_room()
+        inst_to_type_dict = self.inst_to_type_dict
+        room_to_type_dict = self.room_to_type_dict
+        supertypes = self.domain["supertypes"]
+
         for param_idx, parameter in enumerate(parameters):
             cur_parameter_type = parameter["type_list_element"]
 
@@ -2307,48 +2668,44 @@ class AdventureIFInterpreter(GameResourceLocator):
                                             break
                                     arg1_value = variable_map[arg1_variable]
                                     arg1_receptacle = None
-                                    for fact in self.world_state:
-                                        if fact[0] in ["in", "on"]:
-                                            if fact[1] == f"{arg1_value}1":
-                                                arg1_receptacle = fact[2]
-                                                break
+                                    arg1_entity_id = default_instance_id(arg1_value)
+                                    for fact in itertools.chain(
+                                        self._facts_by_arg1("in", arg1_entity_id),
+                                        self._facts_by_arg1("on", arg1_entity_id),
+                                    ):
+                                        arg1_receptacle = fact[2]
+                                        break
                                     variable_map[var_id] = arg1_receptacle
                             else:
                                 variable_map[var_id] = None
                     case "current_player_room":
-                        variable_map[var_id] = self.get_player_room()
+                        variable_map[var_id] = player_room
                     case "player":
                         variable_map[var_id] = config.entities["player_id"]
                     case "inventory":
                         variable_map[var_id] = config.entities["inventory_id"]
                     case "current_room_floor":
-                        variable_map[var_id] = (
-                            self.get_player_room() + config.entities["floor_id_suffix"]
-                        )
+                        variable_map[var_id] = floor_id(player_room)
 
                 # Check type match
-                if variable_map[var_id]:
-                    if variable_map[var_id].endswith(
-                        ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")
-                    ):
-                        if variable_map[var_id] in self.inst_to_type_dict:
-                            var_type = self.inst_to_type_dict[variable_map[var_id]]
-                        elif variable_map[var_id] in self.room_to_type_dict:
-                            var_type = self.room_to_type_dict[variable_map[var_id]]
+                var_value = variable_map[var_id]
+                if var_value:
+                    if var_value.endswith(("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")):
+                        if var_value in inst_to_type_dict:
+                            var_type = inst_to_type_dict[var_value]
+                        elif var_value in room_to_type_dict:
+                            var_type = room_to_type_dict[var_value]
                     else:
-                        var_type = variable_map[var_id]
+                        var_type = var_value
                 else:
-                    var_type = variable_map[var_id]
+                    var_type = var_value
 
                 # DOMAIN TYPE CHECK
                 type_matched = False
                 if type(var_type) == str:
                     if var_type == cur_parameter_type:
                         type_matched = True
-                    elif (
-                        var_type in self.domain["supertypes"]
-                        and cur_parameter_type in self.domain["supertypes"][var_type]
-                    ):
+                    elif var_type in supertypes and cur_parameter_type in supertypes[var_type]:
                         type_matched = True
                 else:
                     type_matched = True
@@ -2356,7 +2713,7 @@ class AdventureIFInterpreter(GameResourceLocator):
                 if not type_matched:
                     var_idx = list(cur_action_pddl_map.keys()).index(f"?{var_id}")
                     feedback_template = cur_action_def["failure_feedback"]["parameters"][var_idx][0]
-                    feedback_jinja = jinja2.Template(feedback_template)
+                    feedback_jinja = _get_feedback_template(feedback_template)
                     jinja_args = {var_id: variable_map[var_id]}
                     feedback_str = feedback_jinja.render(jinja_args)
                     feedback_str = feedback_str.capitalize()
@@ -2404,7 +2761,7 @@ class AdventureIFInterpreter(GameResourceLocator):
             return True, None
         else:
             logger.info("Preconditions not fulfilled!")
-            logger.info(f"precon_trace: {self.precon_trace}")
+            logger.info("precon_trace: %s", self.precon_trace)
 
             def feedback_idx_from_precon_trace(precon_trace):
                 for item in precon_trace[-1]["and"]:
@@ -2446,18 +2803,18 @@ class AdventureIFInterpreter(GameResourceLocator):
             feedback_idx, failed_precon_predicate = feedback_idx_from_precon_trace(
                 self.precon_trace
             )
-            logger.info(f"Precondition fail feedback_idx: {feedback_idx}")
+            logger.info("Precondition fail feedback_idx: %s", feedback_idx)
 
             feedback_template = cur_action_def["failure_feedback"]["precondition"][feedback_idx][0]
-            feedback_jinja = jinja2.Template(feedback_template)
+            feedback_jinja = _get_feedback_template(feedback_template)
             clean_feedback_variable_map = deepcopy(variable_map)
             logger.info(
-                f"Precondition fail clean_feedback_variable_map: {clean_feedback_variable_map}"
+                "Precondition fail clean_feedback_variable_map: %s", clean_feedback_variable_map
             )
 
             for key in clean_feedback_variable_map:
                 if clean_feedback_variable_map[key] is None:
-                    feedback_str = config.messages["cannot_do_that"]
+                    feedback_str = config.messages_ns.cannot_do_that
                     failed_action_info = {
                         "failed_action_type": action_dict["type"],
                         "failed_precon_predicate": "?s - receptacle",
@@ -2541,14 +2898,15 @@ class AdventureIFInterpreter(GameResourceLocator):
         clean_feedback_variable_map = self._prepare_feedback_variable_map(variable_map)
 
         success_feedback_template = cur_action_def["success_feedback"]
-        feedback_jinja = jinja2.Template(success_feedback_template)
+        feedback_jinja = _get_feedback_template(success_feedback_template)
+        template_variables = _get_template_variables(success_feedback_template)
 
         jinja_args: dict = clean_feedback_variable_map
-        if "room_desc" in success_feedback_template:
+        if "room_desc" in template_variables:
             jinja_args["room_desc"] = self.get_full_room_desc()
-        if "inventory_desc" in success_feedback_template:
+        if "inventory_desc" in template_variables:
             jinja_args["inventory_desc"] = self.get_inventory_desc()
-        if "prep" in success_feedback_template:
+        if "prep" in template_variables:
             if "prep" in action_dict:
                 jinja_args["prep"] = action_dict["prep"]
             else:
@@ -2556,19 +2914,19 @@ class AdventureIFInterpreter(GameResourceLocator):
                     if added_fact[0] in ["in", "on"]:
                         jinja_args["prep"] = added_fact[0]
                         break
-        if "container_content" in success_feedback_template:
+        if "container_content" in template_variables:
             for added_fact in world_state_effects["added"]:
                 if added_fact[0] == "open":
                     opened_container_id = added_fact[1]
                     break
             jinja_args["container_content"] = self.get_container_content_desc(opened_container_id)
-        if "arg1_desc" in success_feedback_template:
+        if "arg1_desc" in template_variables:
             entity_desc = self.get_entity_desc(action_dict["arg1"])
             jinja_args["arg1_desc"] = entity_desc
-        if "arg2_desc" in success_feedback_template:
+        if "arg2_desc" in template_variables:
             entity_desc = self.get_entity_desc(action_dict["arg2"])
             jinja_args["arg2_desc"] = entity_desc
-        if "arg1_text" in success_feedback_template:
+        if "arg1_text" in template_variables:
             entity_text = self.get_entity_text(action_dict["arg1"])
             jinja_args["arg1_text"] = entity_text
 
@@ -2600,9 +2958,6 @@ class AdventureIFInterpreter(GameResourceLocator):
             >>> if success:
             ...     print(result["world_state_effects"])
         """
-        # Save prior world state for change tracking
-        prior_world_state = deepcopy(self.world_state)
-
         # Get action definition and PDDL parameter mapping
         cur_action_def = self.action_types[action_dict["type"]]
         cur_action_pddl_map = cur_action_def["pddl_parameter_mapping"]
@@ -2634,15 +2989,10 @@ class AdventureIFInterpreter(GameResourceLocator):
             effects, variable_map
         )
 
-        # Update world state history
-        self.world_state_history.append(deepcopy(self.world_state))
-
-        # Log world state changes
-        post_world_state = deepcopy(self.world_state)
-        post_resolution_changes = post_world_state.difference(prior_world_state)
-        if prior_world_state == self.world_state_history[-2]:
-            logger.info("Prior world state matches second to last world state in history")
-        logger.info(f"Resolution world state changes: {post_resolution_changes}")
+        # Update world state history and log world state changes
+        world_state_diff = self._commit_world_state_diff()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Resolution world state changes: %s", set(world_state_diff.added))
 
         # Step 4: Generate success feedback
         feedback_str = self._generate_success_feedback(
@@ -2666,8 +3016,6 @@ class AdventureIFInterpreter(GameResourceLocator):
             - feedback (str or List[str]): Event feedback message(s), empty if no event
             - changes (Dict or List): World state effects, empty if no event
         """
-        prior_world_state = deepcopy(self.world_state)
-
         # Iterate over all defined events
         for cur_event_type in self.event_types:
             cur_event_def = self.event_types[cur_event_type]
@@ -2692,11 +3040,10 @@ class AdventureIFInterpreter(GameResourceLocator):
                 # Event triggered! Apply effects
                 world_state_effects = self._apply_event_effects(cur_event_def, variable_map)
 
-                # Update world state history
-                self.world_state_history.append(deepcopy(self.world_state))
-
-                # Log world state changes
-                self._log_event_state_changes(prior_world_state)
+                # Update world state history and log world state changes
+                world_state_diff = self._commit_world_state_diff()
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Event world state changes: %s", set(world_state_diff.added))
 
                 # Generate event feedback
                 feedback_str = self._generate_event_feedback(
@@ -2730,11 +3077,7 @@ class AdventureIFInterpreter(GameResourceLocator):
         for parameter in parameters:
             parameter_type = parameter["type_list_element"]
             for variable in parameter["items"]:
-                var_id = variable["variable"]
-                if var_id not in var_type_map:
-                    var_type_map[var_id] = [parameter_type]
-                else:
-                    var_type_map[var_id].append(parameter_type)
+                var_type_map.setdefault(variable["variable"], []).append(parameter_type)
 
         return var_type_map
 
@@ -2747,23 +3090,25 @@ class AdventureIFInterpreter(GameResourceLocator):
         Returns:
             List of candidate tuples (each tuple is one possible variable binding)
         """
-        var_candidates = {}
-
+        domain_types = self.domain["types"]
+        var_candidate_types = list()
+        var_candidates = dict()
         for var_id, var_types in var_type_map.items():
-            candidate_types = []
+            candidate_types = set()
             for cur_type in var_types:
                 # Get domain supertypes if available
-                if cur_type in self.domain["types"]:
-                    candidate_types += self.domain["types"][cur_type]
+                if cur_type in domain_types:
+                    candidate_types.update(domain_types[cur_type])
                 else:
-                    candidate_types.append(cur_type)
+                    candidate_types.add(cur_type)
+            var_candidates[var_id] = list()
+            var_candidate_types.append((candidate_types, var_candidates[var_id]))
 
-            # Find all entities matching these types
-            var_candidates[var_id] = [
-                type_fact[1]
-                for type_fact in self.world_state
-                if type_fact[0] in ["type", "room"] and type_fact[2] in candidate_types
-            ]
+        # Find all entities matching the types of each variable in a single pass
+        for type_fact in itertools.chain(self._facts_by_pred("type"), self._facts_by_pred("room")):
+            for candidate_types, candidates in var_candidate_types:
+                if type_fact[2] in candidate_types:
+                    candidates.append(type_fact[1])
 
         # Create all combinations of candidate entities
         candidates_lists = [candidates for candidates in var_candidates.values() if candidates]
@@ -2823,20 +3168,6 @@ class AdventureIFInterpreter(GameResourceLocator):
 
         return self._apply_action_effects(effects, variable_map)
 
-    def _log_event_state_changes(self, prior_world_state: set):
-        """Log changes to world state after event.
-
-        Args:
-            prior_world_state: World state before event
-        """
-        post_world_state = deepcopy(self.world_state)
-        post_resolution_changes = post_world_state.difference(prior_world_state)
-
-        if prior_world_state == self.world_state_history[-2]:
-            logger.info("Prior world state matches second to last world state in history")
-
-        logger.info(f"Event world state changes: {post_resolution_changes}")
-
     def _generate_event_feedback(
         self, event_def: dict, variable_map: dict, world_state_effects: dict
     ) -> str:
@@ -2853,21 +3184,22 @@ class AdventureIFInterpreter(GameResourceLocator):
         clean_feedback_variable_map = self._prepare_feedback_variable_map(variable_map)
 
         event_feedback_template = event_def["event_feedback"]
-        feedback_jinja = jinja2.Template(event_feedback_template)
+        feedback_jinja = _get_feedback_template(event_feedback_template)
+        template_variables = _get_template_variables(event_feedback_template)
 
         jinja_args = clean_feedback_variable_map
 
         # Add template-specific arguments
-        if "room_desc" in event_feedback_template:
+        if "room_desc" in template_variables:
             jinja_args["room_desc"] = self.get_full_room_desc()
-        if "inventory_desc" in event_feedback_template:
+        if "inventory_desc" in template_variables:
             jinja_args["inventory_desc"] = self.get_inventory_desc()
-        if "prep" in event_feedback_template:
+        if "prep" in template_variables:
             for added_fact in world_state_effects["added"]:
                 if added_fact[0] in ["in", "on"]:
                     jinja_args["prep"] = added_fact[0]
                     break
-        if "container_content" in event_feedback_template:
+        if "container_content" in template_variables:
             for added_fact in world_state_effects["added"]:
                 if added_fact[0] == "open":
                     jinja_args["container_content"] = self.get_container_content_desc(added_fact[1])
@@ -2901,9 +3233,8 @@ class AdventureIFInterpreter(GameResourceLocator):
         # Find replacement candidates from world state
         replace_candidates = [
             fact[1]
-            for fact in self.world_state
-            if fact[0] == event_def["randomize"]["replace_type"]
-            and fact[1] not in event_def["randomize"]["not_replacer"]
+            for fact in self._facts_by_pred(event_def["randomize"]["replace_type"])
+            if fact[1] not in event_def["randomize"]["not_replacer"]
         ]
 
         if not replace_candidates:
@@ -2939,6 +3270,7 @@ class AdventureIFInterpreter(GameResourceLocator):
                     if arg_key in effect and isinstance(effect[arg_key], str):
                         if effect[arg_key] == old_value:
                             effect[arg_key] = new_value
+                            effect.pop(_FACT_TEMPLATE_KEY, None)
 
             elif "forall" in effect:
                 # Handle forall body
@@ -2954,6 +3286,7 @@ class AdventureIFInterpreter(GameResourceLocator):
                                     ):
                                         if when_effect[arg_key] == old_value:
                                             when_effect[arg_key] = new_value
+                                            when_effect.pop(_FACT_TEMPLATE_KEY, None)
 
     def get_exploration_info(
         self, action_type=None, full_exploration_state=False, full_exploration_history=False
@@ -2978,7 +3311,7 @@ class AdventureIFInterpreter(GameResourceLocator):
         epistemic_gain_removed = self.exploration_history[-2].difference(self.exploration_state)
         epistemic_gain_added = self.exploration_state.difference(self.exploration_history[-2])
         logger.info(
-            f"Epistemic gain; Added: {epistemic_gain_added}; Removed: {epistemic_gain_removed}"
+            "Epistemic gain; Added: %s; Removed: %s", epistemic_gain_added, epistemic_gain_removed
         )
 
         if exploration_info["action_epistemic"]:
@@ -2986,37 +3319,33 @@ class AdventureIFInterpreter(GameResourceLocator):
             effective_epistemic_gain_amount = len(effective_epistemic_gain)
             if action_type:
                 logger.info(
-                    f"Epistemic action '{action_type}' resulted in effective epistemic gain: {effective_epistemic_gain}"
+                    "Epistemic action '%s' resulted in effective epistemic gain: %s",
+                    action_type,
+                    effective_epistemic_gain,
                 )
             exploration_info["effective_epistemic_gain_facts"] = list(effective_epistemic_gain)
-            logger.info(f"Epistemic gain amount: {effective_epistemic_gain_amount}")
+            logger.info("Epistemic gain amount: %s", effective_epistemic_gain_amount)
             exploration_info["effective_epistemic_gain_amount"] = effective_epistemic_gain_amount
         else:
             exploration_info["effective_epistemic_gain_amount"] = 0
 
         # all entities:
-        all_entities = set()
-        for fact in self.world_state:
-            if fact[0] == "type":
-                all_entities.add(fact[1])
+        all_entities = {fact[1] for fact in self._facts_by_pred("type")}
 
         # known entities:
         known_entities = set()
         for fact in self.exploration_state:
             if fact[0] == "at":
                 known_entities.add(fact)
-        logger.info(f"Known entities: {known_entities}")
+        logger.info("Known entities: %s", known_entities)
         exploration_info["known_entities"] = list(known_entities)
 
         known_entities_ratio = len(known_entities) / len(all_entities)
-        logger.info(f"Known entities ratio: {known_entities_ratio}")
+        logger.info("Known entities ratio: %s", known_entities_ratio)
         exploration_info["known_entities_ratio"] = known_entities_ratio
 
         # all rooms:
-        all_rooms = set()
-        for fact in self.world_state:
-            if fact[0] == "room":
-                all_rooms.add(fact[1])
+        all_rooms = {fact[1] for fact in self._facts_by_pred("room")}
 
         # visited rooms:
         visited_rooms = set()
@@ -3024,34 +3353,29 @@ class AdventureIFInterpreter(GameResourceLocator):
             for exploration_fact in exploration_state:
                 if exploration_fact[0] == "at" and exploration_fact[1] == "player1":
                     visited_rooms.add(exploration_fact[2])
-        logger.info(f"Visited rooms: {visited_rooms}")
+        logger.info("Visited rooms: %s", visited_rooms)
         exploration_info["visited_rooms"] = list(visited_rooms)
 
         visited_rooms_ratio = len(visited_rooms) / len(all_rooms)
-        logger.info(f"Visited rooms ratio: {visited_rooms_ratio}")
+        logger.info("Visited rooms ratio: %s", visited_rooms_ratio)
         exploration_info["visited_rooms_ratio"] = visited_rooms_ratio
 
-        # get goal entitiy set:
-        goal_entities = set()
-        # TODO: expand to handle new-words goal tuples/any goal tuples
-        for goal_fact in self.goal_state:
-            goal_entities.add(goal_fact[1])
-            if len(goal_fact) >= 3:
-                goal_entities.add(goal_fact[2])
-        logger.info(f"Goal entities: {goal_entities}")
+        # goal entity set is fixed for the episode:
+        goal_entities = self.goal_entities
+        logger.info("Goal entities: %s", goal_entities)
 
         # check which goal-relevant entities are known:
-        known_goal_entities = set()
-        for goal_fact in self.goal_state:
-            for known_entity in known_entities:
-                if known_entity[1] in goal_fact:
-                    known_goal_entities.add(known_entity)
-        logger.info(f"Known goal entities: {known_goal_entities}")
+        known_goal_entities = {
+            known_entity
+            for known_entity in known_entities
+            if known_entity[1] in self.goal_fact_values
+        }
+        logger.info("Known goal entities: %s", known_goal_entities)
         exploration_info["known_goal_entities"] = list(known_goal_entities)
 
         # ratio of known goal-relevant entities:
         known_goal_entities_ratio = len(known_goal_entities) / len(goal_entities)
-        logger.info(f"Known goal entities ratio: {known_goal_entities_ratio}")
+        logger.info("Known goal entities ratio: %s", known_goal_entities_ratio)
         exploration_info["known_goal_entities_ratio"] = known_goal_entities_ratio
 
         return exploration_info
@@ -3084,9 +3408,6 @@ class AdventureIFInterpreter(GameResourceLocator):
             return self.goals_achieved, results_feedback, fail
         else:
             # RESOLUTION PHASE
-            # get visible/accessible entities before resolution:
-            prior_visibles = set(self.get_player_room_contents_visible())
-
             # resolve action:
             resolved, resolution_result, fail = self.resolve_action(parse_result)
             if not resolved:
@@ -3108,17 +3429,16 @@ class AdventureIFInterpreter(GameResourceLocator):
 
                 return self.goals_achieved, results_feedback, fail
             else:
-                logger.info(f"Resolution result: {resolution_result}")
+                logger.info("Resolution result: %s", resolution_result)
                 base_result_str = resolution_result
 
                 # check goal achievement:
-                self.goals_achieved = self.goal_state & self.world_state
-                goals_achieved_response_list = list(self.goal_state & self.world_state)
+                self.goals_achieved = self.world_state & self.goal_state
                 # convert to goal states to string version:
-                for goal_state_idx, goal_state in enumerate(goals_achieved_response_list):
-                    goals_achieved_response_list[goal_state_idx] = fact_tuple_to_str(goal_state)
-                goals_achieved_response = set(goals_achieved_response_list)
-                logger.info(f"Achieved goal states: {goals_achieved_response}")
+                goals_achieved_response = {
+                    fact_tuple_to_str(goal_state) for goal_state in self.goals_achieved
+                }
+                logger.info("Achieved goal states: %s", goals_achieved_response)
 
                 # EXPLORATION TRACKING
                 assert isinstance(fail, dict), "fail should be dict in successful resolution"
@@ -3170,90 +3490,84 @@ class AdventureIFInterpreter(GameResourceLocator):
             logger.info("Goals achieved: %s", goals_achieved)
             logger.info("Fail: %s", fail)
 
-    def execute_plan_sequence(self, command_sequence: list) -> List:
+    def execute_plan_sequence(self, command_sequence: list) -> List[PlanActionResult]:
         """
         Execute a command sequence plan and return results up to first failure.
         Used for plan logging and evaluation.
         Returns a list of action processing results including first failed plan action.
         """
-        logger.info(f"Plan command sequence: {command_sequence}")
-        # deepcopy world state before plan execution to assure proper reversion:
-        pre_plan_world_state = deepcopy(self.world_state)
-        pre_plan_exploration_state = deepcopy(self.exploration_state)
-
-        result_sequence: list = list()
+        logger.info("Plan command sequence: %s", command_sequence)
+        # plan changes are reverted through the world state diff history; snapshots are only
+        # needed to double-check the reversion in debug logs:
+        check_reversion = logger.isEnabledFor(logging.DEBUG)
+        if check_reversion:
+            pre_plan_world_state = self.world_state.copy()
+
+        result_sequence: List[PlanActionResult] = list()
         world_state_change_count: int = 0
         for cmd_idx, command in enumerate(command_sequence):
-            logger.info(f"Resolving plan action {cmd_idx}: {command}")
-            # get result as list for mutability:
-            result = list(self.process_action(command))
+            logger.info("Resolving plan action %s: %s", cmd_idx, command)
+            goals_achieved, response, action_info = self.process_action(command)
             # convert result goals achieved to list for JSON dumping:
-            result[0] = list(result[0])
+            result = PlanActionResult(list(goals_achieved), response, action_info)
             result_sequence.append(result)
             # check for command failure:
-            # result[2] is fail info; if it is truthy, the command failed
-            # if result[2]:
-            if "fail_type" in result[2]:
+            if "fail_type" in result.action_info:
                 # stop executing commands at the first failure
-                logger.info(f"Plan sequence failed at step {cmd_idx}")
-                logger.info(f"Plan sequence fail dict: {result[2]}")
-                logger.info(f"Plan world state change count at failure: {world_state_change_count}")
+                logger.info("Plan sequence failed at step %s", cmd_idx)
+                logger.info("Plan sequence fail dict: %s", result.action_info)
+                logger.info(
+                    "Plan world state change count at failure: %s", world_state_change_count
+                )
                 break
             else:
                 world_state_change_count += 1
-                logger.info(f"New plan world state change count: {world_state_change_count}")
+                logger.info("New plan world state change count: %s", world_state_change_count)
 
         # revert the world state to before plan execution if it changed:
         if world_state_change_count:
             logger.info(
-                f"Plan world state change count: {world_state_change_count}; reverting changes"
+                "Plan world state change count: %s; reverting changes", world_state_change_count
             )
-            # deepcopy world state after plan execution to prevent reference issues:
-            post_plan_world_state = deepcopy(self.world_state)
-            post_plan_exploration_state = deepcopy(self.exploration_state)
+            if check_reversion:
+                # copy world state after plan execution to prevent reference issues:
+                post_plan_world_state = self.world_state.copy()
             # logger.info(f"World state history before reverting: {self.world_state_history}")
             logger.info(
-                f"World state history length before reverting: {len(self.world_state_history)}"
+                "World state history length before reverting: %s", len(self.world_state_history)
             )
             logger.info(
-                f"Exploration history length before reverting: {len(self.exploration_history)}"
+                "Exploration history length before reverting: %s", len(self.exploration_history)
             )
-            # reset world state history to before executed plan:
-            self.world_state_history = self.world_state_history[:-world_state_change_count]
+            # reset world state and its history to before executed plan:
+            self._revert_world_state_diffs(world_state_change_count)
             self.exploration_history = self.exploration_history[:-world_state_change_count]
             # logger.info(f"World state history after reverting: {self.world_state_history}")
             logger.info(
-                f"World state history length after reverting: {len(self.world_state_history)}"
+                "World state history length after reverting: %s", len(self.world_state_history)
             )
             logger.info(
-                f"Exploration history length after reverting: {len(self.exploration_history)}"
+                "Exploration history length after reverting: %s", len(self.exploration_history)
             )
-            # check that world state has been properly reset:
-            if self.world_state_history[-1] == pre_plan_world_state:
-                logger.info(f"Last world state history item matches pre-plan world state")
-            else:
-                logger.info(f"Last world state history item DOES NOT match pre-plan world state")
-            if self.world_state_history[-1] == post_plan_world_state:
-                logger.info(f"Last world state history item DOES match post-plan world state")
-            else:
-                logger.info(f"Last world state history item does not match post-plan world state")
-            # reset world state to before plan execution:
-            self.world_state = deepcopy(self.world_state_history[-1])
-            self.exploration_state = deepcopy(self.exploration_history[-1])
-            # double-check that world state has been reset properly:
-            if self.world_state == pre_plan_world_state:
-                logger.info(f"Pre-plan world state matches reverted post-plan world state")
-            else:
-                logger.info(f"Pre-plan world state does not match reverted post-plan world state")
-            # log specific reverted fact changes from plan:
-            post_plan_changes = post_plan_world_state.difference(self.world_state)
-            logger.info(f"Reverted plan world state changes: {post_plan_changes}")
+            # reset exploration state to before plan execution:
+            self.exploration_state = self.exploration_history[-1].copy()
+            if check_reversion:
+                # double-check that world state has been reset properly:
+                if self.world_state == pre_plan_world_state:
+                    logger.debug("Pre-plan world state matches reverted post-plan world state")
+                else:
+                    logger.debug(
+                        "Pre-plan world state does not match reverted post-plan world state"
+                    )
+                # log specific reverted fact changes from plan:
+                post_plan_changes = post_plan_world_state.difference(self.world_state)
+                logger.debug("Reverted plan world state changes: %s", post_plan_changes)
         else:
             logger.info(
-                f"Plan world state change count: {world_state_change_count}; no changes to revert"
+                "Plan world state change count: %s; no changes to revert", world_state_change_count
             )
 
-        logger.info(f"Plan result sequence: {result_sequence}")
+        logger.info("Plan result sequence: %s", result_sequence)
 
         return result_sequence
 
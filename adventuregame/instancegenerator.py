@@ -13,6 +13,7 @@ import numpy as np
 from clemcore.clemgame import GameInstanceGenerator
 from tqdm import tqdm
 
+from adventuregame.adv_util import render_prompt
 from adventuregame.config.compat import CompatConfigLoader, get_config
 from adventuregame.exceptions import ConfigurationError, InstanceGenerationError
 
@@ -127,10 +128,8 @@ class AdventureGameInstanceGenerator(GameInstanceGenerator):
                             basic_prompt = self.load_template(
                                 config.paths["prompt_templates"]["potion_brewing"]
                             )
-                        # Replace the goal in the templated initial prompt
-                        instance_prompt = basic_prompt.replace(
-                            config.template_placeholders["goal"], goal_str
-                        )
+                        # placeholder values for the templated initial prompt, filled in one pass
+                        placeholder_values = {config.template_placeholders["goal"]: goal_str}
                         # fill in new-words explanations:
                         if (
                             adventures[difficulty][adventure_id]["prompt_template_set"]
@@ -158,10 +157,9 @@ class AdventureGameInstanceGenerator(GameInstanceGenerator):
                                 f"In addition to common actions, you can "
                                 f"{', '.join(new_word_actions[:-1])} and {new_word_actions[-1]}."
                             )
-                            instance_prompt = instance_prompt.replace(
-                                config.template_placeholders["new_words_explanations"],
-                                explanation_str,
-                            )
+                            placeholder_values[
+                                config.template_placeholders["new_words_explanations"]
+                            ] = explanation_str
 
                         if (
                             adventures[difficulty][adventure_id]["prompt_template_set"]
@@ -184,10 +182,9 @@ class AdventureGameInstanceGenerator(GameInstanceGenerator):
                                 f"{new_word_action['explanation']}"
                             )
 
-                            instance_prompt = instance_prompt.replace(
-                                config.template_placeholders["new_words_explanations"],
-                                explanation_str,
-                            )
+                            placeholder_values[
+                                config.template_placeholders["new_words_explanations"]
+                            ] = explanation_str
 
                         if (
                             adventures[difficulty][adventure_id]["prompt_template_set"]
@@ -210,10 +207,11 @@ class AdventureGameInstanceGenerator(GameInstanceGenerator):
                                 f"In addition to common actions, you can "
                                 f"{', '.join(new_word_actions[:-1])} and {new_word_actions[-1]}."
                             )
-                            instance_prompt = instance_prompt.replace(
-                                config.template_placeholders["new_words_explanations"],
-                                explanation_str,
-                            )
+                            placeholder_values[
+                                config.template_placeholders["new_words_explanations"]
+                            ] = explanation_str
+
+                        instance_prompt = render_prompt(basic_prompt, placeholder_values)
 
                         # Create a game instance
                         game_instance = self.add_game_instance(basic_experiment, adventure_id)
@@ -19,6 +19,7 @@ from clemcore.clemgame.master import RuleViolationError
 from clemcore.utils import file_utils
 from if_wrapper import AdventureIFInterpreter
 
+from adventuregame.adv_util import assistant_message, user_message
 from adventuregame.config.compat import get_config
 from adventuregame.exceptions import AdventureGameError, ConfigurationError
 
@@ -189,10 +190,7 @@ class AdventureGameMaster(DialogueGameMaster):
             initial_room_desc: str = self.if_interpreter.get_full_room_desc()
             # combine prompt with initial room description as first message:
             first_message_content: str = self.game_instance["prompt"] + initial_room_desc
-            first_message: Dict[str, str] = {
-                config.keys["message_role"]: config.keys["message_role_user"],
-                config.keys["message_content"]: first_message_content,
-            }
+            first_message: Dict[str, str] = user_message(first_message_content)
             # add initial prompt message to player message history:
             self.player._messages.append(first_message)
             # execute pre-explore visiting sequence:
@@ -202,49 +200,34 @@ class AdventureGameMaster(DialogueGameMaster):
                 ):  # only do this by simple history appending before last
                     # add IF input message to player message history:
                     if config.variants["plan"] in self.if_variant:
-                        input_message = {
-                            config.keys["message_role"]: config.keys["message_role_assistant"],
-                            config.keys[
-                                "message_content"
-                            ]: f"{config.game_constants['command_prefix_with_space']}{pre_exp_action}\n"
+                        input_message = assistant_message(
+                            f"{config.game_constants['command_prefix_with_space']}{pre_exp_action}\n"
                             f"Next actions: "
-                            f"{config.delimiters['plan_separator'].join(self.pre_explore_inputs[pre_exp_idx+1:])}",
-                        }
+                            f"{config.delimiters['plan_separator'].join(self.pre_explore_inputs[pre_exp_idx+1:])}"
+                        )
                     else:
-                        input_message = {
-                            config.keys["message_role"]: config.keys["message_role_assistant"],
-                            config.keys[
-                                "message_content"
-                            ]: f"{config.game_constants['command_prefix_with_space']}{pre_exp_action}",
-                        }
+                        input_message = assistant_message(
+                            f"{config.game_constants['command_prefix_with_space']}{pre_exp_action}"
+                        )
                     self.player._messages.append(input_message)
                     # execute pre-explore action:
                     goals_achieved, if_response, action_info = self.if_interpreter.process_action(
                         pre_exp_action
                     )
                     # add IF response to player message history:
-                    response_message: Dict[str, str] = {
-                        config.keys["message_role"]: config.keys["message_role_user"],
-                        config.keys["message_content"]: if_response,
-                    }
+                    response_message: Dict[str, str] = user_message(if_response)
                     self.player._messages.append(response_message)
                 else:  # handle last pair by using set_context_for
                     # add IF input message to player message history:
                     if config.variants["plan"] in self.if_variant:
-                        input_message = {
-                            config.keys["message_role"]: config.keys["message_role_assistant"],
-                            config.keys[
-                                "message_content"
-                            ]: f"{config.game_constants['command_prefix_with_space']}{pre_exp_action}\n"
-                            f"Next actions: {self.pre_explore_inputs[-1]}",
-                        }
+                        input_message = assistant_message(
+                            f"{config.game_constants['command_prefix_with_space']}{pre_exp_action}\n"
+                            f"Next actions: {self.pre_explore_inputs[-1]}"
+                        )
                     else:
-                        input_message = {
-                            config.keys["message_role"]: config.keys["message_role_assistant"],
-                            config.keys[
-                                "message_content"
-                            ]: f"{config.game_constants['command_prefix_with_space']}{pre_exp_action}",
-                        }
+                        input_message = assistant_message(
+                            f"{config.game_constants['command_prefix_with_space']}{pre_exp_action}"
+                        )
                     self.player._messages.append(input_message)
                     # execute pre-explore action:
                     goals_achieved, if_response, action_info = self.if_interpreter.process_action(
@@ -286,11 +269,8 @@ class AdventureGameMaster(DialogueGameMaster):
             if not utterance.startswith(config.game_constants["command_prefix"]):
                 self.success = False
                 # hallucinated finish heuristic:
-                hallucinated_finish_strs = config.hallucination_keywords
-                for hallucinated_finish_str in hallucinated_finish_strs:
-                    if hallucinated_finish_str in utterance:
-                        self.log_to_self(config.event_types["hallucinated_finish"], utterance)
-                        break
+                if config.hallucination_pattern.search(utterance):
+                    self.log_to_self(config.event_types["hallucinated_finish"], utterance)
                 self.invalid_format = config.parse_errors["command_tag_missing"]
                 raise ParseError(config.parse_errors["command_tag_missing"], utterance)
             if self.if_variant == config.variants["plan"]:
@@ -607,8 +587,8 @@ class AdventureGameScorer(GameScorer):
                 - loop_abort: Whether episode was aborted due to loop detection
                 - invalid_format: Invalid format error string if any
         """
-        fail_types: List[str] = config.fail_types
-        plan_types: List[str] = config.plan_metrics
+        fail_types: Tuple[str, ...] = config.fail_types
+        plan_types: Tuple[str, ...] = config.plan_metrics
 
         turn_scores: List[Dict[str, Any]] = []
         turn_fails: List[Dict[str, int]] = []
@@ -624,8 +604,8 @@ class AdventureGameScorer(GameScorer):
 
         for turn_idx, turn in enumerate(episode_interactions["turns"]):
             turn_score: Dict[str, Any] = {"request_count": 1, "goal_score": 0}
-            turn_fail: Dict[str, int] = {fail_type: 0 for fail_type in fail_types}
-            plan_record: Dict[str, Any] = {plan_type: 0 for plan_type in plan_types}
+            turn_fail: Dict[str, int] = dict.fromkeys(fail_types, 0)
+            plan_record: Dict[str, Any] = dict.fromkeys(plan_types, 0)
             hallucination: int = 0
             turn_exploration: Dict[str, Any] = dict()
 
@@ -647,7 +627,7 @@ class AdventureGameScorer(GameScorer):
                     if not successfully_finished:
                         hallucination = 1
                 if action["type"] == config.event_types["action_fail"]:
-                    if action["content"][config.keys["fail_type"]] not in fail_types:
+                    if action["content"][config.keys["fail_type"]] not in config.fail_types_set:
                         logger.info(
                             f"Unlisted fail type: {action['content'][config.keys['fail_type']]}"
                         )
@@ -754,8 +734,8 @@ class AdventureGameScorer(GameScorer):
             invalid_format: Invalid format error string if any.
             loop_abort: Whether episode was aborted due to loop detection.
         """
-        fail_types: List[str] = config.fail_types
-        plan_types: List[str] = config.plan_metrics
+        fail_types: Tuple[str, ...] = config.fail_types
+        plan_types: Tuple[str, ...] = config.plan_metrics
 
         for turn_idx in range(len(episode_interactions["turns"])):
             turn_score: Dict[str, Any] = turn_scores[turn_idx]
@@ -856,7 +836,7 @@ class AdventureGameScorer(GameScorer):
             turn_limit_loss: Whether the turn limit was reached.
             loop_abort: Whether episode was aborted due to loop detection.
         """
-        fail_types: List[str] = config.fail_types
+        fail_types: Tuple[str, ...] = config.fail_types
 
         # Request scores
         violated_request_count: int = sum([turn["violated_request_count"] for turn in turn_scores])
@@ -15,9 +15,10 @@ sys.path.insert(0, "..")
 import json
 import logging
 import os
+import re
 from datetime import datetime
 from itertools import permutations
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Pattern, Tuple, Union
 
 import lark
 import numpy as np
@@ -26,7 +27,13 @@ from lark import Lark, Transformer
 from nltk import elementtree_indent
 from pydantic_core.core_schema import filter_dict_schema
 
-from adventuregame.adv_util import fact_str_to_tuple, fact_tuple_to_str
+from adventuregame import constants
+from adventuregame.adv_util import (
+    fact_str_to_tuple,
+    fact_strs_to_tuples,
+    fact_tuple_to_str,
+    load_definition_file,
+)
 from adventuregame.config.compat import get_config
 from adventuregame.resources.new_word_generation.new_word_definitions import (
     create_new_words_definitions_set,
@@ -41,9 +48,21 @@ config = get_config()
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# $NAME$ placeholders in clingo encoding templates
+_TEMPLATE_PLACEHOLDER_PATTERN: Pattern[str] = re.compile(r"\$([A-Z]+)\$")
+
+
+def fill_clingo_template(template: str, values: Dict[str, str]) -> str:
+    """Replace $NAME$ placeholders in a clingo encoding template in a single pass over it.
+    Placeholders without a value are kept as they are.
+    """
+    return _TEMPLATE_PLACEHOLDER_PATTERN.sub(
+        lambda placeholder: values.get(placeholder.group(1), placeholder.group()), template
+    )
+
 
 def convert_action_to_tuple(action: str) -> Tuple:
-    action_splice = action[9:-1]
+    action_splice = action[constants.ACTION_STRING_INNER]
     action_split = action_splice.split(",")
     action_split[0] = int(action_split[0])
     action_tuple = tuple(action_split)
@@ -63,11 +82,10 @@ class ClingoAdventureGenerator(object):
 
         self.adv_type: str = adventure_type
         # load adventure type definition:
-        with open(
-            config.paths["definition_files"]["adventure_types"], "r", encoding="utf-8"
-        ) as adventure_types_file:
-            adventure_type_definitions = json.load(adventure_types_file)
-            self.adv_type_def = adventure_type_definitions[self.adv_type]
+        adventure_type_definitions = load_definition_file(
+            config.paths["definition_files"]["adventure_types"]
+        )
+        self.adv_type_def = adventure_type_definitions[self.adv_type]
 
         # TODO: overhaul adventure type definitions and usage
         #   - mutable fact types from domain
@@ -104,8 +122,7 @@ class ClingoAdventureGenerator(object):
             clingo_template_file = self.adv_type_def["clingo_templates"]
 
         # load clingo ASP templates:
-        with open(clingo_template_file, "r", encoding="utf-8") as templates_file:
-            self.clingo_templates = json.load(templates_file)
+        self.clingo_templates = load_definition_file(clingo_template_file)
 
     def _initialize_pddl_definition_parsing(self):
         with open(
@@ -417,9 +434,12 @@ class ClingoAdventureGenerator(object):
                 permitted_exits_list.append(exit_target_permit)
             permitted_exits = ";".join(permitted_exits_list)
             exit_rule = "1 { $PERMITTEDEXITS$ } $MAXCONNECTIONS$."
-            exit_rule = exit_rule.replace("$PERMITTEDEXITS$", permitted_exits)
-            exit_rule = exit_rule.replace(
-                "$MAXCONNECTIONS$", str(room_type_values["max_connections"])
+            exit_rule = fill_clingo_template(
+                exit_rule,
+                {
+                    "PERMITTEDEXITS": permitted_exits,
+                    "MAXCONNECTIONS": str(room_type_values["max_connections"]),
+                },
             )
             clingo_str += "\n" + exit_rule
         # exit pairing rule:
@@ -584,7 +604,7 @@ class ClingoAdventureGenerator(object):
         id_to_type_dict: dict = dict()
 
         # convert fact strings to tuples:
-        initial_facts = [fact_str_to_tuple(fact) for fact in initial_world_state]
+        initial_facts = fact_strs_to_tuples(initial_world_state)
         # iterate over initial world state, add fixed basic facts, add turn facts for changeable facts
         for fact in initial_facts:
             if fact[0] == "type":
@@ -994,7 +1014,7 @@ class ClingoAdventureGenerator(object):
         self.id_to_type_dict: dict = dict()
 
         # convert fact strings to tuples:
-        self.initial_facts = [fact_str_to_tuple(fact) for fact in initial_world_state]
+        self.initial_facts = fact_strs_to_tuples(initial_world_state)
         # iterate over initial world state, add fixed basic facts, add turn facts for changeable facts
         for fact in self.initial_facts:
             # set up id_to_type:
@@ -1091,13 +1111,15 @@ class ClingoAdventureGenerator(object):
             goal_tuple = fact_str_to_tuple(goal)
             if len(goal_tuple) == 2:
                 goal_template: str = self.clingo_templates["goal_1"]
-                goal_clingo = goal_template.replace("$PREDICATE$", goal_tuple[0])
-                goal_clingo = goal_clingo.replace("$THING$", goal_tuple[1])
+                goal_clingo = fill_clingo_template(
+                    goal_template, {"PREDICATE": goal_tuple[0], "THING": goal_tuple[1]}
+                )
             if len(goal_tuple) == 3:
                 goal_template: str = self.clingo_templates["goal_2"]
-                goal_clingo = goal_template.replace("$PREDICATE$", goal_tuple[0])
-                goal_clingo = goal_clingo.replace("$THING$", goal_tuple[1])
-                goal_clingo = goal_clingo.replace("$TARGET$", goal_tuple[2])
+                goal_clingo = fill_clingo_template(
+                    goal_template,
+                    {"PREDICATE": goal_tuple[0], "THING": goal_tuple[1], "TARGET": goal_tuple[2]},
+                )
             clingo_str += "\n" + goal_clingo
 
         # add optimization:
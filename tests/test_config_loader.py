@@ -1,6 +1,23 @@
 """Tests for config system (compatibility layer)."""
 
-from adventuregame.config.compat import CompatConfigLoader, get_config
+import json
+from pathlib import Path
+
+import pytest
+
+from adventuregame.config import (
+    MESSAGES,
+    RUNTIME,
+    experiments,
+    get_message_templates,
+    get_runtime_config,
+    messages_data,
+    runtime_data,
+)
+from adventuregame.config.compat import CONFIG, CompatConfigLoader, cfg, get_config
+from adventuregame.config.experiments import ExperimentConfig
+from adventuregame.config.messages import MessageTemplates
+from adventuregame.config.runtime import RuntimeConfig
 
 
 class TestCompatConfigLoader:
@@ -35,11 +52,48 @@ class TestCompatConfigLoader:
         result = config.get("paths", "nonexistent", default="default")
         assert result == "default"
 
+    def test_repeated_get_returns_same_value(self):
+        """Test that a repeated lookup returns the value resolved the first time."""
+        config = CompatConfigLoader()
+        first = config.get("paths", "grammar_files")
+        assert config.get("paths", "grammar_files") is first
+
+    def test_missing_key_respects_each_default(self):
+        """Test that misses are not cached, so each call gets its own default."""
+        config = CompatConfigLoader()
+        assert config.get("paths", "nonexistent", default=1) == 1
+        assert config.get("paths", "nonexistent", default=2) == 2
+
+    def test_get_through_read_only_mapping(self):
+        """Test that get() traverses read-only mappings as well as dicts."""
+        config = CompatConfigLoader()
+        result = config.get("generation_settings", "definition_methods", "create")
+        assert result == "create"
+
+    def test_messages_attribute_view_matches_dict(self):
+        """Test that the attribute view of messages mirrors the messages dict."""
+        config = CompatConfigLoader()
+        assert config.messages_ns._asdict() == config.messages
+
+    def test_deferred_attributes_built_on_access(self):
+        """Test that config-backed dicts are built when first read."""
+        config = CompatConfigLoader()
+        expected = config.experiments.thresholds.loop_detection
+        assert config.get("thresholds", "loop_detection") == expected
+
     def test_paths_property(self):
         """Test paths property returns dict."""
         config = CompatConfigLoader()
         assert isinstance(config.paths, dict)
 
+    def test_path_returns_path_objects(self):
+        """Test that path() returns the runtime config's Path for a directory key."""
+        config = CompatConfigLoader()
+        resources_dir = config.path("resources_dir")
+        assert isinstance(resources_dir, Path)
+        assert str(resources_dir) == config.paths["resources_dir"]
+        assert config.path("resources_dir") is resources_dir
+
     def test_game_constants_property(self):
         """Test game_constants property returns dict."""
         config = CompatConfigLoader()
@@ -50,6 +104,12 @@ class TestCompatConfigLoader:
         config = CompatConfigLoader()
         assert isinstance(config.variants, dict)
 
+    def test_compat_dicts_built_once(self):
+        """Test that compat dicts are precomputed rather than rebuilt per access."""
+        config = CompatConfigLoader()
+        assert config.messages is config.messages
+        assert config.paths is config.paths
+
 
 class TestGlobalConfigAccess:
     """Test cases for global config access functions."""
@@ -66,3 +126,84 @@ class TestGlobalConfigAccess:
         assert isinstance(config.paths, dict)
         assert isinstance(config.game_constants, dict)
         assert isinstance(config.messages, dict)
+
+    def test_cfg_shorthand_matches_get(self):
+        """Test that cfg() reads through the global config instance."""
+        assert cfg("paths", "resources_dir") == get_config().get("paths", "resources_dir")
+        assert cfg("paths", "nonexistent", default=[]) == []
+
+    def test_module_constants_are_the_singletons(self):
+        """Test that the module-level constants alias the accessor singletons."""
+        assert CONFIG is get_config()
+        assert MESSAGES is get_message_templates()
+        assert RUNTIME is get_runtime_config()
+
+
+class TestExperimentConfig:
+    """Test cases for ExperimentConfig loading."""
+
+    def test_load_same_path_returns_cached_instance(self):
+        """Test that loading the same file twice reuses the parsed config."""
+        default_path = Path(experiments.__file__).parent / "experiments.json"
+        assert ExperimentConfig.load() is ExperimentConfig.load(default_path)
+
+    def test_load_on_subclass_returns_subclass(self):
+        """Test that a subclass loads instances of itself, cached apart from the base class."""
+
+        class CustomExperimentConfig(ExperimentConfig):
+            pass
+
+        custom_config = CustomExperimentConfig.load()
+        assert type(custom_config) is CustomExperimentConfig
+        assert type(ExperimentConfig.load()) is ExperimentConfig
+        assert custom_config.thresholds == ExperimentConfig.load().thresholds
+
+
+class TestMessageTemplates:
+    """Test cases for MessageTemplates lookups."""
+
+    def test_get_error_message(self):
+        """Test that error messages resolve by name and unknown names give None."""
+        templates = MessageTemplates.load()
+        assert templates.get_error_message("unknown_command") == templates.errors.unknown_command
+        assert templates.get_error_message("not_an_error") is None
+
+    def test_load_rejects_unknown_keys(self, tmp_path):
+        """Test that a structurally invalid messages file raises ValueError."""
+        data = json.loads((Path(messages_data.__file__).parent / "messages.json").read_text())
+        data["errors"]["not_an_error"] = "?"
+        config_path = tmp_path / "messages.json"
+        config_path.write_text(json.dumps(data))
+        with pytest.raises(ValueError, match="not_an_error"):
+            MessageTemplates.load(config_path)
+
+
+class TestGeneratedDataModules:
+    """Test that the precompiled config modules match their JSON sources."""
+
+    def test_messages_data_matches_json(self):
+        """Test that messages_data.py is regenerated after editing messages.json."""
+        assert messages_data.TEMPLATES == MessageTemplates.load()
+
+    def test_runtime_data_matches_json(self):
+        """Test that runtime_data.py is regenerated after editing runtime.json."""
+        assert runtime_data.RUNTIME == RuntimeConfig.load()
+
+    def test_json_loads_return_cached_instances(self):
+        """Test that reloading the same JSON file reuses the parsed config."""
+        assert MessageTemplates.load() is MessageTemplates.load()
+        assert RuntimeConfig.load() is RuntimeConfig.load()
+
+    def test_json_load_on_subclass_returns_subclass(self):
+        """Test that subclasses load instances of themselves rather than the base class."""
+
+        class CustomMessageTemplates(MessageTemplates):
+            pass
+
+        class CustomRuntimeConfig(RuntimeConfig):
+            pass
+
+        assert type(CustomMessageTemplates.load()) is CustomMessageTemplates
+        assert type(CustomRuntimeConfig.load()) is CustomRuntimeConfig
+        assert type(MessageTemplates.load()) is MessageTemplates
+        assert type(RuntimeConfig.load()) is RuntimeConfig
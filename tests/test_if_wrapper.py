@@ -1,9 +1,30 @@
 """Tests for if_wrapper module."""
 
+import json
+from pathlib import Path
+
 import pytest
 
 from adventuregame.if_wrapper import AdventureIFInterpreter
 
+GAME_PATH = Path(__file__).parent.parent / "adventuregame"
+
+
+@pytest.fixture(scope="module")
+def home_interpreter():
+    """Provide an interpreter for the first human-curated home delivery instance."""
+    instances = json.loads((GAME_PATH / "in" / "instances_human.json").read_text())
+    game_instance = instances["experiments"][0]["game_instances"][0]
+    return AdventureIFInterpreter(str(GAME_PATH), game_instance)
+
+
+@pytest.fixture
+def kitchen_interpreter():
+    """Provide an interpreter for a hard home delivery instance with items in closed containers."""
+    instances = json.loads((GAME_PATH / "in" / "instances_human.json").read_text())
+    game_instance = instances["experiments"][3]["game_instances"][3]
+    return AdventureIFInterpreter(str(GAME_PATH), game_instance)
+
 
 class TestAdventureIFInterpreter:
     """Test cases for AdventureIFInterpreter class."""
@@ -85,3 +106,50 @@ class TestAdventureIFInterpreter:
         interpreter = AdventureIFInterpreter(minimal_instance, "")
         assert hasattr(interpreter, "run_events")
         assert callable(getattr(interpreter, "run_events"))
+
+
+class TestParseActionInput:
+    """Test cases for parsing player commands into action dicts."""
+
+    def test_verb_synonym_parses_as_its_action_type(self, home_interpreter):
+        """Test that a grammar verb synonym that is not an action type still parses."""
+        assert "grab" not in home_interpreter.action_types
+        parsed, action_dict, fail = home_interpreter.parse_action_input("grab apple")
+        assert parsed
+        assert action_dict == {"type": "take", "arg1": "apple"}
+        assert fail == {}
+
+    def test_undefined_verb_fails_before_parsing(self, home_interpreter):
+        """Test that a command starting with a non-verb word is an undefined action verb."""
+        parsed, _, fail = home_interpreter.parse_action_input("xyzzy apple")
+        assert not parsed
+        assert fail == {"phase": "parsing", "fail_type": "undefined_action_verb", "arg": "xyzzy"}
+
+    @pytest.mark.parametrize(
+        "command", ["take apple.", "take apple!", "take apple?", "take apple!!"]
+    )
+    def test_final_punctuation_is_stripped(self, home_interpreter, command):
+        """Test that any run of final '.', '!' and '?' is removed before parsing."""
+        parsed, action_dict, _ = home_interpreter.parse_action_input(command)
+        assert parsed
+        assert action_dict == {"type": "take", "arg1": "apple"}
+
+
+class TestVisibleRoomContents:
+    """Test cases for which room contents the player can see."""
+
+    def test_closed_container_contents_are_not_visible(self, kitchen_interpreter):
+        """Test that items in closed containers are hidden while the containers are visible."""
+        kitchen_interpreter.process_action("go kitchen")
+        visible_contents = kitchen_interpreter.get_player_room_contents_visible()
+        assert {"refrigerator1", "cupboard1"} <= set(visible_contents)
+        assert "apple1" not in visible_contents
+        assert "plate1" not in visible_contents
+
+    def test_open_container_contents_are_visible(self, kitchen_interpreter):
+        """Test that opening a container reveals its items but not those of closed containers."""
+        kitchen_interpreter.process_action("go kitchen")
+        kitchen_interpreter.process_action("open refrigerator")
+        visible_contents = kitchen_interpreter.get_player_room_contents_visible()
+        assert {"peach1", "orange1", "banana1", "apple1", "sandwich1"} <= set(visible_contents)
+        assert "plate1" not in visible_contents